@@ -2,9 +2,15 @@
 Authentication utilities for JWT token generation and password hashing.
 """
 
+import hashlib
+import hmac
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status, Request, Response
@@ -42,6 +48,60 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Short-lived cache of *successful* bcrypt checks so a retried request (e.g.
+# tapping "stop" twice) doesn't pay for the hash again. Keyed on the stored
+# hash too, so changing a password invalidates its entries implicitly.
+_VERIFY_CACHE_TTL_SECONDS = 30
+_VERIFY_CACHE_MAXSIZE = 4096
+_verify_cache: "OrderedDict[Tuple[int, bytes, str], float]" = OrderedDict()
+_verify_cache_lock = threading.Lock()
+# Cache keys hold a keyed digest of the password, never a plain fast hash;
+# the key only lives in this process, so a memory dump can't be brute-forced
+_VERIFY_CACHE_KEY = os.urandom(32)
+
+
+def verify_password_cached(user_id: int, plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password, reusing a recent successful result for the same user.
+
+    Only matches are cached; failed attempts always run bcrypt so the cache
+    cannot speed up guessing. Safe to call from worker threads.
+    """
+    digest = hmac.new(_VERIFY_CACHE_KEY, plain_password.encode(), hashlib.sha256).digest()
+    key = (user_id, digest, hashed_password)
+    now = time.monotonic()
+
+    with _verify_cache_lock:
+        verified_at = _verify_cache.get(key)
+        if verified_at is not None:
+            if now - verified_at < _VERIFY_CACHE_TTL_SECONDS:
+                return True
+            del _verify_cache[key]
+
+    if not verify_password(plain_password, hashed_password):
+        return False
+
+    with _verify_cache_lock:
+        _verify_cache[key] = now
+        _verify_cache.move_to_end(key)
+
+        # Entries are in verification order: drop expired ones from the front
+        # (and anything beyond the size bound)
+        while _verify_cache:
+            oldest = next(iter(_verify_cache.values()))
+            if now - oldest < _VERIFY_CACHE_TTL_SECONDS and len(_verify_cache) <= _VERIFY_CACHE_MAXSIZE:
+                break
+            _verify_cache.popitem(last=False)
+    return True
+
+
+def invalidate_password_cache(user_id: int) -> None:
+    """Drop cached password checks for a user (call when their passwords change)."""
+    with _verify_cache_lock:
+        for key in [key for key in _verify_cache if key[0] == user_id]:
+            del _verify_cache[key]
+
+
 def get_password_hash(password: str) -> str:
     """Hash a password."""
     return pwd_context.hash(password)
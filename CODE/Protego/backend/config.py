@@ -12,6 +12,8 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str
+    db_pool_size: int = 20  # Connections kept open per engine (sync and asyncpg)
+    db_max_overflow: int = 40  # Extra connections allowed under burst load
 
     # Twilio
     twilio_account_sid: str
@@ -22,6 +24,10 @@ class Settings(BaseSettings):
     # Alert Configuration
     alert_confidence_threshold: float = 0.8
     alert_countdown_seconds: int = 5
+    alert_send_concurrency: int = 8  # Max Twilio WhatsApp/SMS sends in flight per worker during alert fan-out
+    walk_notification_debounce_seconds: float = 1.0  # Coalesce walk start/stop WhatsApp updates within this window
+    whatsapp_send_rate: float = 5.0  # Geofence WhatsApp sends per second per worker (Twilio allows 25 MPS per sender)
+    whatsapp_send_burst: int = 6  # Sends allowed back-to-back before the rate applies
 
     # Security
     secret_key: str
@@ -54,6 +60,7 @@ class Settings(BaseSettings):
     azure_openai_realtime_endpoint: str = ""
     azure_openai_realtime_api_key: str = ""
     azure_openai_realtime_deployment: str = "gpt-4o-realtime-preview"
+    azure_pool_size: int = 2  # Pre-warmed Realtime WebSockets kept open for Vonage calls (0 disables)
 
     # ElevenLabs (Text-to-Speech for Deepgram+ElevenLabs mode)
     # Note: LLM uses MegaLLM (already configured above) - cheaper and already working
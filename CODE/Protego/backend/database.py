@@ -4,9 +4,10 @@ Provides SQLAlchemy engine, session maker, and base model class.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Generator, Optional
 
 from config import settings
 
@@ -15,8 +16,8 @@ engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,  # Verify connections before using
     echo=not settings.is_production,  # Log SQL in development
-    pool_size=10,  # Maximum number of connections to keep in pool
-    max_overflow=20,  # Maximum number of connections that can be created beyond pool_size
+    pool_size=settings.db_pool_size,  # Maximum number of connections to keep in pool
+    max_overflow=settings.db_max_overflow,  # Maximum number of connections that can be created beyond pool_size
     pool_timeout=30,  # Seconds to wait before giving up on getting a connection
     pool_recycle=3600,  # Recycle connections after 1 hour (prevents stale connections)
 )
@@ -24,10 +25,40 @@ engine = create_engine(
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory (asyncpg). The engine is bound lazily on first use so
+# that importing this module never requires an async driver.
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+_async_engine: Optional[AsyncEngine] = None
+
 # Base class for ORM models
 Base = declarative_base()
 
 
+def _async_database_url(url: str) -> str:
+    """Map the sync DATABASE_URL onto the asyncpg driver."""
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+def get_async_engine() -> AsyncEngine:
+    """Create (once) and return the async engine used by AsyncSessionLocal."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            _async_database_url(settings.database_url),
+            pool_pre_ping=True,
+            echo=not settings.is_production,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=30,
+            pool_recycle=3600,
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return _async_engine
+
+
 def get_db() -> Generator[Session, None, None]:
     """
     Dependency that provides a database session.
@@ -45,6 +76,30 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency that provides an async database session.
+    Automatically closes the session after use.
+
+    Usage:
+        @app.get("/walks")
+        async def get_walks(db: AsyncSession = Depends(get_async_session)):
+            result = await db.execute(select(WalkSession))
+            return result.scalars().all()
+    """
+    get_async_engine()
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled asyncpg connections. Called on application shutdown."""
+    global _async_engine
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -4,6 +4,7 @@ Main entry point for the AI-Powered Personal Safety Companion API.
 """
 
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 from slowapi import Limiter, _rate_limit_exceeded_handler
@@ -11,7 +12,7 @@ from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from config import settings
-from database import init_db
+from database import init_db, dispose_async_engine
 from routers import users, walk, alerts, admin, auth, ai, safe_locations, emergency_contacts, tracking, safety_call, government, incidents
 from logger import app_logger as logger, configure_stdlib_logging
 
@@ -56,6 +57,15 @@ async def lifespan(app: FastAPI):
         logger.critical(f"❌ Production configuration error: {e}")
         raise
 
+    # Resolve the safety call AI provider once (fails fast if misconfigured)
+    from services.ai import ProviderFactory
+    try:
+        provider_type = ProviderFactory.resolve_settings_provider_type()
+        logger.info(f"🎙️ Safety call provider: {provider_type.value}")
+    except ValueError as e:
+        logger.critical(f"❌ Safety call provider configuration error: {e}")
+        raise
+
     try:
         init_db()
         logger.success("✅ Database initialized")
@@ -71,12 +81,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to recover pending alerts: {e}")
 
+    # Pre-warm Azure Realtime connections for Vonage safety calls
+    from services.ai.azure_realtime_pool import azure_realtime_pool
+    azure_realtime_pool.start()
+
     logger.success("✨ Protego Backend started successfully")
 
     yield
 
     # Shutdown
     logger.info("👋 Shutting down Protego Backend...")
+    await azure_realtime_pool.close()
+    from services.twilio_service import twilio_service
+    await twilio_service.cleanup()
+    from services.pdf_report_service import pdf_report_service
+    await pdf_report_service.cleanup()
+    await dispose_async_engine()
     logger.success("✅ Protego Backend shut down gracefully")
 
 
@@ -87,6 +107,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -20,16 +20,57 @@ def migrate():
 
             # Add new columns if they don't exist
             print("Adding new columns...")
+            # Statements that may fail run in a savepoint, so a failure does not
+            # abort the surrounding transaction
             try:
-                conn.execute(text("ALTER TABLE users ADD COLUMN password_hash VARCHAR"))
+                with conn.begin_nested():
+                    conn.execute(text("ALTER TABLE users ADD COLUMN password_hash VARCHAR"))
             except Exception:
                 print("  - password_hash column already exists")
 
             try:
-                conn.execute(text("ALTER TABLE users ALTER COLUMN email SET NOT NULL"))
+                with conn.begin_nested():
+                    conn.execute(text("ALTER TABLE users ALTER COLUMN email SET NOT NULL"))
             except Exception:
                 print("  - email already NOT NULL")
 
+            # One active walk session per user (partial unique index).
+            # Close all but the newest active session per user first, or the
+            # index cannot be created.
+            print("Adding walk session indexes...")
+            with conn.begin_nested():
+                closed = conn.execute(text(
+                    "UPDATE walk_sessions SET active = false, end_time = COALESCE(end_time, CURRENT_TIMESTAMP) "
+                    "WHERE id IN ("
+                    "  SELECT id FROM ("
+                    "    SELECT id, ROW_NUMBER() OVER ("
+                    "      PARTITION BY user_id ORDER BY start_time DESC, id DESC"
+                    "    ) AS rn FROM walk_sessions WHERE active = true"
+                    "  ) ranked WHERE rn > 1"
+                    ")"
+                ))
+                if closed.rowcount:
+                    print(f"  - closed {closed.rowcount} duplicate active walk sessions")
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ux_walk_active_user "
+                    "ON walk_sessions(user_id) WHERE active = true"
+                ))
+
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_walk_user_started "
+                "ON walk_sessions(user_id, start_time)"
+            ))
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_walk_id_user "
+                "ON walk_sessions(id, user_id)"
+            ))
+
+            print("Adding government authority indexes...")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_gov_authority_active_coords "
+                "ON gov_authorities(id, latitude, longitude, radius_meters) WHERE is_active = true"
+            ))
+
             print("✅ Migration completed successfully!")
 
         except Exception as e:
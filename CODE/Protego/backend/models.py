@@ -3,7 +3,7 @@ SQLAlchemy ORM models for Protego.
 Defines User, WalkSession, and Alert database tables.
 """
 
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, ARRAY, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, JSON, Enum as SQLEnum, ARRAY, Text, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -100,6 +100,12 @@ class User(Base):
     walk_sessions = relationship("WalkSession", back_populates="user", cascade="all, delete-orphan")
     alerts = relationship("Alert", back_populates="user", cascade="all, delete-orphan")
     trusted_contact_list = relationship("TrustedContact", back_populates="user", cascade="all, delete-orphan")
+    # Read-only view filtered in SQL, for notification paths that only need active contacts
+    active_trusted_contacts = relationship(
+        "TrustedContact",
+        primaryjoin="and_(User.id == TrustedContact.user_id, TrustedContact.is_active == True)",
+        viewonly=True
+    )
     safe_locations = relationship("SafeLocation", back_populates="user", cascade="all, delete-orphan")
     safety_call_sessions = relationship("SafetyCallSession", back_populates="user", cascade="all, delete-orphan")
 
@@ -161,6 +167,18 @@ class WalkSession(Base):
         location_lng: Starting longitude
     """
     __tablename__ = "walk_sessions"
+    __table_args__ = (
+        # At most one active session per user, enforced by the database
+        Index(
+            "ux_walk_active_user", "user_id", unique=True,
+            postgresql_where=text("active = true"),
+            sqlite_where=text("active = 1"),
+        ),
+        # History listing: WHERE user_id = ? ORDER BY start_time DESC (scanned backwards)
+        Index("ix_walk_user_started", "user_id", "start_time"),
+        # Ownership checks: WHERE id = ? AND user_id = ?
+        Index("ix_walk_id_user", "id", "user_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
@@ -350,6 +368,14 @@ class GovAuthority(Base):
         updated_at: When the authority was last updated
     """
     __tablename__ = "gov_authorities"
+    __table_args__ = (
+        # Authority index rebuild: SELECT id, lat, lng, radius WHERE is_active (index-only scan)
+        Index(
+            "ix_gov_authority_active_coords", "id", "latitude", "longitude", "radius_meters",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True, unique=True)
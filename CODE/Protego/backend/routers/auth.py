@@ -10,7 +10,7 @@ from slowapi.util import get_remote_address
 from database import get_db
 from models import User
 from schemas import UserLogin, UserRegister, Token, UserResponse, DuressPasswordSet, DuressPasswordRemove
-from auth import authenticate_user, create_access_token, get_password_hash, set_auth_cookie, clear_auth_cookie, verify_password, get_current_user
+from auth import authenticate_user, create_access_token, get_password_hash, set_auth_cookie, clear_auth_cookie, verify_password, get_current_user, invalidate_password_cache
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -187,6 +187,7 @@ def set_duress_password(
     # Hash and store duress password
     current_user.duress_password_hash = get_password_hash(data.duress_password)
     db.commit()
+    invalidate_password_cache(current_user.id)
 
     return {
         "message": "Duress password set successfully",
@@ -236,6 +237,7 @@ def remove_duress_password(
     # Remove duress password
     current_user.duress_password_hash = None
     db.commit()
+    invalidate_password_cache(current_user.id)
 
     return {
         "message": "Duress password removed successfully",
@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 from database import get_db
 from models import User, Alert, GovAuthority, AlertStatus, UserType, IncidentReport, IncidentStatus
 from auth import get_current_user
-from services.alert_manager import calculate_distance
+from services.alert_manager import calculate_distance, calculate_distances, authority_index
 from services.pdf_report_service import pdf_report_service
 
 router = APIRouter()
@@ -436,6 +436,7 @@ def create_authority(
         db.add(new_authority)
         db.commit()
         db.refresh(new_authority)
+        authority_index.invalidate()
     except IntegrityError as e:
         db.rollback()
         # If authority creation fails, clean up the user we just created
@@ -522,6 +523,7 @@ def update_authority(
 
     db.commit()
     db.refresh(authority)
+    authority_index.invalidate()
 
     return {
         "message": "Authority updated successfully",
@@ -572,6 +574,7 @@ def delete_authority(
     # Delete authority (cascade will handle this if user is deleted)
     db.delete(authority)
     db.commit()
+    authority_index.invalidate()
 
     return {"message": "Authority deleted successfully"}
 
@@ -605,13 +608,15 @@ def get_nearby_jurisdictions(
         GovAuthority.is_active == True
     ).all()
 
-    # Filter authorities within radius
+    # Filter authorities within radius (one vectorized pass for all distances)
+    distances = calculate_distances(
+        latitude, longitude,
+        [authority.latitude for authority in authorities],
+        [authority.longitude for authority in authorities]
+    ).tolist()
+
     nearby_authorities = []
-    for authority in authorities:
-        distance = calculate_distance(
-            latitude, longitude,
-            authority.latitude, authority.longitude
-        )
+    for authority, distance in zip(authorities, distances):
         distance_km = distance / 1000  # Convert to km
 
         if distance_km <= radius_km:
@@ -634,12 +639,14 @@ def get_nearby_jurisdictions(
         SafeLocation.is_active == True
     ).all()
 
+    distances = calculate_distances(
+        latitude, longitude,
+        [location.latitude for location in safe_locations],
+        [location.longitude for location in safe_locations]
+    ).tolist()
+
     safe_locations_data = []
-    for location in safe_locations:
-        distance = calculate_distance(
-            latitude, longitude,
-            location.latitude, location.longitude
-        )
+    for location, distance in zip(safe_locations, distances):
         distance_km = distance / 1000
 
         safe_locations_data.append({
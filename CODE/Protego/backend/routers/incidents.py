@@ -107,10 +107,12 @@ async def create_incident_report(
         logger.info(f"Incident report {incident.id} created by user {current_user.id}")
 
         # Find authorities in jurisdiction
-        authorities = get_authorities_in_radius(db, data.location_lat, data.location_lng)
+        authorities = [
+            authority for authority, _ in get_authorities_in_radius(db, data.location_lat, data.location_lng)
+        ]
 
         if authorities:
-            # Assign to the first authority (you could implement more complex logic)
+            # Assign to the nearest authority (you could implement more complex logic)
             incident.assigned_authority_id = authorities[0].id
             incident.status = IncidentStatus.REVIEWING
             db.commit()
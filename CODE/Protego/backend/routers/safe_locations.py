@@ -114,6 +114,13 @@ def is_inside_geofence(
     return distance <= radius_meters
 
 
+def _invalidate_geofence_cache(user_id: int) -> None:
+    """Drop the geofencing service's cached safe locations for a user."""
+    # Imported here: the geofencing service imports this module
+    from services.geofencing_service import geofencing_service
+    geofencing_service.invalidate_safe_locations(user_id)
+
+
 # ==================== Endpoints ====================
 
 @router.post("/", response_model=SafeLocationResponse, status_code=status.HTTP_201_CREATED)
@@ -152,6 +159,7 @@ async def create_safe_location(
     db.add(new_location)
     db.commit()
     db.refresh(new_location)
+    _invalidate_geofence_cache(current_user.id)
 
     return new_location
 
@@ -224,6 +232,7 @@ async def update_safe_location(
 
     db.commit()
     db.refresh(location)
+    _invalidate_geofence_cache(current_user.id)
 
     return location
 
@@ -248,6 +257,7 @@ async def delete_safe_location(
 
     db.delete(location)
     db.commit()
+    _invalidate_geofence_cache(current_user.id)
 
 
 @router.post("/check-geofence", response_model=CheckGeofenceResponse)
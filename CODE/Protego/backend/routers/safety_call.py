@@ -17,6 +17,7 @@ from config import settings
 from services.safety_call import safety_call_manager
 from services.twilio_voice_call import twilio_voice_service
 from services.vonage_voice_call import vonage_voice_service
+from services.ai.azure_realtime_pool import azure_realtime_pool
 from repositories import SafetyCallRepository
 from schemas.safety_call import (
     StartCallRequest,
@@ -723,43 +724,10 @@ async def vonage_stream_handler(websocket: WebSocket):
 
             # Initialize Azure OpenAI Realtime API for this call
             try:
-                import aiohttp
-
                 logger.info(f"Initializing Azure OpenAI Realtime connection for call {call_uuid}")
 
-                # WebSocket URL for Azure OpenAI Realtime API with API key in query params
-                websocket_url = f"{settings.azure_openai_realtime_endpoint}?api-version=2024-10-01-preview&deployment={settings.azure_openai_realtime_deployment}&api-key={settings.azure_openai_realtime_api_key}"
-
-                # Connect using aiohttp which supports headers properly
-                aiohttp_session = aiohttp.ClientSession()
-                session.aiohttp_session = aiohttp_session  # Store for cleanup
-                session.azure_websocket = await aiohttp_session.ws_connect(
-                    websocket_url,
-                    headers={"api-key": settings.azure_openai_realtime_api_key}
-                )
-
-                # Configure session for audio processing
-                session_config = {
-                    "type": "session.update",
-                    "session": {
-                        "modalities": ["text", "audio"],
-                        "instructions": "You are a helpful AI safety assistant. Respond briefly and clearly.",
-                        "voice": "alloy",
-                        "input_audio_format": "pcm16",
-                        "output_audio_format": "pcm16",
-                        "input_audio_transcription": {
-                            "model": "whisper-1"
-                        },
-                        "turn_detection": {
-                            "type": "server_vad",
-                            "threshold": 0.5,
-                            "prefix_padding_ms": 300,
-                            "silence_duration_ms": 500
-                        }
-                    }
-                }
-
-                await session.azure_websocket.send_str(json.dumps(session_config))
+                # Take a pre-warmed connection (already configured via session.update)
+                session.azure_websocket = await azure_realtime_pool.acquire(timeout=0.5)
                 logger.info(f"Azure OpenAI connection established for call {call_uuid}")
 
                 # Start background task to listen for Azure responses
@@ -799,10 +767,7 @@ async def vonage_stream_handler(websocket: WebSocket):
     finally:
         if call_uuid and session:
             if hasattr(session, 'azure_websocket') and session.azure_websocket:
-                try:
-                    await session.azure_websocket.close()
-                except:
-                    pass
+                await azure_realtime_pool.release(session.azure_websocket)
             await vonage_voice_service.end_call(call_uuid)
 
 
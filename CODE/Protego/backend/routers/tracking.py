@@ -5,14 +5,16 @@ Public endpoint for real-time location tracking during duress alerts.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
+import asyncio
 from typing import Optional
 
 from database import get_db
 from models import Alert, WalkSession, User, WalkMode
 from auth import get_current_user, verify_password
 from services.geofencing_service import geofencing_service
+from services.cache import invalidate_active_session
 
 router = APIRouter()
 
@@ -243,6 +245,7 @@ async def stop_silent_mode(
     session.end_time = datetime.utcnow()
     db.commit()
     db.refresh(session)
+    await asyncio.to_thread(invalidate_active_session, session.user_id)
 
     import logging
     logger = logging.getLogger(__name__)
@@ -264,6 +267,7 @@ class LocationUpdateRequest(BaseModel):
     """Request to update user location and check geofencing."""
     latitude: float
     longitude: float
+    accuracy: Optional[float] = Field(None, ge=0, description="GPS accuracy radius in meters")
 
 
 class LocationUpdateResponse(BaseModel):
@@ -272,6 +276,7 @@ class LocationUpdateResponse(BaseModel):
     inside_safe_location: bool
     safe_location_name: Optional[str] = None
     notification_sent: bool = False
+    notification_queued: bool = False
     action_taken: Optional[str] = None
     message: Optional[str] = None
 
@@ -300,11 +305,12 @@ async def update_location(
     """
     try:
         # Check location and send notifications if needed
-        result = geofencing_service.check_location_and_notify(
+        result = await geofencing_service.check_location_and_notify(
             user=current_user,
             latitude=request.latitude,
             longitude=request.longitude,
-            db=db
+            db=db,
+            accuracy_m=request.accuracy
         )
 
         return LocationUpdateResponse(
@@ -312,6 +318,7 @@ async def update_location(
             inside_safe_location=result.get("inside_safe_location", False),
             safe_location_name=result.get("safe_location_name"),
             notification_sent=result.get("notification_sent", False),
+            notification_queued=result.get("notification_queued", False),
             action_taken=result.get("action_taken"),
             message=result.get("message", "Location updated successfully")
         )
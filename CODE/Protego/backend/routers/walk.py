@@ -3,26 +3,59 @@ Walk session management router.
 Handles starting and stopping walk mode sessions.
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy import select, update, func, bindparam
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
 from datetime import datetime
-import secrets
+import asyncio
+import logging
+import math
 
-from database import get_db
+from database import get_async_session
 from models import User, WalkSession, Alert, AlertType, AlertStatus, WalkMode
-from schemas import WalkSessionStart, WalkSessionStop, WalkSessionResponse
-from auth import get_current_user, verify_password
+from schemas import (
+    WalkSessionStart,
+    WalkSessionStop,
+    WalkSessionResponse,
+    PaginatedWalkSessionsResponse,
+    PaginationMeta,
+)
+from auth import get_current_user, verify_password_cached
+from services.alert_manager import alert_manager
 from services.geofencing_service import geofencing_service
+from services.token_pool import token_pool
+from services.cache import (
+    cache,
+    active_sessions_cache_key,
+    active_sessions_version_cache_key,
+    invalidate_active_session
+)
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Built once so the stop handler reuses the same statement (and its cached
+# compiled SQL) on every request
+_OWNED_SESSION_STMT = select(WalkSession).where(
+    WalkSession.id == bindparam("session_id"),
+    WalkSession.user_id == bindparam("user_id")
+)
+
+# Walk mode lookup by request value (plain dict get, no enum coercion)
+_WALK_MODES = {mode.value: mode for mode in WalkMode}
+
+# How long a "no active walk" answer is served from Redis
+NO_ACTIVE_SESSION_TTL_SECONDS = 30
+
 
 @router.post("/start", response_model=WalkSessionResponse, status_code=status.HTTP_201_CREATED)
-def start_walk_session(
+async def start_walk_session(
     session_data: WalkSessionStart,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Start a new walk mode session for the authenticated user.
@@ -45,20 +78,31 @@ def start_walk_session(
             detail="Cannot start walk session for another user"
         )
 
-    # Check if user already has an active session
-    active_session = db.query(WalkSession).filter(
-        WalkSession.user_id == current_user.id,
-        WalkSession.active == True
-    ).first()
+    # Check if user already has an active session. The ux_walk_active_user
+    # index also enforces this, but only where migrate_database.py has run.
+    result = await db.execute(
+        select(WalkSession.id).where(
+            WalkSession.user_id == current_user.id,
+            WalkSession.active == True
+        ).limit(1)
+    )
 
-    if active_session:
+    if result.first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="User already has an active walk session"
         )
 
     # Determine walk mode
-    walk_mode = WalkMode(session_data.mode) if session_data.mode else WalkMode.MANUAL
+    if session_data.mode:
+        walk_mode = _WALK_MODES.get(session_data.mode)
+        if walk_mode is None:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Invalid walk mode '{session_data.mode}'"
+            )
+    else:
+        walk_mode = WalkMode.MANUAL
 
     # Create new walk session
     new_session = WalkSession(
@@ -71,32 +115,45 @@ def start_walk_session(
         active=True
     )
 
-    db.add(new_session)
-    db.commit()
-    db.refresh(new_session)
+    # Two concurrent starts can both pass the check above; the partial
+    # unique index rejects the second insert
+    try:
+        db.add(new_session)
+        await db.commit()
+    except IntegrityError as e:
+        await db.rollback()
+        if "ux_walk_active_user" in str(e.orig):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="User already has an active walk session"
+            )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Failed to start walk session: invalid data"
+        )
+    await db.refresh(new_session)
+    await asyncio.to_thread(invalidate_active_session, current_user.id)
 
-    # Send WhatsApp notification to trusted contacts
+    # Queue WhatsApp notification to trusted contacts (debounced, sent off the request path)
     auto_started = (walk_mode == WalkMode.AUTO_GEOFENCE)
     try:
-        geofencing_service.notify_walk_started(
+        geofencing_service.queue_walk_started(
             user=current_user,
             walk_session=new_session,
-            auto_started=auto_started,
-            db=db
+            auto_started=auto_started
         )
     except Exception as e:
         # Log error but don't fail the request
-        import logging
-        logging.error(f"Failed to send walk started notification: {e}")
+        logger.error(f"Failed to send walk started notification: {e}")
 
     return new_session
 
 
 @router.post("/stop", response_model=WalkSessionResponse)
-def stop_walk_session(
+async def stop_walk_session(
     session_data: WalkSessionStop,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Stop an active walk mode session for the authenticated user.
@@ -117,24 +174,32 @@ def stop_walk_session(
     Raises:
         HTTPException: If session not found, already stopped, or authorization fails
     """
-    # Find the session
-    session = db.query(WalkSession).filter(
-        WalkSession.id == session_data.session_id
-    ).first()
+    # Find the session, filtering on ownership in SQL (ix_walk_id_user)
+    result = await db.execute(
+        _OWNED_SESSION_STMT,
+        {"session_id": session_data.session_id, "user_id": current_user.id}
+    )
+    session = result.scalar_one_or_none()
 
     if not session:
+        # Rare path: tell a missing session apart from someone else's
+        exists_for_other_user = await db.scalar(
+            select(
+                select(WalkSession.id)
+                .where(WalkSession.id == session_data.session_id)
+                .exists()
+            )
+        )
+        if exists_for_other_user:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Cannot stop another user's walk session"
+            )
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Walk session with ID {session_data.session_id} not found"
         )
 
-    # Verify user owns this session
-    if session.user_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Cannot stop another user's walk session"
-        )
-
     if not session.active and session.mode != WalkMode.SILENT:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -149,7 +214,9 @@ def stop_walk_session(
         # If session is already in SILENT mode (duress active)
         # Only allow stopping with normal password (not duress again)
         if session.mode == WalkMode.SILENT:
-            main_password_match = verify_password(session_data.password, current_user.password_hash)
+            main_password_match = await asyncio.to_thread(
+                verify_password_cached, current_user.id, session_data.password, current_user.password_hash
+            )
             if not main_password_match:
                 raise HTTPException(
                     status_code=status.HTTP_401_UNAUTHORIZED,
@@ -157,12 +224,23 @@ def stop_walk_session(
                 )
             is_silent_mode_stop = True
         else:
-            # Normal flow: verify password matches either main or duress
-            main_password_match = verify_password(session_data.password, current_user.password_hash)
-            duress_password_match = (
-                current_user.duress_password_hash and
-                verify_password(session_data.password, current_user.duress_password_hash)
-            )
+            # Normal flow: verify password matches either main or duress.
+            # Both bcrypt checks run concurrently: latency is one hash instead of
+            # two, and response time doesn't reveal which password matched.
+            checks = [
+                asyncio.to_thread(
+                    verify_password_cached, current_user.id, session_data.password, current_user.password_hash
+                )
+            ]
+            if current_user.duress_password_hash:
+                checks.append(
+                    asyncio.to_thread(
+                        verify_password_cached, current_user.id, session_data.password,
+                        current_user.duress_password_hash
+                    )
+                )
+            main_password_match, *duress_result = await asyncio.gather(*checks)
+            duress_password_match = bool(duress_result and duress_result[0])
 
             if not main_password_match and not duress_password_match:
                 raise HTTPException(
@@ -181,21 +259,12 @@ def stop_walk_session(
         session.end_latitude = session_data.location_lat
         session.end_longitude = session_data.location_lng
 
-        db.commit()
-        db.refresh(session)
+        await db.commit()
+        await asyncio.to_thread(invalidate_active_session, current_user.id)
 
         logger.info(f"Silent mode walk session {session.id} stopped by user {current_user.id}")
 
-        return WalkSessionResponse(
-            id=session.id,
-            user_id=session.user_id,
-            start_time=session.start_time,
-            end_time=session.end_time,
-            active=session.active,
-            mode=session.mode.value,
-            location_lat=session.location_lat,
-            location_lng=session.location_lng
-        )
+        return session
 
     elif is_duress:
         # DURESS PASSWORD USED - Enter silent mode
@@ -205,7 +274,7 @@ def stop_walk_session(
         session.active = True  # Keep monitoring active
 
         # Create silent DURESS alert with live tracking
-        live_tracking_token = secrets.token_urlsafe(32)
+        live_tracking_token = token_pool.get()
         duress_alert = Alert(
             user_id=current_user.id,
             session_id=session.id,
@@ -218,28 +287,8 @@ def stop_walk_session(
             location_lng=session.location_lng
         )
         db.add(duress_alert)
-        db.commit()  # Commit to get alert ID
-        db.refresh(duress_alert)
-
-        # Trigger immediate silent alert to trusted contacts (no countdown)
-        from services.alert_manager import alert_manager
-        import asyncio
-        import threading
-
-        # Run async function from sync context using threading
-        # Don't pass db - trigger_duress_alert creates its own session for thread safety
-        alert_id = duress_alert.id
-
-        def run_duress_alert():
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                loop.run_until_complete(alert_manager.trigger_duress_alert(alert_id))
-            finally:
-                loop.close()
-
-        thread = threading.Thread(target=run_duress_alert, daemon=True)
-        thread.start()
+        await db.flush()  # Assigns the alert ID; committed with the session below
+        duress_alert_id = duress_alert.id
 
     else:
         # NORMAL STOP - Actually stop the walk
@@ -249,30 +298,36 @@ def stop_walk_session(
         session.end_longitude = session_data.location_lng
         # Keep mode as is (manual or auto_geofence)
 
-        # Send WhatsApp notification to trusted contacts
+        # Queue WhatsApp notification to trusted contacts (debounced, sent off the request path)
         auto_stopped = (session.stopped_by_geofence if hasattr(session, 'stopped_by_geofence') else False)
         try:
-            geofencing_service.notify_walk_stopped(
+            geofencing_service.queue_walk_stopped(
                 user=current_user,
                 walk_session=session,
-                auto_stopped=auto_stopped,
-                db=db
+                auto_stopped=auto_stopped
             )
         except Exception as e:
             # Log error but don't fail the request
-            import logging
-            logging.error(f"Failed to send walk stopped notification: {e}")
+            logger.error(f"Failed to send walk stopped notification: {e}")
+
+    # Every changed column was set here and expire_on_commit is off,
+    # so the instance is already current - no refresh SELECT needed
+    await db.commit()
+    await asyncio.to_thread(invalidate_active_session, current_user.id)
 
-    db.commit()
-    db.refresh(session)
+    if is_duress:
+        # Trigger immediate silent alert to trusted contacts (no countdown)
+        # Runs as a task on this event loop; it opens its own DB session,
+        # so it must start only after the alert is committed
+        alert_manager.schedule_duress_alert(duress_alert_id)
 
     return session
 
 
 @router.post("/force-stop", response_model=WalkSessionResponse)
-def force_stop_active_session(
+async def force_stop_active_session(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Force stop any active walk session for the user.
@@ -284,44 +339,40 @@ def force_stop_active_session(
     Raises:
         HTTPException: If no active session found
     """
-    # Find any active session for this user
-    session = db.query(WalkSession).filter(
-        WalkSession.user_id == current_user.id,
-        WalkSession.active == True
-    ).first()
+    # Stop the user's active session and read it back in a single UPDATE ... RETURNING.
+    # Databases without ux_walk_active_user may hold several active rows -
+    # all are stopped and the newest is returned
+    result = await db.execute(
+        update(WalkSession)
+        .where(
+            WalkSession.user_id == current_user.id,
+            WalkSession.active == True
+        )
+        .values(active=False, end_time=func.now())
+        .returning(WalkSession)
+    )
+    stopped = result.scalars().all()
 
-    if not session:
+    if not stopped:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active walk session found"
         )
+    session = max(stopped, key=lambda row: (row.start_time, row.id))
 
-    # Force stop the session
-    session.active = False
-    session.end_time = datetime.utcnow()
-
-    db.commit()
-    db.refresh(session)
+    await db.commit()
+    await asyncio.to_thread(invalidate_active_session, current_user.id)
 
     logger.info(f"Force stopped walk session {session.id} for user {current_user.id}")
 
-    return WalkSessionResponse(
-        id=session.id,
-        user_id=session.user_id,
-        start_time=session.start_time,
-        end_time=session.end_time,
-        active=session.active,
-        mode=session.mode.value,
-        location_lat=session.location_lat,
-        location_lng=session.location_lng
-    )
+    return session
 
 
 @router.get("/{session_id}", response_model=WalkSessionResponse)
-def get_walk_session(
+async def get_walk_session(
     session_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Get walk session by ID for the authenticated user.
@@ -337,7 +388,8 @@ def get_walk_session(
     Raises:
         HTTPException: If session not found or authorization fails
     """
-    session = db.query(WalkSession).filter(WalkSession.id == session_id).first()
+    result = await db.execute(select(WalkSession).where(WalkSession.id == session_id))
+    session = result.scalar_one_or_none()
     if not session:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -354,24 +406,28 @@ def get_walk_session(
     return session
 
 
-@router.get("/user/{user_id}", response_model=List[WalkSessionResponse])
-def get_user_walk_sessions(
+@router.get("/user/{user_id}", response_model=PaginatedWalkSessionsResponse)
+async def get_user_walk_sessions(
     user_id: int,
     active_only: bool = False,
+    page: int = 1,
+    page_size: int = 50,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
-    Get all walk sessions for the authenticated user.
+    Get paginated walk sessions for the authenticated user.
 
     Args:
         user_id: User ID (must match authenticated user)
         active_only: If True, only return active sessions
+        page: Page number (starts at 1)
+        page_size: Number of items per page (max 100)
         current_user: Authenticated user
         db: Database session
 
     Returns:
-        List of walk sessions
+        Paginated list of walk sessions with metadata
 
     Raises:
         HTTPException: If authorization fails
@@ -383,22 +439,61 @@ def get_user_walk_sessions(
             detail="Cannot access another user's walk sessions"
         )
 
-    # Query sessions
-    query = db.query(WalkSession).filter(WalkSession.user_id == current_user.id)
+    # Validate pagination parameters
+    if page < 1:
+        page = 1
+    if page_size < 1:
+        page_size = 50
+    if page_size > 100:
+        page_size = 100
 
+    # Query sessions
+    conditions = [WalkSession.user_id == current_user.id]
     if active_only:
-        query = query.filter(WalkSession.active == True)
+        conditions.append(WalkSession.active == True)
 
-    sessions = query.order_by(WalkSession.start_time.desc()).all()
+    # Get total count
+    total_items = await db.scalar(
+        select(func.count()).select_from(WalkSession).where(*conditions)
+    )
+    total_pages = math.ceil(total_items / page_size) if total_items > 0 else 0
 
-    return sessions
+    # Calculate offset
+    offset = (page - 1) * page_size
+
+    result = await db.execute(
+        select(WalkSession)
+        .where(*conditions)
+        .order_by(WalkSession.start_time.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    sessions = result.scalars().all()
+
+    # Build pagination metadata
+    meta = PaginationMeta(
+        page=page,
+        page_size=page_size,
+        total_items=total_items,
+        total_pages=total_pages,
+        has_next=page < total_pages,
+        has_prev=page > 1
+    )
+
+    # Validate once and let pydantic-core write the JSON bytes directly,
+    # skipping FastAPI's re-validation and dict -> JSON second pass
+    page_response = PaginatedWalkSessionsResponse(items=sessions, meta=meta)
+    return Response(
+        content=page_response.model_dump_json(),
+        media_type="application/json"
+    )
 
 
 @router.get("/user/{user_id}/active", response_model=WalkSessionResponse)
-def get_active_walk_session(
+async def get_active_walk_session(
     user_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_session)
 ):
     """
     Get the active walk session for the authenticated user.
@@ -421,13 +516,29 @@ def get_active_walk_session(
             detail="Cannot access another user's walk session"
         )
 
-    # Find active session
-    active_session = db.query(WalkSession).filter(
-        WalkSession.user_id == current_user.id,
-        WalkSession.active == True
-    ).first()
+    # Most checks find no active session; that answer is cached briefly,
+    # tagged with the version start/stop bump so a stale write never matches
+    cache_key = active_sessions_cache_key(current_user.id)
+    cached, version = await asyncio.to_thread(
+        cache.get_many, [cache_key, active_sessions_version_cache_key(current_user.id)]
+    )
+    version = version or 0
+    if cached == version:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No active walk session for user {current_user.id}"
+        )
 
+    # Find active session
+    result = await db.execute(
+        select(WalkSession).where(
+            WalkSession.user_id == current_user.id,
+            WalkSession.active == True
+        ).limit(1)
+    )
+    active_session = result.scalar_one_or_none()
     if not active_session:
+        await asyncio.to_thread(cache.add, cache_key, version, NO_ACTIVE_SESSION_TTL_SECONDS)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No active walk session for user {current_user.id}"
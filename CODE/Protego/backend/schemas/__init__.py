@@ -30,6 +30,7 @@ from .base import (
     # Pagination schemas
     PaginationMeta,
     PaginatedAlertsResponse,
+    PaginatedWalkSessionsResponse,
 )
 
 # Safety call schemas
@@ -71,6 +72,7 @@ __all__ = [
     # Pagination schemas
     "PaginationMeta",
     "PaginatedAlertsResponse",
+    "PaginatedWalkSessionsResponse",
     # Safety call schemas
     "StartCallRequest",
     "StartCallResponse",
@@ -5,14 +5,19 @@ from typing import List, Optional
 from datetime import datetime
 from models import AlertStatus, AlertType, UserType
 
+# Shared field patterns. Pydantic compiles each once per model with its
+# Rust regex engine (linear time, no backtracking).
+PHONE_PATTERN = r"^\+?[1-9]\d{1,14}$"  # E.164 format
+EMAIL_PATTERN = r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$"
+
 
 # ==================== User Schemas ====================
 
 class UserCreate(BaseModel):
     """Schema for creating a new user (sign up)."""
     name: str = Field(..., min_length=1, max_length=100)
-    phone: str = Field(..., pattern=r"^\+?[1-9]\d{1,14}$")  # E.164 format
-    email: str = Field(..., pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    phone: str = Field(..., pattern=PHONE_PATTERN)
+    email: str = Field(..., pattern=EMAIL_PATTERN)
     password: str = Field(..., min_length=8, max_length=100)
     trusted_contacts: List[str] = Field(default_factory=list)
 
@@ -31,7 +36,7 @@ UserRegister = UserCreate
 
 class UserLogin(BaseModel):
     """Schema for user login."""
-    email: str = Field(..., pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    email: str = Field(..., pattern=EMAIL_PATTERN)
     password: str = Field(..., min_length=1)
 
 
@@ -95,13 +100,13 @@ class AuthResponse(BaseModel):
 
 class TrustedContactAdd(BaseModel):
     """Schema for adding a trusted contact (legacy - uses JSON field)."""
-    phone: str = Field(..., pattern=r"^\+?[1-9]\d{1,14}$")
+    phone: str = Field(..., pattern=PHONE_PATTERN)
     name: Optional[str] = None
 
 
 class TrustedContactRemove(BaseModel):
     """Schema for removing a trusted contact (legacy - uses JSON field)."""
-    phone: str = Field(..., pattern=r"^\+?[1-9]\d{1,14}$")
+    phone: str = Field(..., pattern=PHONE_PATTERN)
 
 
 # ==================== Trusted Contact Schemas ====================
@@ -109,8 +114,8 @@ class TrustedContactRemove(BaseModel):
 class TrustedContactCreate(BaseModel):
     """Schema for creating a new trusted contact."""
     name: str = Field(..., min_length=1, max_length=100)
-    phone: str = Field(..., pattern=r"^\+?[1-9]\d{1,14}$")  # E.164 format
-    email: Optional[str] = Field(None, pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    phone: str = Field(..., pattern=PHONE_PATTERN)
+    email: Optional[str] = Field(None, pattern=EMAIL_PATTERN)
     contact_relationship: Optional[str] = Field(None, max_length=50)
     priority: Optional[int] = Field(1, ge=1, le=10)
     notes: Optional[str] = Field(None, max_length=500)
@@ -119,8 +124,8 @@ class TrustedContactCreate(BaseModel):
 class TrustedContactUpdate(BaseModel):
     """Schema for updating a trusted contact."""
     name: Optional[str] = Field(None, min_length=1, max_length=100)
-    phone: Optional[str] = Field(None, pattern=r"^\+?[1-9]\d{1,14}$")
-    email: Optional[str] = Field(None, pattern=r"^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$")
+    phone: Optional[str] = Field(None, pattern=PHONE_PATTERN)
+    email: Optional[str] = Field(None, pattern=EMAIL_PATTERN)
     contact_relationship: Optional[str] = Field(None, max_length=50)
     priority: Optional[int] = Field(None, ge=1, le=10)
     is_active: Optional[bool] = None
@@ -248,3 +253,9 @@ class PaginatedAlertsResponse(BaseModel):
     """Schema for paginated alerts response."""
     items: List[AlertResponse]
     meta: PaginationMeta
+
+
+class PaginatedWalkSessionsResponse(BaseModel):
+    """Schema for paginated walk sessions response."""
+    items: List[WalkSessionResponse]
+    meta: PaginationMeta
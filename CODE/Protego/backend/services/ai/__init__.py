@@ -5,7 +5,10 @@ from .base import (
     AIProviderType,
     AudioConfig,
     ConversationConfig,
-    ProviderFactory
+    DEFAULT_AUDIO_CONFIG,
+    DEFAULT_CONVERSATION_CONFIG,
+    ProviderFactory,
+    dispatch_transcript
 )
 from .azure_realtime import AzureRealtimeProvider
 from .deepgram_elevenlabs import DeepgramElevenLabsProvider
@@ -15,7 +18,10 @@ __all__ = [
     "AIProviderType",
     "AudioConfig",
     "ConversationConfig",
+    "DEFAULT_AUDIO_CONFIG",
+    "DEFAULT_CONVERSATION_CONFIG",
     "ProviderFactory",
+    "dispatch_transcript",
     "AzureRealtimeProvider",
     "DeepgramElevenLabsProvider"
 ]
@@ -3,19 +3,54 @@ Azure OpenAI Realtime API provider implementation.
 Handles real-time audio conversation using Azure's WebSocket API.
 """
 
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Any, Mapping
 from .base import (
     IAIConversationProvider,
     AIProviderType,
     AudioConfig,
-    ConversationConfig
+    ConversationConfig,
+    TranscriptCallbacks,
+    dispatch_transcript
 )
 from config import settings
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=32)
+def _session_config(
+    audio_config: AudioConfig,
+    conversation_config: ConversationConfig
+) -> Dict[str, Any]:
+    """
+    Build the audio/conversation part of the session config.
+
+    Configs are frozen (hashable) and calls almost always use the shared
+    defaults, so this is built once and reused by every session.
+    Callers must not mutate the result.
+    """
+    return {
+        "audio_config": {
+            "input_audio_format": audio_config.format,
+            "output_audio_format": audio_config.format,
+            "sample_rate": audio_config.sample_rate
+        },
+        "conversation_config": {
+            "voice": conversation_config.voice,
+            "temperature": conversation_config.temperature,
+            "max_response_output_tokens": conversation_config.max_tokens,
+            "turn_detection": {
+                "type": "server_vad",
+                "threshold": conversation_config.detection_threshold,
+                "silence_duration_ms": conversation_config.silence_duration_ms,
+                "prefix_padding_ms": 300
+            }
+        }
+    }
+
+
 class AzureRealtimeProvider(IAIConversationProvider):
     """
     Azure OpenAI Realtime API provider.
@@ -27,7 +62,7 @@ class AzureRealtimeProvider(IAIConversationProvider):
     - Server-side VAD (voice activity detection)
     """
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Mapping[str, Any]):
         self.config = config
         self.endpoint = settings.azure_openai_realtime_endpoint
         self.api_key = settings.azure_openai_realtime_api_key
@@ -47,25 +82,10 @@ class AzureRealtimeProvider(IAIConversationProvider):
 
         return {
             "system_instructions": system_instructions,
-            "audio_config": {
-                "input_audio_format": audio_config.format,
-                "output_audio_format": audio_config.format,
-                "sample_rate": audio_config.sample_rate
-            },
-            "conversation_config": {
-                "voice": conversation_config.voice,
-                "temperature": conversation_config.temperature,
-                "max_response_output_tokens": conversation_config.max_tokens,
-                "turn_detection": {
-                    "type": "server_vad",
-                    "threshold": conversation_config.detection_threshold,
-                    "silence_duration_ms": conversation_config.silence_duration_ms,
-                    "prefix_padding_ms": 300
-                }
-            }
+            **_session_config(audio_config, conversation_config)
         }
 
-    async def get_connection_details(self) -> Dict[str, Any]:
+    def get_connection_details(self) -> Dict[str, Any]:
         """
         Get WebSocket connection details for frontend.
 
@@ -94,7 +114,7 @@ class AzureRealtimeProvider(IAIConversationProvider):
     async def handle_transcript(
         self,
         transcript: str,
-        callback: Optional[Callable[[str], None]] = None
+        callback: Optional[TranscriptCallbacks] = None
     ) -> None:
         """
         Handle transcript for backend processing.
@@ -102,10 +122,9 @@ class AzureRealtimeProvider(IAIConversationProvider):
         Azure sends transcripts via WebSocket, but we may want
         to process them server-side for distress detection.
         """
-        logger.debug(f"Received transcript: {transcript}")
+        logger.debug("Received transcript: %s", transcript)
 
-        if callback:
-            await callback(transcript)
+        await dispatch_transcript(transcript, callback)
 
     async def cleanup(self) -> None:
         """Clean up Azure resources (none needed for stateless API)."""
@@ -0,0 +1,267 @@
+"""
+Warm pool of Azure OpenAI Realtime WebSocket connections.
+
+Opening a Realtime WebSocket costs a TLS handshake, an HTTP upgrade and a
+session.update round-trip before any audio can flow. Keeping a few idle,
+already-configured connections around lets the Vonage stream handler start
+forwarding audio immediately.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import Optional
+
+import aiohttp
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Session configuration sent once per connection before it enters the pool
+AZURE_SESSION_CONFIG = {
+    "type": "session.update",
+    "session": {
+        "modalities": ["text", "audio"],
+        "instructions": "You are a helpful AI safety assistant. Respond briefly and clearly.",
+        "voice": "alloy",
+        "input_audio_format": "pcm16",
+        "output_audio_format": "pcm16",
+        "input_audio_transcription": {
+            "model": "whisper-1"
+        },
+        "turn_detection": {
+            "type": "server_vad",
+            "threshold": 0.5,
+            "prefix_padding_ms": 300,
+            "silence_duration_ms": 500
+        }
+    }
+}
+
+
+# Azure closes idle Realtime sessions; pooled sockets older than this are
+# discarded instead of being handed to a call (kept well under the limit)
+POOL_MAX_IDLE_SECONDS = 240
+
+
+class _PooledConnection:
+    """An idle pooled WebSocket and the task reading its server events."""
+
+    __slots__ = ("websocket", "connected_at", "dead", "drain_task")
+
+    def __init__(self, websocket: aiohttp.ClientWebSocketResponse):
+        self.websocket = websocket
+        self.connected_at = time.monotonic()
+        self.dead = False
+        self.drain_task: Optional[asyncio.Task] = None
+
+    def usable(self) -> bool:
+        """Open, not reported dead by its drain task, and within the idle age."""
+        return (
+            not self.dead
+            and not self.websocket.closed
+            and time.monotonic() - self.connected_at < POOL_MAX_IDLE_SECONDS
+        )
+
+
+class AzureRealtimePool:
+    """
+    Keeps `size` pre-configured Azure Realtime WebSockets ready for use.
+
+    Connections are handed out once and closed on release: a used Realtime
+    session carries the previous caller's conversation, so it is never
+    returned to the pool. The background warmer replaces it instead.
+
+    Idle connections are read by a drain task so aiohttp answers pings and
+    notices close frames; a connection is only handed out if it is still
+    open and younger than POOL_MAX_IDLE_SECONDS.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(size, 1))
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        self._warm_task: Optional[asyncio.Task] = None
+        self._refill = asyncio.Event()
+
+    @property
+    def enabled(self) -> bool:
+        """Pool is only useful when Azure is configured and size > 0."""
+        return self.size > 0 and bool(settings.azure_openai_realtime_api_key)
+
+    def _websocket_url(self) -> str:
+        return (
+            f"{settings.azure_openai_realtime_endpoint}"
+            f"?api-version=2024-10-01-preview"
+            f"&deployment={settings.azure_openai_realtime_deployment}"
+            f"&api-key={settings.azure_openai_realtime_api_key}"
+        )
+
+    async def connect(self) -> aiohttp.ClientWebSocketResponse:
+        """Open and configure a fresh Azure Realtime WebSocket."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession()
+
+        websocket = await self._http_session.ws_connect(
+            self._websocket_url(),
+            headers={"api-key": settings.azure_openai_realtime_api_key}
+        )
+        await websocket.send_str(json.dumps(AZURE_SESSION_CONFIG))
+        return websocket
+
+    async def _drain(self, conn: _PooledConnection) -> None:
+        """
+        Consume an idle connection's events until it is acquired.
+        The expected session.created/session.updated events are discarded;
+        a close, an error event or reaching the idle age marks it dead.
+        """
+        try:
+            await asyncio.wait_for(self._read_until_dead(conn.websocket), POOL_MAX_IDLE_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        except Exception as e:
+            logger.warning(f"Pooled Azure Realtime connection failed: {e}")
+
+        conn.dead = True
+        try:
+            await conn.websocket.close()
+        except Exception:
+            pass
+        self._refill.set()
+
+    async def _read_until_dead(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        """Read events from an idle connection; returns once it is unusable."""
+        while True:
+            msg = await websocket.receive()
+            if msg.type in (
+                aiohttp.WSMsgType.CLOSE,
+                aiohttp.WSMsgType.CLOSING,
+                aiohttp.WSMsgType.CLOSED,
+                aiohttp.WSMsgType.ERROR
+            ):
+                return
+            if msg.type == aiohttp.WSMsgType.TEXT:
+                event = json.loads(msg.data)
+                if event.get("type") == "error":
+                    logger.warning(f"Pooled Azure Realtime connection error: {event.get('error')}")
+                    return
+
+    def _add_to_pool(self, websocket: aiohttp.ClientWebSocketResponse) -> None:
+        """Queue a freshly configured connection with its drain task."""
+        conn = _PooledConnection(websocket)
+        conn.drain_task = asyncio.create_task(self._drain(conn))
+        self._queue.put_nowait(conn)
+
+    def _purge_dead(self) -> None:
+        """Drop connections their drain task has already closed."""
+        live = []
+        while not self._queue.empty():
+            conn = self._queue.get_nowait()
+            if not conn.dead:
+                live.append(conn)
+        for conn in live:
+            self._queue.put_nowait(conn)
+
+    async def _take(self, conn: _PooledConnection) -> bool:
+        """
+        Stop draining a pooled connection and check it is still usable.
+        Unusable connections are closed.
+        """
+        if conn.drain_task is not None and not conn.drain_task.done():
+            conn.drain_task.cancel()
+            try:
+                await conn.drain_task
+            except asyncio.CancelledError:
+                pass
+
+        if conn.usable():
+            return True
+
+        try:
+            await conn.websocket.close()
+        except Exception:
+            pass
+        return False
+
+    async def _warm_pool(self) -> None:
+        """Keep the queue topped up with idle, configured connections."""
+        while True:
+            self._purge_dead()
+            while self._queue.qsize() < self.size:
+                try:
+                    websocket = await self.connect()
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Failed to warm Azure Realtime connection: {e}")
+                    await asyncio.sleep(5)
+                    continue
+                self._add_to_pool(websocket)
+                logger.debug(f"Azure Realtime pool warmed ({self._queue.qsize()}/{self.size})")
+
+            self._refill.clear()
+            await self._refill.wait()
+
+    def start(self) -> None:
+        """Start the background warmer (call from the running event loop)."""
+        if not self.enabled or self._warm_task is not None:
+            return
+        self._warm_task = asyncio.create_task(self._warm_pool())
+        logger.info(f"Azure Realtime connection pool started (size={self.size})")
+
+    async def acquire(self, timeout: float = 0.5) -> aiohttp.ClientWebSocketResponse:
+        """
+        Get a ready-to-use connection.
+
+        Falls back to opening a new connection if the pool is empty or every
+        pooled connection has gone stale.
+        """
+        if self._warm_task is not None:
+            try:
+                while True:
+                    conn = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                    self._refill.set()
+                    if await self._take(conn):
+                        return conn.websocket
+            except asyncio.TimeoutError:
+                logger.warning("Azure Realtime pool empty, opening connection on demand")
+
+        return await self.connect()
+
+    async def release(self, websocket: Optional[aiohttp.ClientWebSocketResponse]) -> None:
+        """Close a connection handed out by `acquire`."""
+        if websocket is None:
+            return
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+        self._refill.set()
+
+    async def close(self) -> None:
+        """Stop warming and close all idle connections."""
+        if self._warm_task is not None:
+            self._warm_task.cancel()
+            try:
+                await self._warm_task
+            except asyncio.CancelledError:
+                pass
+            self._warm_task = None
+
+        while not self._queue.empty():
+            conn = self._queue.get_nowait()
+            if not await self._take(conn):
+                continue
+            try:
+                await conn.websocket.close()
+            except Exception:
+                pass
+
+        if self._http_session is not None and not self._http_session.closed:
+            await self._http_session.close()
+
+
+# Global pool instance
+azure_realtime_pool = AzureRealtimePool(size=settings.azure_pool_size)
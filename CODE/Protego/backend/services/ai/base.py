@@ -4,9 +4,15 @@ Allows swapping between Azure Realtime, Deepgram+ElevenLabs, or custom providers
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, Mapping, Sequence, Union
+from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
+import asyncio
+import functools
+import inspect
+import time
+import types
 
 
 class AIProviderType(str, Enum):
@@ -16,7 +22,7 @@ class AIProviderType(str, Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     """Audio configuration for providers."""
     sample_rate: int = 24000
@@ -26,7 +32,7 @@ class AudioConfig:
     enable_noise_suppression: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ConversationConfig:
     """Configuration for conversation behavior."""
     voice: str = "alloy"
@@ -36,6 +42,71 @@ class ConversationConfig:
     silence_duration_ms: int = 500
 
 
+# Shared default configs (immutable, so safe to reuse across calls)
+DEFAULT_AUDIO_CONFIG = AudioConfig()
+DEFAULT_CONVERSATION_CONFIG = ConversationConfig()
+
+
+# A single transcript listener or several of them
+TranscriptCallbacks = Union[Callable[[str], Any], Sequence[Callable[[str], Any]]]
+
+
+async def dispatch_transcript(
+    transcript: str,
+    *callbacks: Optional[TranscriptCallbacks]
+) -> None:
+    """
+    Deliver a transcript to every listener.
+
+    Each argument may be None, a callable or a sequence of callables.
+    Listeners are called in order; those returning awaitables then run
+    concurrently, so a slow listener doesn't hold up the others.
+    """
+    pending = []
+    for entry in callbacks:
+        if entry is None:
+            continue
+        listeners = entry if isinstance(entry, Sequence) else (entry,)
+        for listener in listeners:
+            result = listener(transcript)
+            if inspect.isawaitable(result):
+                pending.append(result)
+
+    if len(pending) == 1:
+        await pending[0]
+    elif pending:
+        await asyncio.gather(*pending)
+
+
+class TranscriptDeduplicator:
+    """
+    Recognises transcripts repeated within a short window.
+
+    Streaming STT re-emits identical interim results many times a second;
+    forwarding each one re-runs distress classification for nothing. Only
+    exact repeats inside `window_seconds` are dropped, so a user genuinely
+    repeating themselves later is still classified.
+    """
+
+    def __init__(self, window_seconds: float = 1.0, max_entries: int = 256):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._seen: "OrderedDict[str, float]" = OrderedDict()
+
+    def is_repeat(self, transcript: str) -> bool:
+        """Return True if `transcript` was seen within the window; record it."""
+        now = time.monotonic()
+        seen_at = self._seen.get(transcript)
+        if seen_at is not None and now - seen_at < self.window_seconds:
+            return True
+
+        self._seen[transcript] = now
+        self._seen.move_to_end(transcript)
+        if len(self._seen) > self.max_entries:
+            self._seen.popitem(last=False)
+        return False
+
+
 class IAIConversationProvider(ABC):
     """
     Abstract interface for AI conversation providers.
@@ -44,6 +115,9 @@ class IAIConversationProvider(ABC):
     This allows easy switching between providers without changing business logic.
     """
 
+    # No instance state here, so providers may declare __slots__
+    __slots__ = ()
+
     @abstractmethod
     async def initialize(
         self,
@@ -60,9 +134,10 @@ class IAIConversationProvider(ABC):
         pass
 
     @abstractmethod
-    async def get_connection_details(self) -> Dict[str, Any]:
+    def get_connection_details(self) -> Dict[str, Any]:
         """
         Get connection details for frontend (WebSocket URL, config, etc.).
+        Synchronous: implementations only build/return a dict, no I/O.
 
         Returns:
             {
@@ -78,14 +153,16 @@ class IAIConversationProvider(ABC):
     async def handle_transcript(
         self,
         transcript: str,
-        callback: Optional[Callable[[str], None]] = None
+        callback: Optional[TranscriptCallbacks] = None
     ) -> None:
         """
         Process user transcript (for distress detection, logging, etc.).
 
         Args:
             transcript: What user said
-            callback: Optional callback for distress detection
+            callback: Optional listener (or sequence of listeners) for
+                distress detection, logging, etc.; each may be a plain
+                function or return an awaitable
         """
         pass
 
@@ -99,6 +176,64 @@ class IAIConversationProvider(ABC):
         """Return the provider type."""
         pass
 
+    async def __aenter__(self) -> "IAIConversationProvider":
+        """Use the provider as `async with` so cleanup() always runs."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.cleanup()
+
+
+# Shared read-only config for providers created without one
+_EMPTY_CONFIG: Mapping[str, Any] = types.MappingProxyType({})
+
+
+@functools.lru_cache(maxsize=None)
+def _get_azure_cls():
+    """Import the Azure provider class on first use only."""
+    from .azure_realtime import AzureRealtimeProvider
+    return AzureRealtimeProvider
+
+
+@functools.lru_cache(maxsize=None)
+def _get_deepgram_factory():
+    """Import the Deepgram + ElevenLabs factory on first use only."""
+    from .deepgram_elevenlabs import create_deepgram_elevenlabs_provider
+    return create_deepgram_elevenlabs_provider
+
+
+def _make_azure(config: Mapping[str, Any]) -> IAIConversationProvider:
+    return _get_azure_cls()(config)
+
+
+def _make_deepgram(config: Mapping[str, Any]) -> IAIConversationProvider:
+    return _get_deepgram_factory()()
+
+
+def _make_custom(config: Mapping[str, Any]) -> IAIConversationProvider:
+    if "provider_class" in config:
+        return config["provider_class"](config)
+    raise ValueError("Custom provider requires 'provider_class' in config")
+
+
+# Provider type -> builder, used by ProviderFactory.create
+_PROVIDER_BUILDERS: Dict[AIProviderType, Callable[[Mapping[str, Any]], IAIConversationProvider]] = {
+    AIProviderType.AZURE_REALTIME: _make_azure,
+    AIProviderType.DEEPGRAM_ELEVENLABS: _make_deepgram,
+    AIProviderType.CUSTOM: _make_custom,
+}
+
+
+# SAFETY_CALL_PROVIDER values and the provider type they select
+_SETTINGS_PROVIDER_TYPES: Dict[str, AIProviderType] = {
+    "azure": AIProviderType.AZURE_REALTIME,
+    "deepgram_elevenlabs": AIProviderType.DEEPGRAM_ELEVENLABS,
+}
+
+# Provider type resolved from settings and its builder, memoized on first use
+_settings_provider_type: Optional[AIProviderType] = None
+_settings_builder: Optional[Callable[[Mapping[str, Any]], IAIConversationProvider]] = None
+
 
 class ProviderFactory:
     """
@@ -117,22 +252,49 @@ class ProviderFactory:
         """
         Create provider based on SAFETY_CALL_PROVIDER environment variable.
 
+        The provider type is resolved from settings once and memoized.
+        Each call still gets a new provider instance, since providers hold
+        per-call state (conversation history, callbacks, connections).
+
         Returns:
             IAIConversationProvider instance
         """
+        if _settings_builder is None:
+            ProviderFactory.resolve_settings_provider_type()
+        # Bound straight to the configured provider's builder - no dispatch
+        return _settings_builder(_EMPTY_CONFIG)
+
+    @staticmethod
+    def resolve_settings_provider_type() -> AIProviderType:
+        """
+        Resolve and memoize the provider type from SAFETY_CALL_PROVIDER.
+
+        Called once at startup so a misconfigured provider fails at boot
+        rather than on the first safety call.
+
+        Raises:
+            ValueError: If SAFETY_CALL_PROVIDER is not a known provider
+        """
+        global _settings_provider_type, _settings_builder
         from config import settings
 
         provider_name = settings.safety_call_provider.lower()
-
-        if provider_name == "azure":
-            return ProviderFactory.create(AIProviderType.AZURE_REALTIME)
-        elif provider_name == "deepgram_elevenlabs":
-            return ProviderFactory.create(AIProviderType.DEEPGRAM_ELEVENLABS)
-        else:
+        provider_type = _SETTINGS_PROVIDER_TYPES.get(provider_name)
+        if provider_type is None:
             raise ValueError(
                 f"Unknown provider in SAFETY_CALL_PROVIDER: {provider_name}. "
                 f"Must be 'azure' or 'deepgram_elevenlabs'"
             )
+        _settings_provider_type = provider_type
+        _settings_builder = _PROVIDER_BUILDERS[provider_type]
+        return provider_type
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Forget the memoized provider type (e.g. after settings change)."""
+        global _settings_provider_type, _settings_builder
+        _settings_provider_type = None
+        _settings_builder = None
 
     @staticmethod
     def create(
@@ -149,18 +311,7 @@ class ProviderFactory:
         Returns:
             IAIConversationProvider instance
         """
-        if provider_type == AIProviderType.AZURE_REALTIME:
-            from .azure_realtime import AzureRealtimeProvider
-            return AzureRealtimeProvider(config or {})
-
-        elif provider_type == AIProviderType.DEEPGRAM_ELEVENLABS:
-            from .deepgram_elevenlabs import create_deepgram_elevenlabs_provider
-            return create_deepgram_elevenlabs_provider()
-
-        elif provider_type == AIProviderType.CUSTOM:
-            if config and "provider_class" in config:
-                return config["provider_class"](config)
-            raise ValueError("Custom provider requires 'provider_class' in config")
-
-        else:
+        builder = _PROVIDER_BUILDERS.get(provider_type)
+        if builder is None:
             raise ValueError(f"Unknown provider type: {provider_type}")
+        return builder(config if config is not None else _EMPTY_CONFIG)
@@ -19,18 +19,27 @@ import json
 import logging
 from typing import Any, Callable, Dict, Optional
 from dataclasses import dataclass
+import functools
 import os
 
 from deepgram import DeepgramClient
 from elevenlabs.client import ElevenLabs
 import httpx
 
-from .base import IAIConversationProvider, AudioConfig, ConversationConfig, AIProviderType
+from .base import (
+    IAIConversationProvider,
+    AudioConfig,
+    ConversationConfig,
+    AIProviderType,
+    TranscriptCallbacks,
+    TranscriptDeduplicator,
+    dispatch_transcript
+)
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True)
 class DeepgramElevenLabsConfig:
     """Configuration for Deepgram + ElevenLabs provider"""
     deepgram_api_key: str
@@ -60,6 +69,22 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
     Real-time conversation provider using Deepgram (STT), ElevenLabs (TTS), and MegaLLM (LLM)
     """
 
+    __slots__ = (
+        "config",
+        "deepgram_client",
+        "elevenlabs_client",
+        "llm_client",
+        "_connection_details",
+        "dg_connection",
+        "is_active",
+        "conversation_history",
+        "system_instructions",
+        "_transcript_dedup",
+        "on_transcript_callback",
+        "on_audio_callback",
+        "on_error_callback",
+    )
+
     def __init__(self, config: DeepgramElevenLabsConfig):
         self.config = config
 
@@ -77,11 +102,24 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
             timeout=30.0
         )
 
+        # Connection details are static for this provider - build them once
+        self._connection_details = {
+            "type": "server_managed",
+            "provider": "deepgram_elevenlabs",
+            "message": "Audio handled by backend. Use Twilio voice calling endpoints.",
+            "capabilities": {
+                "stt": "deepgram",
+                "llm": "megallm",
+                "tts": "elevenlabs"
+            }
+        }
+
         # State
         self.dg_connection = None
         self.is_active = False
         self.conversation_history = []
         self.system_instructions = ""
+        self._transcript_dedup = TranscriptDeduplicator()
 
         # Callbacks
         self.on_transcript_callback: Optional[Callable] = None
@@ -122,15 +160,17 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
         Start Deepgram WebSocket connection for STT
         """
         try:
-            # Create Deepgram live connection
-            self.dg_connection = self.deepgram_client.listen.v1.connect(
-                model=self.config.deepgram_model,
-                language=self.config.deepgram_language,
-                encoding="linear16",
-                sample_rate=str(self.config.sample_rate),
-                smart_format="true",
-                interim_results="true"
-            ).__enter__()  # Enter context manager
+            # Create Deepgram live connection (sync SDK handshake - keep it off the loop)
+            self.dg_connection = await asyncio.to_thread(
+                lambda: self.deepgram_client.listen.v1.connect(
+                    model=self.config.deepgram_model,
+                    language=self.config.deepgram_language,
+                    encoding="linear16",
+                    sample_rate=str(self.config.sample_rate),
+                    smart_format="true",
+                    interim_results="true"
+                ).__enter__()  # Enter context manager
+            )
 
             logger.info("Deepgram WebSocket connection established")
             self.is_active = True
@@ -191,7 +231,7 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
             # Add to conversation history
             self.conversation_history.append({"role": "user", "content": text})
 
-            logger.info(f"Processing user text: {text[:50]}...")
+            logger.info("Processing user text: %.50s...", text)
 
             # Call transcript callback if registered
             if self.on_transcript_callback:
@@ -203,7 +243,7 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
             # Add AI response to history
             self.conversation_history.append({"role": "assistant", "content": response_text})
 
-            logger.info(f"AI response: {response_text[:50]}...")
+            logger.info("AI response: %.50s...", response_text)
 
             # Convert to speech
             await self._text_to_speech(response_text)
@@ -252,10 +292,11 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
         Convert text to speech using ElevenLabs and stream audio
         """
         try:
-            logger.info(f"Converting to speech: {text[:50]}...")
+            logger.info("Converting to speech: %.50s...", text)
 
-            # Generate audio with ElevenLabs
-            audio_generator = self.elevenlabs_client.text_to_speech.convert(
+            # Generate audio with ElevenLabs (sync client - request runs in a thread)
+            audio_generator = await asyncio.to_thread(
+                self.elevenlabs_client.text_to_speech.convert,
                 voice_id=self.config.elevenlabs_voice_id,
                 text=text,
                 model_id=self.config.elevenlabs_model_id,
@@ -268,14 +309,19 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
                 }
             )
 
-            # Stream audio chunks
+            # Stream audio chunks; each read blocks on the network, so pull
+            # them in a thread and forward as they arrive
             chunk_count = 0
-            for audio_chunk in audio_generator:
+            audio_iterator = iter(audio_generator)
+            while True:
+                audio_chunk = await asyncio.to_thread(next, audio_iterator, None)
+                if audio_chunk is None:
+                    break
                 if self.on_audio_callback:
                     await self.on_audio_callback(audio_chunk)
                 chunk_count += 1
 
-            logger.info(f"Streamed {chunk_count} audio chunks")
+            logger.info("Streamed %d audio chunks", chunk_count)
 
         except Exception as e:
             logger.error(f"ElevenLabs TTS error: {e}")
@@ -287,43 +333,35 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
         Inject a message into the conversation (for system prompts, etc.)
         """
         self.conversation_history.append({"role": role, "content": content})
-        logger.info(f"Injected message: {role} - {content[:50]}...")
+        logger.info("Injected message: %s - %.50s...", role, content)
 
     # Abstract method implementations from IAIConversationProvider
 
-    async def get_connection_details(self) -> Dict[str, Any]:
+    def get_connection_details(self) -> Dict[str, Any]:
         """
         Get connection details for frontend.
         For this provider, audio is handled server-side via Twilio.
+
+        Returns the payload built in __init__; callers must not mutate it.
         """
-        return {
-            "type": "server_managed",
-            "provider": "deepgram_elevenlabs",
-            "message": "Audio handled by backend. Use Twilio voice calling endpoints.",
-            "capabilities": {
-                "stt": "deepgram",
-                "llm": "megallm",
-                "tts": "elevenlabs"
-            }
-        }
+        return self._connection_details
 
     async def handle_transcript(
         self,
         transcript: str,
-        callback: Optional[Callable[[str], None]] = None
+        callback: Optional[TranscriptCallbacks] = None
     ) -> None:
         """
         Process user transcript for distress detection.
         """
-        logger.info(f"Handling transcript: {transcript}")
+        logger.info("Handling transcript: %s", transcript)
 
-        # Call the callback for distress detection if provided
-        if callback:
-            await callback(transcript)
+        # Interim results repeat verbatim; classify each text once
+        if self._transcript_dedup.is_repeat(transcript):
+            return
 
-        # Also call our internal callback if registered
-        if self.on_transcript_callback:
-            await self.on_transcript_callback(transcript)
+        # Distress-detection callback(s) and our internal callback run concurrently
+        await dispatch_transcript(transcript, callback, self.on_transcript_callback)
 
     def get_provider_type(self) -> AIProviderType:
         """Return the provider type."""
@@ -342,7 +380,7 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
         # Close Deepgram connection
         if self.dg_connection:
             try:
-                self.dg_connection.__exit__(None, None, None)  # Exit context manager
+                await asyncio.to_thread(self.dg_connection.__exit__, None, None, None)  # Exit context manager
                 logger.info("Deepgram connection closed")
             except Exception as e:
                 logger.error(f"Error closing Deepgram connection: {e}")
@@ -365,11 +403,14 @@ class DeepgramElevenLabsProvider(IAIConversationProvider):
         self.on_error_callback = callback
 
 
-def create_deepgram_elevenlabs_provider() -> DeepgramElevenLabsProvider:
+@functools.lru_cache(maxsize=1)
+def _config_from_env() -> DeepgramElevenLabsConfig:
     """
-    Factory function to create Deepgram + ElevenLabs provider from environment
+    Read provider configuration from the environment (once per process).
+
+    The config is shared by every provider instance, so it is frozen.
     """
-    config = DeepgramElevenLabsConfig(
+    return DeepgramElevenLabsConfig(
         deepgram_api_key=os.getenv("DEEPGRAM_API_KEY", ""),
         elevenlabs_api_key=os.getenv("ELEVENLABS_API_KEY", ""),
         megallm_api_key=os.getenv("MEGALLM_API_KEY", ""),
@@ -384,4 +425,9 @@ def create_deepgram_elevenlabs_provider() -> DeepgramElevenLabsProvider:
         elevenlabs_model_id=os.getenv("ELEVENLABS_MODEL", "eleven_turbo_v2_5"),
     )
 
-    return DeepgramElevenLabsProvider(config)
+
+def create_deepgram_elevenlabs_provider() -> DeepgramElevenLabsProvider:
+    """
+    Factory function to create Deepgram + ElevenLabs provider from environment
+    """
+    return DeepgramElevenLabsProvider(_config_from_env())
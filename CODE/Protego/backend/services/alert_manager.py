@@ -4,19 +4,86 @@ Manages countdown timers, cancellation, and notification triggers.
 """
 
 import asyncio
-from datetime import datetime
-from typing import Optional, Dict
+import heapq
+import math
+import time
+from datetime import datetime, timezone
+from typing import Optional, Dict, List, Set, Tuple, NamedTuple
 import logging
 
-from sqlalchemy.orm import Session
-from models import Alert, User, AlertStatus, TrustedContact, WalkSession, GovAuthority
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload
+from models import Alert, User, AlertStatus, GovAuthority
 from services.twilio_service import twilio_service
 from services.vonage_emergency_call import vonage_emergency_service
 from config import settings
-import math
 
 logger = logging.getLogger(__name__)
 
+# Retries for an alert whose notification fan-out raised
+TRIGGER_RETRY_SECONDS = 30
+TRIGGER_MAX_ATTEMPTS = 3
+
+# Mean Earth radius in meters
+EARTH_RADIUS_M = 6371000
+_HALF_DEG_TO_RAD = math.pi / 360
+
+# Notification templates (filled with str.format)
+DURESS_CONTACT_TEMPLATE = """🚨 EMERGENCY - DURESS ALERT 🚨
+
+{user_name} has triggered a silent emergency alert.
+They may be in a coerced situation.
+
+⚠️ DO NOT call them - they may be compromised.
+
+Live Tracking: {tracking_url}
+
+Last Known Location: {location_text}
+
+This link shows their real-time location.
+Consider contacting local authorities immediately.
+
+- Protego Safety"""
+
+DURESS_AUTHORITY_TEMPLATE = """🚨 EMERGENCY - DURESS ALERT IN YOUR JURISDICTION 🚨
+
+{user_name} has triggered a silent emergency alert within your area.
+
+User Phone: {user_phone}
+User Email: {user_email}
+
+⚠️ DURESS SITUATION - They may be coerced or compromised.
+DO NOT call the user directly.
+
+Live Tracking: {tracking_url}
+
+Location: {location_text}
+
+Distance from {authority_name}: {distance:.0f}m
+
+This is an automated alert from Protego Safety System.
+Immediate response may be required.
+
+- Protego Safety"""
+
+ALERT_AUTHORITY_TEMPLATE = """🚨 EMERGENCY ALERT IN YOUR JURISDICTION 🚨
+
+{user_name} has triggered an emergency alert.
+Alert Type: {alert_type}
+Analysis: {analysis_line}
+User Phone: {user_phone}
+User Email: {user_email}
+
+Location: {location_url}
+
+Distance from {authority_name}: {distance:.0f}m
+
+This is an automated alert from Protego Safety System.
+Immediate response may be required.
+
+- Protego Safety"""
+
 
 def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -29,23 +96,127 @@ def calculate_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     Returns:
         Distance in meters
     """
-    # Earth radius in meters
-    R = 6371000
-
-    # Convert to radians
-    phi1 = math.radians(lat1)
-    phi2 = math.radians(lat2)
-    delta_phi = math.radians(lat2 - lat1)
-    delta_lambda = math.radians(lon2 - lon1)
+    # Half-angle sines straight from degree deltas (no separate radians() calls)
+    sin_half_dphi = math.sin((lat2 - lat1) * _HALF_DEG_TO_RAD)
+    sin_half_dlambda = math.sin((lon2 - lon1) * _HALF_DEG_TO_RAD)
 
     # Haversine formula
-    a = math.sin(delta_phi/2)**2 + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda/2)**2
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    a = (
+        sin_half_dphi * sin_half_dphi
+        + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * sin_half_dlambda * sin_half_dlambda
+    )
+
+    # asin form of the central angle; clamp guards rounding just above 1
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a if a < 1.0 else 1.0))
+
+
+def calculate_distances(lat: float, lon: float, lats, lons) -> np.ndarray:
+    """
+    Calculate distances from one point to many points (vectorized Haversine).
+
+    Args:
+        lat, lon: Origin point coordinates
+        lats, lons: Sequences of target point coordinates
+
+    Returns:
+        Array of distances in meters, in the order of the targets
+    """
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    delta_lambda = np.radians(np.asarray(lons, dtype=np.float64)) - math.radians(lon)
+
+    a = np.sin((phi2 - phi1) / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class AuthorityArrays(NamedTuple):
+    """Parallel arrays for active authorities, sorted by latitude."""
+    ids: np.ndarray
+    lat_rad: np.ndarray
+    lon_rad: np.ndarray
+    cos_lat: np.ndarray
+    radius_m: np.ndarray
+    max_angle: float  # Largest jurisdiction radius as a central angle (radians)
+
+
+class AuthorityIndex:
+    """
+    In-memory coordinate arrays for active government authorities.
+
+    Holds ids, latitudes/longitudes (radians) and radii as parallel float64
+    arrays so the jurisdiction check is one vectorized Haversine pass instead
+    of a Python loop over ORM rows. Rows are sorted by latitude so a lookup
+    can binary-search the band that any jurisdiction could reach before
+    computing exact distances. Rebuilt lazily after `invalidate()` or once
+    `ttl_seconds` have passed, so changes made by other workers are picked
+    up too.
+    """
+
+    def __init__(self, ttl_seconds: float = 60.0):
+        """Initialize an empty index; it is loaded on first use."""
+        self.ttl_seconds = ttl_seconds
+        self._arrays: Optional[AuthorityArrays] = None
+        self._loaded_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the cached arrays (call after authority create/update/delete)."""
+        self._arrays = None
+
+    def _load(self, db: Session) -> AuthorityArrays:
+        """Read active authority coordinates and build the arrays."""
+        # Core select: plain tuples, no ORM Query/entity machinery for the scan
+        rows = db.execute(
+            select(
+                GovAuthority.id,
+                GovAuthority.latitude,
+                GovAuthority.longitude,
+                GovAuthority.radius_meters
+            ).where(GovAuthority.is_active == True)
+        ).all()
+
+        ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        coords = np.array([row[1:] for row in rows], dtype=np.float64).reshape(-1, 3)
+        order = np.argsort(coords[:, 0], kind="stable")
+        radii = coords[order, 2]
+        lat_rad = np.radians(coords[order, 0])
+        arrays = AuthorityArrays(
+            ids=ids[order],
+            lat_rad=lat_rad,
+            lon_rad=np.radians(coords[order, 1]),
+            cos_lat=np.cos(lat_rad),
+            radius_m=radii,
+            max_angle=float(radii.max()) / EARTH_RADIUS_M if len(radii) else 0.0
+        )
+
+        self._arrays = arrays
+        self._loaded_at = time.monotonic()
+        return arrays
+
+    def get_arrays(self, db: Session) -> AuthorityArrays:
+        """
+        Return the authority arrays, reloading them if stale.
+
+        Args:
+            db: Database session used when the index has to be rebuilt
+
+        Returns:
+            Tuple of parallel arrays for all active authorities
+        """
+        arrays = self._arrays
+        if arrays is None or time.monotonic() - self._loaded_at > self.ttl_seconds:
+            arrays = self._load(db)
+        return arrays
 
-    return R * c
 
+# Global authority index instance
+authority_index = AuthorityIndex()
 
-def get_authorities_in_radius(db: Session, alert_lat: float, alert_lng: float) -> list[GovAuthority]:
+
+def get_authorities_in_radius(
+    db: Session,
+    alert_lat: float,
+    alert_lng: float
+) -> list[tuple[GovAuthority, float]]:
     """
     Find all active government authorities whose jurisdiction includes the alert location.
 
@@ -55,38 +226,52 @@ def get_authorities_in_radius(db: Session, alert_lat: float, alert_lng: float) -
         alert_lng: Alert longitude
 
     Returns:
-        List of GovAuthority objects within their jurisdiction radius
+        List of (GovAuthority, distance in meters) pairs for authorities whose
+        jurisdiction radius covers the location, nearest first
     """
-    # Get all active authorities
+    arrays = authority_index.get_arrays(db)
+    phi1 = math.radians(alert_lat)
+    lam1 = math.radians(alert_lng)
+
+    # A jurisdiction of radius r only reaches latitudes within r/R of its
+    # center, so only the band around the alert latitude can match
+    start = int(np.searchsorted(arrays.lat_rad, phi1 - arrays.max_angle, side="left"))
+    stop = int(np.searchsorted(arrays.lat_rad, phi1 + arrays.max_angle, side="right"))
+    ids = arrays.ids[start:stop]
+    lats = arrays.lat_rad[start:stop]
+    lons = arrays.lon_rad[start:stop]
+    cos_lats = arrays.cos_lat[start:stop]
+    radii = arrays.radius_m[start:stop]
+
+    logger.info(
+        f"Checking {len(ids)}/{len(arrays.ids)} active authorities for alert at ({alert_lat}, {alert_lng})"
+    )
+
+    # Vectorized Haversine over the candidate band
+    # (authority radians and cos(lat) are precomputed in the index)
+    a = np.sin((lats - phi1) / 2) ** 2 + math.cos(phi1) * cos_lats * np.sin((lons - lam1) / 2) ** 2
+    distances = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+    in_range = distances <= radii
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for authority_id, distance, radius in zip(ids, distances, radii):
+            logger.debug(f"Authority {authority_id}: distance={distance:.0f}m, radius={radius:.0f}m")
+
+    distance_by_id = dict(zip(ids[in_range].tolist(), distances[in_range].tolist()))
+    if not distance_by_id:
+        logger.info("Total authorities in range: 0")
+        return []
+
+    # Re-check is_active in case the index is older than a deactivation
     authorities = db.query(GovAuthority).filter(
+        GovAuthority.id.in_(distance_by_id.keys()),
         GovAuthority.is_active == True
     ).all()
 
-    logger.info(f"Checking {len(authorities)} active authorities for alert at ({alert_lat}, {alert_lng})")
-
-    authorities_in_range = []
-    for authority in authorities:
-        distance = calculate_distance(
-            alert_lat, alert_lng,
-            authority.latitude, authority.longitude
-        )
-
-        logger.debug(
-            f"Authority {authority.name} at ({authority.latitude}, {authority.longitude}): "
-            f"distance={distance:.0f}m, radius={authority.radius_meters}m"
-        )
-
-        if distance <= authority.radius_meters:
-            authorities_in_range.append(authority)
-            logger.info(
-                f"✓ Authority {authority.name} is within range "
-                f"(distance: {distance:.0f}m, radius: {authority.radius_meters}m)"
-            )
-        else:
-            logger.info(
-                f"✗ Authority {authority.name} is OUT OF range "
-                f"(distance: {distance:.0f}m > radius: {authority.radius_meters}m)"
-            )
+    authorities_in_range = sorted(
+        ((authority, distance_by_id[authority.id]) for authority in authorities),
+        key=lambda pair: pair[1]
+    )
 
     logger.info(f"Total authorities in range: {len(authorities_in_range)}")
     return authorities_in_range
@@ -95,12 +280,28 @@ def get_authorities_in_radius(db: Session, alert_lat: float, alert_lng: float) -
 class AlertManager:
     """
     Manages alert countdown timers and notification triggers.
-    Maintains a registry of pending alerts and their countdown tasks.
+    Maintains a registry of pending alerts and their countdown deadlines.
+
+    All countdowns share one timer task driven by a min-heap of
+    (deadline, alert_id); only the nearest deadline is slept on. Cancelling
+    an alert just removes it from the registry and the timer skips its heap
+    entry when it comes due.
     """
 
     def __init__(self):
         """Initialize alert manager with empty pending alerts registry."""
-        self.pending_alerts: Dict[int, asyncio.Task] = {}
+        # alert_id -> event loop time (monotonic) at which the countdown expires;
+        # the wall-clock countdown_expires_at column is only read on recovery
+        self.pending_alerts: Dict[int, float] = {}
+        self._heap: List[Tuple[float, int]] = []
+        self._wakeup = asyncio.Event()
+        self._timer_task: Optional[asyncio.Task] = None
+        # Bounds concurrent Twilio sends (rate limits)
+        self._send_semaphore = asyncio.Semaphore(settings.alert_send_concurrency)
+        # Strong references to fire-and-forget tasks so they are not garbage collected
+        self._background_tasks: Set[asyncio.Task] = set()
+        # alert_id -> failed trigger attempts, for retrying after a failed fan-out
+        self._trigger_attempts: Dict[int, int] = {}
 
     async def start_alert_countdown(
         self,
@@ -141,11 +342,8 @@ class AlertManager:
         finally:
             db.close()
 
-        # Create countdown task (will create its own db session)
-        task = asyncio.create_task(
-            self._countdown_and_trigger(alert_id)
-        )
-        self.pending_alerts[alert_id] = task
+        # Queue on the shared countdown timer (trigger creates its own db session)
+        self._schedule_countdown(alert_id, settings.alert_countdown_seconds)
 
         logger.info(
             f"Started {settings.alert_countdown_seconds}s countdown for alert {alert_id}"
@@ -159,6 +357,9 @@ class AlertManager:
     ) -> bool:
         """
         Cancel a pending alert countdown.
+        The countdown may be running in another worker process: the database
+        row is updated either way, and that countdown skips the alert when
+        it fails to claim it.
 
         Args:
             alert_id: ID of the alert to cancel
@@ -167,32 +368,74 @@ class AlertManager:
         Returns:
             True if alert was cancelled, False if not found or already triggered
         """
-        # Cancel the countdown task if it exists
-        if alert_id in self.pending_alerts:
-            task = self.pending_alerts[alert_id]
-            task.cancel()
-            del self.pending_alerts[alert_id]
-
-            # Update alert status in database
-            alert = db.query(Alert).filter(Alert.id == alert_id).first()
-            if alert:
-                alert.status = AlertStatus.CANCELLED
-                alert.cancelled_at = datetime.utcnow()
-                db.commit()
-                db.refresh(alert)
+        # Drop the local countdown if it runs in this process (its heap entry is skipped)
+        self.pending_alerts.pop(alert_id, None)
+
+        # Conditional update - loses cleanly to a countdown that already claimed the alert
+        cancelled = db.query(Alert).filter(
+            Alert.id == alert_id,
+            Alert.status == AlertStatus.PENDING,
+            Alert.countdown_expires_at.isnot(None)
+        ).update(
+            {Alert.status: AlertStatus.CANCELLED, Alert.cancelled_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        db.commit()
 
-                logger.info(f"Alert {alert_id} cancelled by user")
-                return True
+        if cancelled:
+            logger.info(f"Alert {alert_id} cancelled by user")
+            return True
 
-        logger.warning(f"Alert {alert_id} not found in pending alerts")
+        logger.warning(f"Alert {alert_id} has no pending countdown")
         return False
 
-    async def _countdown_and_trigger(
+    def _schedule_countdown(self, alert_id: int, delay_seconds: float) -> None:
+        """
+        Queue an alert on the shared countdown timer.
+
+        Args:
+            alert_id: ID of the alert
+            delay_seconds: Seconds until the alert is triggered
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(delay_seconds, 0.0)
+        self.pending_alerts[alert_id] = deadline
+        heapq.heappush(self._heap, (deadline, alert_id))
+
+        if self._timer_task is None or self._timer_task.done():
+            self._timer_task = asyncio.create_task(self._run_countdown_timer())
+        elif self._heap[0][1] == alert_id:
+            # New earliest deadline - wake the timer so it re-arms
+            self._wakeup.set()
+
+    async def _run_countdown_timer(self) -> None:
+        """Single timer loop: sleep until the nearest deadline and fire due alerts."""
+        loop = asyncio.get_running_loop()
+        while True:
+            now = loop.time()
+            while self._heap and self._heap[0][0] <= now:
+                deadline, alert_id = heapq.heappop(self._heap)
+                # Skip entries for cancelled or rescheduled countdowns
+                if self.pending_alerts.get(alert_id) != deadline:
+                    continue
+                del self.pending_alerts[alert_id]
+                task = asyncio.create_task(self._countdown_expired(alert_id))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
+
+            self._wakeup.clear()
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _countdown_expired(
         self,
         alert_id: int
     ) -> None:
         """
-        Internal method to handle countdown and trigger notifications.
+        Trigger notifications for an alert whose countdown ran out.
         Creates its own database session to avoid stale session issues.
 
         Args:
@@ -200,26 +443,76 @@ class AlertManager:
         """
         from database import SessionLocal
 
+        # Create fresh database session for the background task
+        db = SessionLocal()
         try:
-            # Wait for countdown period
-            await asyncio.sleep(settings.alert_countdown_seconds)
-
-            # Create fresh database session for the background task
-            db = SessionLocal()
-            try:
-                # After countdown, trigger the alert
-                await self._trigger_alert(alert_id, db)
-            finally:
-                db.close()
-
-        except asyncio.CancelledError:
-            logger.info(f"Countdown for alert {alert_id} was cancelled")
+            await self._trigger_alert(alert_id, db)
+            self._trigger_attempts.pop(alert_id, None)
         except Exception as e:
             logger.error(f"Error in countdown for alert {alert_id}: {e}")
+            # The claim was released - try again shortly, a bounded number of
+            # times; recovery picks the alert up again after a restart
+            attempts = self._trigger_attempts.get(alert_id, 0) + 1
+            if attempts < TRIGGER_MAX_ATTEMPTS:
+                self._trigger_attempts[alert_id] = attempts
+                self._schedule_countdown(alert_id, TRIGGER_RETRY_SECONDS)
+            else:
+                self._trigger_attempts.pop(alert_id, None)
+                logger.critical(f"Giving up on alert {alert_id} after {attempts} attempts")
         finally:
-            # Remove from pending alerts
-            if alert_id in self.pending_alerts:
-                del self.pending_alerts[alert_id]
+            db.close()
+
+    async def _send_with_fallback(
+        self,
+        phone: str,
+        message: str,
+        recipient: str,
+        label: str
+    ) -> bool:
+        """
+        Send a message via WhatsApp, falling back to SMS.
+        Uses the async Twilio client so several recipients can be notified
+        concurrently, at most `alert_send_concurrency` at a time.
+
+        Args:
+            phone: Recipient phone number (E.164 format)
+            message: Message body
+            recipient: Recipient description used in logs
+            label: Alert kind used in logs (e.g. "Alert", "Duress alert")
+
+        Returns:
+            True if either channel delivered the message
+        """
+        async with self._send_semaphore:
+            result = await twilio_service.send_whatsapp_async(to=phone, message=message)
+            if result.get("success"):
+                logger.info(f"{label} sent via WhatsApp to {recipient}")
+                return True
+
+            # Fallback to SMS if WhatsApp fails
+            logger.warning(f"WhatsApp failed for {recipient}, trying SMS fallback")
+            sms_result = await twilio_service.send_sms_async(to=phone, message=message)
+            if sms_result.get("success"):
+                logger.info(f"{label} sent via SMS to {recipient}")
+                return True
+
+        logger.error(f"Failed to send {label.lower()} to {recipient}")
+        return False
+
+    def schedule_duress_alert(self, alert_id: int) -> asyncio.Task:
+        """
+        Trigger a duress alert in the background on the running event loop.
+
+        Args:
+            alert_id: ID of the duress alert
+
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(self.trigger_duress_alert(alert_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
 
     async def trigger_duress_alert(
         self,
@@ -247,23 +540,25 @@ class AlertManager:
             db = SessionLocal()
 
         try:
-            # Fetch alert from database
-            alert = db.query(Alert).filter(Alert.id == alert_id).first()
+            # Fetch alert, user and trusted contacts in one statement (LEFT OUTER JOINs),
+            # so users without contacts cost no extra query
+            alert = db.query(Alert).options(
+                joinedload(Alert.user).joinedload(User.trusted_contact_list)
+            ).filter(Alert.id == alert_id).first()
             if not alert or not alert.is_duress:
                 logger.error(f"Duress alert {alert_id} not found or not marked as duress")
                 return
 
-            # Fetch user
-            user = db.query(User).filter(User.id == alert.user_id).first()
+            user = alert.user
             if not user:
                 logger.error(f"User {alert.user_id} not found for duress alert {alert_id}")
                 return
 
             # Get all active trusted contacts (use new TrustedContact model)
-            trusted_contacts = db.query(TrustedContact).filter(
-                TrustedContact.user_id == user.id,
-                TrustedContact.is_active == True
-            ).order_by(TrustedContact.priority).all()
+            trusted_contacts = sorted(
+                (contact for contact in user.trusted_contact_list if contact.is_active),
+                key=lambda contact: contact.priority
+            )
 
             if not trusted_contacts and not user.trusted_contacts:
                 logger.warning(f"No trusted contacts found for user {user.id} - duress alert cannot be sent")
@@ -272,100 +567,42 @@ class AlertManager:
             # Generate live tracking URL
             tracking_url = f"{settings.frontend_url}/track/{alert.live_tracking_token}"
 
-            # Get current location from session
-            session = db.query(WalkSession).filter(WalkSession.id == alert.session_id).first()
-            location_text = "Location unknown"
+            # Maps link built once, shared by the messages and voice calls
+            location_url = None
             if alert.location_lat and alert.location_lng:
-                location_text = f"https://www.google.com/maps?q={alert.location_lat},{alert.location_lng}"
+                location_url = f"https://www.google.com/maps?q={alert.location_lat},{alert.location_lng}"
+            location_text = location_url or "Location unknown"
 
             logger.critical(
                 f"🚨 DURESS ALERT {alert_id} - User {user.name} may be in danger!"
             )
 
-            # Send SMS to all trusted contacts (both new and legacy)
-            contacts_notified = 0
+            # Same message for every contact - render it once
+            message = DURESS_CONTACT_TEMPLATE.format(
+                user_name=user.name,
+                tracking_url=tracking_url,
+                location_text=location_text
+            )
+
+            # Send SMS to all trusted contacts (both new and legacy), concurrently
+            sends = []
 
             # Use new TrustedContact model if available
             if trusted_contacts:
                 for contact in trusted_contacts:
-                    message = f"""🚨 EMERGENCY - DURESS ALERT 🚨
-
-{user.name} has triggered a silent emergency alert.
-They may be in a coerced situation.
-
-⚠️ DO NOT call them - they may be compromised.
-
-Live Tracking: {tracking_url}
-
-Last Known Location: {location_text}
-
-This link shows their real-time location.
-Consider contacting local authorities immediately.
-
-- Protego Safety"""
-
-                    # Try WhatsApp first (preferred for India)
-                    result = twilio_service.send_whatsapp(
-                        to=contact.phone,
-                        message=message
-                    )
-
-                    if result.get("success"):
-                        contacts_notified += 1
-                        logger.info(f"Duress alert sent via WhatsApp to {contact.name} ({contact.phone})")
-                    else:
-                        # Fallback to SMS if WhatsApp fails
-                        logger.warning(f"WhatsApp failed for {contact.name}, trying SMS fallback")
-                        sms_result = twilio_service.send_sms(
-                            to=contact.phone,
-                            message=message
-                        )
-                        if sms_result.get("success"):
-                            contacts_notified += 1
-                            logger.info(f"Duress alert sent via SMS to {contact.name} ({contact.phone})")
-                        else:
-                            logger.error(f"Failed to send duress alert to {contact.name} ({contact.phone})")
+                    sends.append(self._send_with_fallback(
+                        contact.phone, message, f"{contact.name} ({contact.phone})", "Duress alert"
+                    ))
 
             # Fallback to legacy trusted_contacts JSON field
             elif user.trusted_contacts:
                 for contact_phone in user.trusted_contacts:
-                    message = f"""🚨 EMERGENCY - DURESS ALERT 🚨
+                    sends.append(self._send_with_fallback(
+                        contact_phone, message, f"legacy contact ({contact_phone})", "Duress alert"
+                    ))
 
-{user.name} has triggered a silent emergency alert.
-They may be in a coerced situation.
-
-⚠️ DO NOT call them - they may be compromised.
-
-Live Tracking: {tracking_url}
-
-Last Known Location: {location_text}
-
-This link shows their real-time location.
-Consider contacting local authorities immediately.
-
-- Protego Safety"""
-
-                    # Try WhatsApp first (preferred for India)
-                    result = twilio_service.send_whatsapp(
-                        to=contact_phone,
-                        message=message
-                    )
-
-                    if result.get("success"):
-                        contacts_notified += 1
-                        logger.info(f"Duress alert sent via WhatsApp to legacy contact ({contact_phone})")
-                    else:
-                        # Fallback to SMS if WhatsApp fails
-                        logger.warning(f"WhatsApp failed for legacy contact ({contact_phone}), trying SMS fallback")
-                        sms_result = twilio_service.send_sms(
-                            to=contact_phone,
-                            message=message
-                        )
-                        if sms_result.get("success"):
-                            contacts_notified += 1
-                            logger.info(f"Duress alert sent via SMS to legacy contact ({contact_phone})")
-                        else:
-                            logger.error(f"Failed to send duress alert to legacy contact ({contact_phone})")
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            contacts_notified = sum(result is True for result in results)
 
             # Send emergency voice calls to contacts (NOTE: For duress, inform them NOT to call the user)
             all_contact_phones = []
@@ -374,8 +611,7 @@ Consider contacting local authorities immediately.
             elif user.trusted_contacts:
                 all_contact_phones = user.trusted_contacts
 
-            if all_contact_phones and alert.location_lat and alert.location_lng:
-                location_url = f"https://www.google.com/maps?q={alert.location_lat},{alert.location_lng}"
+            if all_contact_phones and location_url:
                 logger.info(f"Sending duress emergency voice calls to {len(all_contact_phones)} contacts")
 
                 try:
@@ -392,61 +628,40 @@ Consider contacting local authorities immediately.
 
             # Notify government authorities if alert has location
             authorities_notified = 0
-            if alert.location_lat and alert.location_lng:
+            if location_url:
                 logger.info(f"Duress alert has location: {alert.location_lat}, {alert.location_lng}. Checking for authorities...")
-                authorities = get_authorities_in_radius(db, alert.location_lat, alert.location_lng)
+                try:
+                    authorities = get_authorities_in_radius(db, alert.location_lat, alert.location_lng)
+                except Exception as e:
+                    # Contacts were already notified - log rather than fail (and retry) the alert
+                    logger.error(f"Failed to look up authorities for duress alert {alert_id}: {e}", exc_info=True)
+                    authorities = []
                 logger.info(f"Found {len(authorities)} authorities in range for duress alert {alert_id}")
 
-                for authority in authorities:
-                    logger.info(f"Notifying authority: {authority.name} at {authority.phone}")
-                    message = f"""🚨 EMERGENCY - DURESS ALERT IN YOUR JURISDICTION 🚨
-
-{user.name} has triggered a silent emergency alert within your area.
-
-User Phone: {user.phone}
-User Email: {user.email}
-
-⚠️ DURESS SITUATION - They may be coerced or compromised.
-DO NOT call the user directly.
-
-Live Tracking: {tracking_url}
-
-Location: {location_text}
-
-Distance from {authority.name}: {calculate_distance(alert.location_lat, alert.location_lng, authority.latitude, authority.longitude):.0f}m
-
-This is an automated alert from Protego Safety System.
-Immediate response may be required.
-
-- Protego Safety"""
-
-                    # Try WhatsApp first
-                    result = twilio_service.send_whatsapp(
-                        to=authority.phone,
-                        message=message
+                sends = []
+                for authority, distance in authorities:
+                    logger.debug("Notifying authority: %s at %s", authority.name, authority.phone)
+                    message = DURESS_AUTHORITY_TEMPLATE.format(
+                        user_name=user.name,
+                        user_phone=user.phone,
+                        user_email=user.email,
+                        tracking_url=tracking_url,
+                        location_text=location_text,
+                        authority_name=authority.name,
+                        distance=distance
                     )
 
-                    if result.get("success"):
-                        authorities_notified += 1
-                        logger.info(f"Duress alert sent via WhatsApp to authority {authority.name} ({authority.phone})")
-                    else:
-                        # Fallback to SMS if WhatsApp fails
-                        logger.warning(f"WhatsApp failed for authority {authority.name}, trying SMS fallback")
-                        sms_result = twilio_service.send_sms(
-                            to=authority.phone,
-                            message=message
-                        )
-                        if sms_result.get("success"):
-                            authorities_notified += 1
-                            logger.info(f"Duress alert sent via SMS to authority {authority.name} ({authority.phone})")
-                        else:
-                            logger.error(f"Failed to send duress alert to authority {authority.name} ({authority.phone})")
+                    sends.append(self._send_with_fallback(
+                        authority.phone, message, f"authority {authority.name} ({authority.phone})", "Duress alert"
+                    ))
+
+                results = await asyncio.gather(*sends, return_exceptions=True)
+                authorities_notified = sum(result is True for result in results)
 
             # Update alert status
             alert.status = AlertStatus.TRIGGERED
             alert.triggered_at = datetime.utcnow()
             db.commit()
-            db.refresh(alert)
 
             logger.critical(
                 f"🚨 Duress alert {alert_id} sent to {contacts_notified} contacts "
@@ -464,67 +679,136 @@ Immediate response may be required.
     ) -> None:
         """
         Trigger an alert by sending notifications to trusted contacts.
+        The alert is claimed first (PENDING -> TRIGGERED in one UPDATE), so an
+        alert cancelled meanwhile, or already fired by another worker after
+        recovery, is not sent twice. If sending fails before any contact was
+        notified the claim is released back to PENDING so the alert is retried.
 
         Args:
             alert_id: ID of the alert to trigger
             db: Database session
         """
-        # Fetch alert from database
-        alert = db.query(Alert).filter(Alert.id == alert_id).first()
-        if not alert:
-            logger.error(f"Alert {alert_id} not found in database")
+        claimed = db.query(Alert).filter(
+            Alert.id == alert_id,
+            Alert.status == AlertStatus.PENDING
+        ).update(
+            {Alert.status: AlertStatus.TRIGGERED, Alert.triggered_at: datetime.utcnow()},
+            synchronize_session=False
+        )
+        db.commit()
+        if not claimed:
+            logger.info(f"Alert {alert_id} is no longer pending - not triggering")
             return
 
+        await self._send_alert_notifications(alert_id, db)
+
+    def _release_claim(
+        self,
+        alert_id: int,
+        db: Session
+    ) -> None:
+        """
+        Return a claimed alert to PENDING after its notifications failed.
+
+        Args:
+            alert_id: ID of the claimed alert
+            db: Database session
+        """
+        try:
+            db.rollback()
+            db.query(Alert).filter(
+                Alert.id == alert_id,
+                Alert.status == AlertStatus.TRIGGERED
+            ).update(
+                {Alert.status: AlertStatus.PENDING, Alert.triggered_at: None},
+                synchronize_session=False
+            )
+            db.commit()
+            logger.warning(f"Released claim on alert {alert_id} - it is pending again")
+        except Exception as e:
+            logger.error(f"Could not release claim on alert {alert_id}: {e}")
+
+    async def _send_alert_notifications(
+        self,
+        alert_id: int,
+        db: Session
+    ) -> None:
+        """
+        Notify trusted contacts and nearby authorities for a claimed alert.
+        The claim is released only while nothing has gone out yet; once the
+        contact fan-out has started, later failures are logged instead so a
+        retry never re-sends messages or re-places voice calls.
+
+        Args:
+            alert_id: ID of the claimed alert
+            db: Database session
+        """
+        try:
+            # Fetch alert (and its user in the same query)
+            alert = db.query(Alert).options(joinedload(Alert.user)).filter(Alert.id == alert_id).first()
+            if not alert:
+                logger.error(f"Alert {alert_id} not found in database")
+                return
+
+            user = alert.user
+            if not alert.is_duress and not user:
+                logger.error(f"User {alert.user_id} not found for alert {alert_id}")
+                return
+
+            # Prepare location data (maps link built once for calls and authority messages)
+            location = None
+            location_url = None
+            if alert.location_lat and alert.location_lng:
+                location = {
+                    "lat": alert.location_lat,
+                    "lng": alert.location_lng
+                }
+                location_url = f"https://www.google.com/maps?q={alert.location_lat},{alert.location_lng}"
+
+            # Send full AI analysis as-is, or fallback to transcription/keywords
+            analysis_details = None
+            if alert.ai_analysis:
+                analysis_details = alert.ai_analysis  # Send complete AI analysis
+            elif alert.transcription:
+                analysis_details = f"Heard: \"{alert.transcription}\""
+            elif alert.keywords_detected:
+                keywords = alert.keywords_detected if isinstance(alert.keywords_detected, list) else []
+                if keywords:
+                    analysis_details = f"Keywords: {', '.join(keywords)}"
+        except BaseException:
+            # Nothing was sent - hand the claim back so the alert is retried
+            self._release_claim(alert_id, db)
+            raise
+
         # If this is a duress alert, use special duress handling
         if alert.is_duress:
             await self.trigger_duress_alert(alert_id, db)
             return
 
-        # Fetch user and trusted contacts
-        user = db.query(User).filter(User.id == alert.user_id).first()
-        if not user:
-            logger.error(f"User {alert.user_id} not found for alert {alert_id}")
-            return
-
-        # Prepare location data
-        location = None
-        if alert.location_lat and alert.location_lng:
-            location = {
-                "lat": alert.location_lat,
-                "lng": alert.location_lng
-            }
-
         logger.info(
             f"Triggering alert {alert_id} for user {user.name} (type: {alert.type})"
         )
 
-        # Extract analysis details from proper database fields
-        analysis_details = None
-
-        # Send full AI analysis as-is, or fallback to transcription/keywords
-        if alert.ai_analysis:
-            analysis_details = alert.ai_analysis  # Send complete AI analysis
-        elif alert.transcription:
-            analysis_details = f"Heard: \"{alert.transcription}\""
-        elif alert.keywords_detected:
-            keywords = alert.keywords_detected if isinstance(alert.keywords_detected, list) else []
-            if keywords:
-                analysis_details = f"Keywords: {', '.join(keywords)}"
-
-        # Send emergency alerts via Twilio (WhatsApp/SMS)
-        notification_result = twilio_service.send_emergency_alerts(
-            user_name=user.name,
-            user_phone=user.phone,
-            trusted_contacts=user.trusted_contacts,
-            alert_type=alert.type.value,
-            location=location,
-            analysis_details=analysis_details
-        )
+        # Send emergency alerts via Twilio (WhatsApp/SMS) off the event loop.
+        # Each send catches its own errors, so an exception here means no
+        # message went out yet (cancellation does not: the thread keeps sending)
+        try:
+            notification_result = await asyncio.to_thread(
+                twilio_service.send_emergency_alerts,
+                user_name=user.name,
+                user_phone=user.phone,
+                trusted_contacts=user.trusted_contacts,
+                alert_type=alert.type.value,
+                location=location,
+                analysis_details=analysis_details
+            )
+        except Exception:
+            self._release_claim(alert_id, db)
+            raise
 
         # Send emergency voice calls to trusted contacts via Vonage
         logger.info(f"[VOICE_CALL_CHECK] user.trusted_contacts={user.trusted_contacts}, location={location}")
         if user.trusted_contacts and len(user.trusted_contacts) > 0 and location:
-            location_url = f"https://www.google.com/maps?q={location['lat']},{location['lng']}"
             logger.info(f"[VOICE_CALL] Sending emergency voice calls to {len(user.trusted_contacts)} contacts: {user.trusted_contacts}")
 
             try:
@@ -543,66 +827,40 @@ Immediate response may be required.
 
         # Notify government authorities if alert has location
         authorities_notified = 0
-        if alert.location_lat and alert.location_lng:
+        if location:
             logger.info(f"Alert has location: {alert.location_lat}, {alert.location_lng}. Checking for authorities...")
-            authorities = get_authorities_in_radius(db, alert.location_lat, alert.location_lng)
+            try:
+                authorities = get_authorities_in_radius(db, alert.location_lat, alert.location_lng)
+            except Exception as e:
+                # Contacts were already notified - log rather than fail (and retry) the alert
+                logger.error(f"Failed to look up authorities for alert {alert_id}: {e}", exc_info=True)
+                authorities = []
             logger.info(f"Found {len(authorities)} authorities in range for alert {alert_id}")
-            location_url = f"https://www.google.com/maps?q={alert.location_lat},{alert.location_lng}"
 
-            for authority in authorities:
-                logger.info(f"Notifying authority: {authority.name} at {authority.phone}")
-                distance = calculate_distance(
-                    alert.location_lat, alert.location_lng,
-                    authority.latitude, authority.longitude
-                )
+            # Include analysis details for authorities too
+            analysis_line = f"\n{analysis_details}\n" if analysis_details else ""
 
-                # Include analysis details for authorities too
-                analysis_line = f"\n{analysis_details}\n" if analysis_details else ""
+            sends = []
+            for authority, distance in authorities:
+                logger.debug("Notifying authority: %s at %s", authority.name, authority.phone)
 
-                message = f"""🚨 EMERGENCY ALERT IN YOUR JURISDICTION 🚨
-
-{user.name} has triggered an emergency alert.
-Alert Type: {alert.type.value}
-Analysis: {analysis_line}
-User Phone: {user.phone}
-User Email: {user.email}
-
-Location: {location_url}
-
-Distance from {authority.name}: {distance:.0f}m
-
-This is an automated alert from Protego Safety System.
-Immediate response may be required.
-
-- Protego Safety"""
-
-                # Try WhatsApp first
-                result = twilio_service.send_whatsapp(
-                    to=authority.phone,
-                    message=message
+                message = ALERT_AUTHORITY_TEMPLATE.format(
+                    user_name=user.name,
+                    alert_type=alert.type.value,
+                    analysis_line=analysis_line,
+                    user_phone=user.phone,
+                    user_email=user.email,
+                    location_url=location_url,
+                    authority_name=authority.name,
+                    distance=distance
                 )
 
-                if result.get("success"):
-                    authorities_notified += 1
-                    logger.info(f"Alert sent via WhatsApp to authority {authority.name} ({authority.phone})")
-                else:
-                    # Fallback to SMS
-                    logger.warning(f"WhatsApp failed for authority {authority.name}, trying SMS fallback")
-                    sms_result = twilio_service.send_sms(
-                        to=authority.phone,
-                        message=message
-                    )
-                    if sms_result.get("success"):
-                        authorities_notified += 1
-                        logger.info(f"Alert sent via SMS to authority {authority.name} ({authority.phone})")
-                    else:
-                        logger.error(f"Failed to send alert to authority {authority.name} ({authority.phone})")
-
-        # Update alert status
-        alert.status = AlertStatus.TRIGGERED
-        alert.triggered_at = datetime.utcnow()
-        db.commit()
-        db.refresh(alert)
+                sends.append(self._send_with_fallback(
+                    authority.phone, message, f"authority {authority.name} ({authority.phone})", "Alert"
+                ))
+
+            results = await asyncio.gather(*sends, return_exceptions=True)
+            authorities_notified = sum(result is True for result in results)
 
         logger.info(
             f"Alert {alert_id} triggered successfully. "
@@ -634,40 +892,29 @@ Immediate response may be required.
         try:
             now = datetime.utcnow()
 
-            # Find all alerts with pending countdown that haven't been triggered/cancelled
-            pending_alerts = db.query(Alert).filter(
+            # One scan for every pending countdown; split into live/expired below
+            rows = db.query(Alert.id, Alert.countdown_expires_at).filter(
                 Alert.status == AlertStatus.PENDING,
-                Alert.countdown_expires_at.isnot(None),
-                Alert.countdown_expires_at > now  # Not yet expired
-            ).all()
-
-            # Find expired alerts that should be triggered immediately
-            expired_alerts = db.query(Alert).filter(
-                Alert.status == AlertStatus.PENDING,
-                Alert.countdown_expires_at.isnot(None),
-                Alert.countdown_expires_at <= now  # Already expired
+                Alert.countdown_expires_at.isnot(None)
             ).all()
 
             recovery_count = 0
 
-            # Re-schedule pending alerts
-            for alert in pending_alerts:
-                time_remaining = (alert.countdown_expires_at - now).total_seconds()
+            # Wall-clock deadlines are converted to a relative delay once, here;
+            # the timer itself only ever compares monotonic loop time
+            for alert_id, expires_at in rows:
+                if expires_at.tzinfo is not None:
+                    # timestamptz columns come back aware; `now` is naive UTC
+                    expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+                time_remaining = (expires_at - now).total_seconds()
                 if time_remaining > 0:
-                    # Create countdown task with remaining time
-                    task = asyncio.create_task(
-                        self._countdown_with_remaining_time(alert.id, time_remaining)
-                    )
-                    self.pending_alerts[alert.id] = task
-                    recovery_count += 1
                     logger.info(
-                        f"Recovered alert {alert.id} with {time_remaining:.1f}s remaining"
+                        f"Recovered alert {alert_id} with {time_remaining:.1f}s remaining"
                     )
-
-            # Trigger expired alerts immediately
-            for alert in expired_alerts:
-                logger.info(f"Triggering expired alert {alert.id}")
-                asyncio.create_task(self._trigger_alert(alert.id, db))
+                else:
+                    # Already expired - fires on the timer's next pass
+                    logger.info(f"Triggering expired alert {alert_id}")
+                self._schedule_countdown(alert_id, time_remaining)
                 recovery_count += 1
 
             logger.info(f"Recovered {recovery_count} alerts from database")
@@ -676,37 +923,6 @@ Immediate response may be required.
         finally:
             db.close()
 
-    async def _countdown_with_remaining_time(
-        self,
-        alert_id: int,
-        remaining_seconds: float
-    ) -> None:
-        """
-        Countdown with custom remaining time (for recovery after restart).
-
-        Args:
-            alert_id: ID of the alert
-            remaining_seconds: Seconds remaining until trigger
-        """
-        from database import SessionLocal
-
-        try:
-            await asyncio.sleep(remaining_seconds)
-
-            db = SessionLocal()
-            try:
-                await self._trigger_alert(alert_id, db)
-            finally:
-                db.close()
-
-        except asyncio.CancelledError:
-            logger.info(f"Recovered countdown for alert {alert_id} was cancelled")
-        except Exception as e:
-            logger.error(f"Error in recovered countdown for alert {alert_id}: {e}")
-        finally:
-            if alert_id in self.pending_alerts:
-                del self.pending_alerts[alert_id]
-
 
 # Global alert manager instance
 alert_manager = AlertManager()
@@ -5,10 +5,13 @@ Provides caching for frequently accessed data like user profiles, active session
 
 import json
 import redis
-from typing import Optional, Any
+from typing import Optional, Any, List
 from config import settings
 from logger import app_logger as logger
 
+# Outlives any cached "no active walk" answer tagged with the version
+ACTIVE_SESSION_VERSION_TTL_SECONDS = 3600
+
 
 class CacheService:
     """
@@ -86,6 +89,71 @@ class CacheService:
             logger.warning(f"Cache SET error for key '{key}': {e}")
             return False
 
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get several values in one round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order (None where missing or cache unavailable)
+        """
+        if not self.enabled or not self.redis_client:
+            return [None] * len(keys)
+
+        try:
+            return [json.loads(value) if value else None for value in self.redis_client.mget(keys)]
+        except (redis.RedisError, json.JSONDecodeError) as e:
+            logger.warning(f"Cache MGET error for keys {keys}: {e}")
+            return [None] * len(keys)
+
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        Set value in cache only if the key does not exist (SET NX).
+
+        Args:
+            key: Cache key
+            value: Value to cache (will be JSON serialized)
+            ttl: Time to live in seconds (defaults to config.cache_ttl)
+
+        Returns:
+            True if the value was stored, False otherwise
+        """
+        if not self.enabled or not self.redis_client:
+            return False
+
+        try:
+            ttl = ttl or settings.cache_ttl
+            return bool(self.redis_client.set(key, json.dumps(value), ex=ttl, nx=True))
+        except (redis.RedisError, TypeError) as e:
+            logger.warning(f"Cache ADD error for key '{key}': {e}")
+            return False
+
+    def incr(self, key: str, ttl: Optional[int] = None) -> Optional[int]:
+        """
+        Atomically increment a counter and refresh its TTL.
+
+        Args:
+            key: Cache key
+            ttl: Time to live in seconds (defaults to config.cache_ttl)
+
+        Returns:
+            The new value, or None if the cache is unavailable
+        """
+        if not self.enabled or not self.redis_client:
+            return None
+
+        try:
+            pipe = self.redis_client.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, ttl or settings.cache_ttl)
+            value, _ = pipe.execute()
+            return value
+        except redis.RedisError as e:
+            logger.warning(f"Cache INCR error for key '{key}': {e}")
+            return None
+
     def delete(self, key: str) -> bool:
         """
         Delete value from cache.
@@ -194,10 +262,42 @@ def active_sessions_cache_key(user_id: int) -> str:
     return f"active_sessions:{user_id}"
 
 
+def active_sessions_version_cache_key(user_id: int) -> str:
+    """Generate cache key for the version bumped whenever a user's walk starts or stops."""
+    return f"active_sessions_version:{user_id}"
+
+
 def ai_result_cache_key(content_hash: str) -> str:
     """Generate cache key for AI analysis result."""
     return f"ai:{content_hash}"
 
 
+def notification_cooldown_cache_key(user_id: int, event_type: str) -> str:
+    """Generate cache key for a user's notification cooldown."""
+    return f"notify_cooldown:{user_id}:{event_type}"
+
+
+def geofence_event_cache_key(user_id: int, location_id: Optional[int]) -> str:
+    """Generate cache key for the last geofence notification at a safe location."""
+    return f"geofence_event:{user_id}:{location_id}"
+
+
+def geofence_state_cache_key(user_id: int) -> str:
+    """Generate cache key for a user's debounced geofence state."""
+    return f"geofence_state:{user_id}"
+
+
 # Global cache instance
 cache = CacheService()
+
+
+def invalidate_active_session(user_id: int) -> None:
+    """
+    Invalidate a user's cached "no active walk" answer after a start or stop.
+    Bumping the version also voids an answer a concurrent read writes late.
+
+    Args:
+        user_id: ID of the user whose walk started or stopped
+    """
+    cache.incr(active_sessions_version_cache_key(user_id), ttl=ACTIVE_SESSION_VERSION_TTL_SECONDS)
+    cache.delete(active_sessions_cache_key(user_id))
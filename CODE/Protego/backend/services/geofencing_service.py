@@ -3,17 +3,160 @@ Geofencing service for monitoring user location and safe location events.
 Sends WhatsApp notifications when users enter/leave safe locations.
 """
 
-from typing import Optional, Dict, List
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Any, Optional, Dict, List, Set, Tuple, NamedTuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
+from functools import lru_cache
+import asyncio
+import json
 import logging
+import math
+import time
+
+import numpy as np
+import redis
 
 from models import User, SafeLocation, WalkSession
 from services.twilio_service import twilio_service
-from routers.safe_locations import calculate_distance
+from services.notification_debouncer import notification_debouncer
+from services.rate_limiter import TokenBucket
+from services.cache import (
+    cache,
+    notification_cooldown_cache_key,
+    geofence_event_cache_key,
+    geofence_state_cache_key
+)
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Mean Earth radius in meters
+EARTH_RADIUS_M = 6371000
+
+# Atomic read-compare-set for a last-event record (geofence enter/leave, walk
+# state), so two workers handling the same flap cannot both send. The key's TTL starts at the cooldown, so
+# cooldown - TTL is the time since the last notification.
+# KEYS[1] = event key; ARGV = direction, cooldown, flap window. Returns 1 to send.
+LAST_EVENT_SCRIPT = """
+local last = redis.call('GET', KEYS[1])
+if last then
+    if last == ARGV[1] then
+        return 0
+    end
+    if tonumber(ARGV[2]) - redis.call('TTL', KEYS[1]) < tonumber(ARGV[3]) then
+        return 0
+    end
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return 1
+"""
+
+# WhatsApp message templates (filled with str.format_map)
+ENTERED_TEMPLATE = (
+    "🏠 *Protego Safety Update*\n\n"
+    "{user_name} has arrived at *{location_name}*\n\n"
+    "📍 Location: {location_url}\n"
+    "🕐 Time: {time}\n\n"
+    "They are now in a safe location."
+)
+
+LEFT_TEMPLATE = (
+    "🚶 *Protego Safety Update*\n\n"
+    "{user_name} has left their safe location\n\n"
+    "🕐 Time: {time}\n"
+    "⚠️ Walk mode will start automatically to ensure their safety.\n\n"
+    "You will receive updates during their journey."
+)
+
+WALK_STARTED_TEMPLATE = (
+    "🛡️ *Protego Walk Mode Active*\n\n"
+    "{user_name} has {mode_text} walk mode{trigger_text}\n\n"
+    "🕐 Started: {time}"
+    "{location_line}\n\n"
+    "They will be monitored for safety. You'll receive alerts if anything seems wrong."
+)
+
+WALK_STOPPED_TEMPLATE = (
+    "✅ *Protego Walk Mode Ended*\n\n"
+    "{user_name} has {mode_text} walk mode{trigger_text}\n\n"
+    "🕐 Ended: {time}\n"
+    "⏱️ Duration: {duration}"
+    "{location_line}\n\n"
+    "They have arrived safely."
+)
+
+
+@lru_cache(maxsize=4096)
+def _map_url(latitude: float, longitude: float) -> str:
+    """Google Maps link for a coordinate (memoized - safe locations repeat)."""
+    return f"https://maps.google.com/?q={latitude},{longitude}"
+
+
+@lru_cache(maxsize=2048)
+def _entered_message(user_name: str, location_name: str, location_url: str, time_text: str) -> str:
+    """Arrival message body (memoized - a burst of pings repeats it within the minute)."""
+    return ENTERED_TEMPLATE.format_map({
+        "user_name": user_name,
+        "location_name": location_name,
+        "location_url": location_url,
+        "time": time_text
+    })
+
+
+@lru_cache(maxsize=2048)
+def _left_message(user_name: str, time_text: str) -> str:
+    """Departure message body (memoized like _entered_message)."""
+    return LEFT_TEMPLATE.format_map({
+        "user_name": user_name,
+        "time": time_text
+    })
+
+
+class SafeLocationEntry(NamedTuple):
+    """Columns of an active SafeLocation needed for geofence checks."""
+    id: int
+    name: str
+    latitude: float
+    longitude: float
+    radius_meters: int
+    auto_start_walk: bool
+    auto_stop_walk: bool
+    maps_url: str  # Precomputed once per load, reused by every notification
+
+
+class UserSafeLocations(NamedTuple):
+    """A user's active safe locations plus parallel arrays for the distance check."""
+    entries: List[SafeLocationEntry]
+    lat_rad: np.ndarray
+    lon_rad: np.ndarray
+    cos_lat: np.ndarray
+    radius_m: np.ndarray
+    has_auto_start: bool  # Any location starts a walk when the user leaves it
+
+
+@dataclass
+class GeofenceState:
+    """
+    Debounced geofence state of one user, by safe location id (None means
+    outside all safe locations). Shared between workers through Redis, so
+    times are wall-clock.
+    """
+    candidate_id: Optional[int]
+    candidate_since: float
+    # False until some observation has held for the dwell time
+    settled: bool = False
+    confirmed_id: Optional[int] = None
+    # Last safe location the user was confirmed inside (what "left" refers to)
+    last_location_id: Optional[int] = None
+
+
+def _location_id(location: Optional[SafeLocationEntry]) -> Optional[int]:
+    """Comparable identity of a geofence state."""
+    return location.id if location else None
+
 
 class GeofencingService:
     """
@@ -21,16 +164,190 @@ class GeofencingService:
     Tracks when users enter/leave safe locations and triggers appropriate actions.
     """
 
+    __slots__ = (
+        "_notification_cache",
+        "_notification_cache_maxsize",
+        "_notification_cooldown",
+        "_geofence_events",
+        "_flap_window",
+        "_location_cache",
+        "_location_cache_ttl",
+        "_geofence_states",
+        "_geofence_state_ttl",
+        "_dwell_seconds",
+        "_whatsapp_bucket",
+        "_background_tasks",
+    )
+
     def __init__(self):
         """Initialize geofencing service."""
-        # Cache to prevent duplicate notifications (user_id -> event_type -> timestamp)
-        self._notification_cache: Dict[int, Dict[str, datetime]] = {}
+        # Cache to prevent duplicate notifications ((user_id, event_type) -> monotonic time
+        # of the last send). Kept in send order so expired entries sit at the front.
+        self._notification_cache: "OrderedDict[Tuple[int, str], float]" = OrderedDict()
+        self._notification_cache_maxsize = 100_000
         # Minimum time between duplicate notifications (in seconds)
         self._notification_cooldown = 300  # 5 minutes
+        # Last enter/leave notification per safe location
+        # ((user_id, location_id) -> (monotonic time, direction)), in send order.
+        # One entry covers both directions so an enter/leave flap sends once.
+        # Debounced walk notifications keep their last event under (user_id, "walk").
+        self._geofence_events: "OrderedDict[Tuple[int, Any], Tuple[float, str]]" = OrderedDict()
+        # Opposite-direction notifications for the same location are suppressed this long
+        self._flap_window = 120
+        # Active safe locations per user (user_id -> (loaded_at, entries)), in
+        # load order. They change rarely, so location pings read them from memory;
+        # the TTL bounds staleness for edits made through other workers.
+        self._location_cache: "OrderedDict[int, Tuple[float, UserSafeLocations]]" = OrderedDict()
+        self._location_cache_ttl = 60
+        # Debounced inside/outside state per user. A new state must persist for
+        # `_dwell_seconds` before it is confirmed, so GPS jitter around a
+        # boundary does not send enter/exit notifications. Kept in Redis so
+        # every worker sees the same dwell; this is the per-process fallback
+        # (user_id -> (monotonic time of last update, state)), in update order.
+        self._geofence_states: "OrderedDict[int, Tuple[float, GeofenceState]]" = OrderedDict()
+        self._geofence_state_ttl = 3600
+        self._dwell_seconds = 60
+        # Smooths WhatsApp bursts (many users crossing geofences at once)
+        self._whatsapp_bucket = TokenBucket(
+            rate=settings.whatsapp_send_rate,
+            capacity=settings.whatsapp_send_burst
+        )
+        # Strong references to queued notification sends so they are not garbage collected
+        self._background_tasks: Set[asyncio.Task] = set()
+
+    def invalidate_safe_locations(self, user_id: int) -> None:
+        """Drop a user's cached safe locations (call after create/update/delete)."""
+        self._location_cache.pop(user_id, None)
+
+    def _get_safe_locations(self, user_id: int, db: Session) -> UserSafeLocations:
+        """
+        Return a user's active safe locations, loading them on a cache miss.
+
+        Args:
+            user_id: User ID
+            db: Database session used when the cache has to be refreshed
+
+        Returns:
+            Active safe locations with their coordinate arrays
+        """
+        now = time.monotonic()
+        cached = self._location_cache.get(user_id)
+        if cached and now - cached[0] <= self._location_cache_ttl:
+            return cached[1]
+
+        # Core select returns plain Row tuples - no ORM entity or query overhead
+        rows = db.execute(
+            select(
+                SafeLocation.id,
+                SafeLocation.name,
+                SafeLocation.latitude,
+                SafeLocation.longitude,
+                SafeLocation.radius_meters,
+                SafeLocation.auto_start_walk,
+                SafeLocation.auto_stop_walk
+            ).where(
+                SafeLocation.user_id == user_id,
+                SafeLocation.is_active == True
+            ).order_by(SafeLocation.id)
+        ).all()
+
+        entries = [
+            SafeLocationEntry(*row, maps_url=_map_url(row.latitude, row.longitude))
+            for row in rows
+        ]
+        coords = np.array(
+            [(entry.latitude, entry.longitude, entry.radius_meters) for entry in entries],
+            dtype=np.float64
+        ).reshape(-1, 3)
+        lat_rad = np.radians(coords[:, 0])
+        locations = UserSafeLocations(
+            entries=entries,
+            lat_rad=lat_rad,
+            lon_rad=np.radians(coords[:, 1]),
+            cos_lat=np.cos(lat_rad),
+            radius_m=coords[:, 2],
+            has_auto_start=any(entry.auto_start_walk for entry in entries)
+        )
+        location_cache = self._location_cache
+        location_cache[user_id] = (now, locations)
+        location_cache.move_to_end(user_id)
+
+        # Evict expired entries (they would be reloaded anyway) and anything
+        # beyond the size bound
+        maxsize = self._notification_cache_maxsize
+        while location_cache:
+            loaded_at, _ = next(iter(location_cache.values()))
+            if now - loaded_at <= self._location_cache_ttl and len(location_cache) <= maxsize:
+                break
+            location_cache.popitem(last=False)
+        return locations
+
+    def _find_containing_location(
+        self,
+        locations: UserSafeLocations,
+        latitude: float,
+        longitude: float,
+        accuracy_m: float = 0.0,
+        current_location_id: Optional[int] = None
+    ) -> Optional[SafeLocationEntry]:
+        """
+        Find the first safe location whose radius covers a point.
+
+        GPS accuracy is applied as hysteresis so an imprecise fix never reads
+        as safe: a location is entered only if the whole accuracy circle lies
+        inside it, and the current location is only left once the fix is
+        certainly outside it.
+
+        Args:
+            locations: User's active safe locations
+            latitude: Current latitude
+            longitude: Current longitude
+            accuracy_m: GPS accuracy radius in meters
+            current_location_id: Safe location the user is currently in, if any
+
+        Returns:
+            The containing safe location, or None if outside all of them
+        """
+        phi = math.radians(latitude)
+        lam = math.radians(longitude)
+        cos_phi = math.cos(phi)
+
+        # Cheap equirectangular prefilter (no trig per location): only locations
+        # within twice their radius go on to the exact Haversine check.
+        # Longitude deltas are wrapped so the antimeridian is not a wall.
+        dlat = locations.lat_rad - phi
+        dlon = (locations.lon_rad - lam + math.pi) % (2 * math.pi) - math.pi
+        approx = EARTH_RADIUS_M * np.sqrt(dlat * dlat + (dlon * cos_phi) ** 2)
+        candidates = np.flatnonzero(approx - accuracy_m <= 2 * locations.radius_m)
+        if not len(candidates):
+            return None
+
+        # Vectorized Haversine over the remaining candidates
+        a = (
+            np.sin(dlat[candidates] / 2) ** 2
+            + cos_phi * locations.cos_lat[candidates] * np.sin(dlon[candidates] / 2) ** 2
+        )
+        distances = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        radii = locations.radius_m[candidates]
+
+        inside = distances + accuracy_m <= radii
+        if inside.any():
+            return locations.entries[int(candidates[np.argmax(inside)])]
+
+        # Not certainly inside anything - stay in the current location unless
+        # the fix is certainly outside it
+        if current_location_id is not None:
+            for index, distance, radius in zip(candidates, distances, radii):
+                entry = locations.entries[int(index)]
+                if entry.id == current_location_id and distance - accuracy_m <= radius:
+                    return entry
+        return None
 
     def _should_send_notification(self, user_id: int, event_type: str) -> bool:
         """
         Check if notification should be sent based on cooldown period.
+        Uses an atomic Redis SET NX EX when Redis is available so the cooldown
+        holds across workers; otherwise falls back to a per-process cache.
 
         Args:
             user_id: User ID
@@ -39,31 +356,147 @@ class GeofencingService:
         Returns:
             True if notification should be sent, False otherwise
         """
-        now = datetime.utcnow()
+        if cache.enabled and cache.redis_client:
+            try:
+                return bool(cache.redis_client.set(
+                    notification_cooldown_cache_key(user_id, event_type), "1",
+                    nx=True, ex=self._notification_cooldown
+                ))
+            except redis.RedisError as e:
+                logger.warning(f"Redis cooldown check failed, using local cooldown: {e}")
+
+        local_cache = self._notification_cache
+        cooldown = self._notification_cooldown
+        key = (user_id, event_type)
+        now = time.monotonic()
+
+        last_notification = local_cache.get(key)
+        if last_notification is not None and now - last_notification < cooldown:
+            return False
+
+        local_cache[key] = now
+        local_cache.move_to_end(key)
+
+        # Evict entries whose cooldown has passed (they no longer suppress anything)
+        # and anything beyond the size bound
+        maxsize = self._notification_cache_maxsize
+        while local_cache:
+            oldest = next(iter(local_cache.values()))
+            if now - oldest < cooldown and len(local_cache) <= maxsize:
+                break
+            local_cache.popitem(last=False)
 
-        if user_id not in self._notification_cache:
-            self._notification_cache[user_id] = {}
+        return True
 
-        last_notification = self._notification_cache[user_id].get(event_type)
+    def _should_send_geofence_notification(
+        self,
+        user_id: int,
+        location_id: Optional[int],
+        direction: str
+    ) -> bool:
+        """
+        Check if an enter/leave notification for a safe location should be sent.
+        A single record per location holds the last direction notified: the same
+        direction is held back for the cooldown period, the opposite one for
+        `_flap_window` seconds.
+
+        Args:
+            user_id: User ID
+            location_id: Safe location entered or left (None if unknown)
+            direction: 'entered' or 'left'
+
+        Returns:
+            True if notification should be sent, False otherwise
+        """
+        return self._should_send_event(
+            geofence_event_cache_key(user_id, location_id),
+            (user_id, location_id),
+            direction,
+            self._flap_window
+        )
+
+    def _should_send_walk_notification(self, user_id: int, event_type: str) -> bool:
+        """
+        Check if a debounced walk notification should be sent.
+        Only a repeat of the last walk event notified is held back (for the
+        cooldown period), so contacts always end up told the current state.
+
+        Args:
+            user_id: User ID
+            event_type: Last event of the batch (e.g. 'walk_started_manual')
+
+        Returns:
+            True if notification should be sent, False otherwise
+        """
+        return self._should_send_event(
+            notification_cooldown_cache_key(user_id, "walk"),
+            (user_id, "walk"),
+            event_type,
+            0
+        )
 
-        if last_notification is None:
-            # First notification of this type
-            self._notification_cache[user_id][event_type] = now
-            return True
+    def _should_send_event(
+        self,
+        redis_key: str,
+        local_key: Tuple[int, Any],
+        direction: str,
+        flap_window: float
+    ) -> bool:
+        """
+        Compare an event against the last one recorded under a key, and record it
+        if it is sent. Atomic in Redis when available; otherwise per-process.
+
+        Args:
+            redis_key: Redis key of the record
+            local_key: Key of the record in the local fallback
+            direction: Event being notified
+            flap_window: Seconds a different event is held back for
+
+        Returns:
+            True if notification should be sent, False otherwise
+        """
+        cooldown = self._notification_cooldown
+
+        if cache.enabled and cache.redis_client:
+            try:
+                return bool(cache.redis_client.eval(
+                    LAST_EVENT_SCRIPT, 1, redis_key, direction, cooldown, flap_window
+                ))
+            except redis.RedisError as e:
+                logger.warning(f"Redis cooldown check failed, using local cooldown: {e}")
+
+        events = self._geofence_events
+        now = time.monotonic()
+
+        last_event = events.get(local_key)
+        if last_event is not None:
+            last_sent, last_direction = last_event
+            window = cooldown if last_direction == direction else flap_window
+            if now - last_sent < window:
+                return False
+
+        events[local_key] = (now, direction)
+        events.move_to_end(local_key)
+
+        maxsize = self._notification_cache_maxsize
+        while events:
+            oldest, _ = next(iter(events.values()))
+            if now - oldest < cooldown and len(events) <= maxsize:
+                break
+            events.popitem(last=False)
 
-        # Check if cooldown period has passed
-        time_since_last = (now - last_notification).total_seconds()
-        if time_since_last >= self._notification_cooldown:
-            self._notification_cache[user_id][event_type] = now
-            return True
+        return True
 
-        return False
+    async def _send_whatsapp(self, phone: str, message: str) -> Dict[str, any]:
+        """Send one WhatsApp message once the rate limiter allows it."""
+        await self._whatsapp_bucket.acquire()
+        return await twilio_service.send_whatsapp_async(phone, message)
 
-    def _send_whatsapp_to_contacts(
+    async def _send_whatsapp_to_contacts(
         self,
         user: User,
         message: str,
-        db: Session
+        db: Optional[Session] = None
     ) -> Dict[str, any]:
         """
         Send WhatsApp message to user's trusted contacts.
@@ -76,11 +509,54 @@ class GeofencingService:
         Returns:
             Dictionary with notification results
         """
-        # Get trusted contacts
-        trusted_contacts = [contact.phone for contact in user.trusted_contact_list if contact.is_active]
+        trusted_contacts = self._active_contact_phones(user)
+        return await self._send_whatsapp_to_phones(user.id, trusted_contacts, message)
+
+    def _active_contact_phones(self, user: User) -> List[str]:
+        """Phone numbers of the user's active trusted contacts (filtered in SQL)."""
+        return [contact.phone for contact in user.active_trusted_contacts]
 
+    def _queue_whatsapp_to_contacts(self, user: User, message: str) -> bool:
+        """
+        Send WhatsApp message to user's trusted contacts in the background.
+        Contacts are resolved now, while the request's session is still open.
+
+        Args:
+            user: User object
+            message: Message to send
+
+        Returns:
+            True if a send was queued, False if the user has no active contacts
+        """
+        trusted_contacts = self._active_contact_phones(user)
         if not trusted_contacts:
             logger.warning(f"No active trusted contacts for user {user.id}")
+            return False
+
+        task = asyncio.create_task(self._send_whatsapp_to_phones(user.id, trusted_contacts, message))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return True
+
+    async def _send_whatsapp_to_phones(
+        self,
+        user_id: int,
+        trusted_contacts: List[str],
+        message: str
+    ) -> Dict[str, any]:
+        """
+        Send WhatsApp message to a list of contact phone numbers.
+
+        Args:
+            user_id: User the contacts belong to (for logs)
+            trusted_contacts: Contact phone numbers
+            message: Message to send
+
+        Returns:
+            Dictionary with notification results
+        """
+        if not trusted_contacts:
+            logger.warning(f"No active trusted contacts for user {user_id}")
             return {"success": False, "error": "No trusted contacts"}
 
         results = {
@@ -89,9 +565,16 @@ class GeofencingService:
             "results": []
         }
 
-        # Send WhatsApp to each contact
-        for contact_phone in trusted_contacts:
-            result = twilio_service.send_whatsapp(contact_phone, message)
+        # Send WhatsApp to all contacts concurrently. A failure is logged and recorded
+        # per contact so background callers don't lose it and the rest still go out.
+        sends = await asyncio.gather(
+            *(self._send_whatsapp(contact_phone, message) for contact_phone in trusted_contacts),
+            return_exceptions=True
+        )
+        for contact_phone, result in zip(trusted_contacts, sends):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to send WhatsApp to {contact_phone}: {result}")
+                result = {"success": False, "error": str(result)}
             results["results"].append({
                 "contact": contact_phone,
                 **result
@@ -101,102 +584,203 @@ class GeofencingService:
 
         return results
 
-    def check_location_and_notify(
+    def _load_geofence_state(self, user_id: int) -> Optional[GeofenceState]:
+        """
+        Load a user's debounced geofence state from Redis, or the local fallback.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            The stored state, or None if the user has no recent state
+        """
+        if cache.enabled and cache.redis_client:
+            try:
+                stored = cache.redis_client.get(geofence_state_cache_key(user_id))
+                return GeofenceState(**json.loads(stored)) if stored else None
+            except (redis.RedisError, ValueError, TypeError) as e:
+                logger.warning(f"Redis geofence state read failed, using local state: {e}")
+
+        stored = self._geofence_states.get(user_id)
+        if stored is None or time.monotonic() - stored[0] >= self._geofence_state_ttl:
+            return None
+        return stored[1]
+
+    def _save_geofence_state(self, user_id: int, state: GeofenceState) -> None:
+        """
+        Store a user's debounced geofence state in Redis, or the local fallback.
+
+        Args:
+            user_id: User ID
+            state: State to store
+        """
+        if cache.enabled and cache.redis_client:
+            try:
+                cache.redis_client.set(
+                    geofence_state_cache_key(user_id), json.dumps(asdict(state)),
+                    ex=self._geofence_state_ttl
+                )
+                return
+            except redis.RedisError as e:
+                logger.warning(f"Redis geofence state write failed, using local state: {e}")
+
+        states = self._geofence_states
+        now = time.monotonic()
+        states[user_id] = (now, state)
+        states.move_to_end(user_id)
+
+        # Evict states nobody has updated within the TTL and anything beyond the size bound
+        maxsize = self._notification_cache_maxsize
+        while states:
+            updated_at, _ = next(iter(states.values()))
+            if now - updated_at < self._geofence_state_ttl and len(states) <= maxsize:
+                break
+            states.popitem(last=False)
+
+    def _debounce_location(
+        self,
+        state: Optional[GeofenceState],
+        observed: Optional[SafeLocationEntry],
+        locations: UserSafeLocations
+    ) -> Tuple[GeofenceState, Optional[SafeLocationEntry], bool]:
+        """
+        Feed an observed geofence state through the dwell-time debounce.
+
+        Args:
+            state: User's current state (None if there is none yet)
+            observed: Safe location the user appears to be in (None if outside)
+            locations: User's active safe locations
+
+        Returns:
+            Tuple of (updated state, reported location, whether the observation
+            is settled). Notifications are only sent for settled observations.
+        """
+        now = time.time()
+        observed_id = _location_id(observed)
+        if state is None:
+            # No worker has seen this user recently - the first observation
+            # has to dwell like any other change
+            state = GeofenceState(candidate_id=observed_id, candidate_since=now)
+        elif observed_id != state.candidate_id:
+            state.candidate_id = observed_id
+            state.candidate_since = now
+
+        if ((not state.settled or observed_id != state.confirmed_id)
+                and now - state.candidate_since < self._dwell_seconds):
+            if not state.settled:
+                return state, observed, False
+            confirmed = next(
+                (entry for entry in locations.entries if entry.id == state.confirmed_id), None
+            )
+            return state, confirmed, False
+
+        state.settled = True
+        state.confirmed_id = observed_id
+        if observed_id is not None:
+            state.last_location_id = observed_id
+        return state, observed, True
+
+    async def check_location_and_notify(
         self,
         user: User,
         latitude: float,
         longitude: float,
-        db: Session
+        db: Session,
+        accuracy_m: Optional[float] = None
     ) -> Dict[str, any]:
         """
         Check user's location against safe locations and send notifications.
+        Notifications are sent in the background so the location ping returns
+        without waiting for Twilio.
+
+        A change of safe location (or leaving all of them) is only acted on
+        once it has held for `_dwell_seconds`; until then the previous state
+        is reported and no notification is sent.
 
         Args:
             user: User object
             latitude: Current latitude
             longitude: Current longitude
             db: Database session
+            accuracy_m: Optional GPS accuracy radius in meters
 
         Returns:
             Dictionary with geofence status and notification results
         """
-        # Get all active safe locations for user
-        safe_locations = db.query(SafeLocation).filter(
-            SafeLocation.user_id == user.id,
-            SafeLocation.is_active == True
-        ).all()
+        # Get all active safe locations for user (cached between pings)
+        safe_locations = self._get_safe_locations(user.id, db)
 
-        if not safe_locations:
+        if not safe_locations.entries:
             return {
                 "inside_safe_location": False,
                 "notification_sent": False,
+                "notification_queued": False,
                 "message": "No safe locations configured"
             }
 
-        # Check if inside any safe location
-        inside_location = None
-        for location in safe_locations:
-            distance = calculate_distance(
-                latitude, longitude,
-                location.latitude, location.longitude
-            )
-
-            if distance <= location.radius_meters:
-                inside_location = location
-                break
+        # Check if inside any safe location, then debounce boundary jitter
+        state = self._load_geofence_state(user.id)
+        observed_location = self._find_containing_location(
+            safe_locations, latitude, longitude, accuracy_m or 0.0,
+            current_location_id=state.confirmed_id if state and state.settled else None
+        )
+        state, inside_location, settled = self._debounce_location(
+            state, observed_location, safe_locations
+        )
+        self._save_geofence_state(user.id, state)
 
-        # Get current walk session
-        active_session = db.query(WalkSession).filter(
-            WalkSession.user_id == user.id,
-            WalkSession.end_time == None
-        ).first()
+        # Only whether a walk is active matters here - fetch just its id
+        active_session_id = db.execute(
+            select(WalkSession.id).where(
+                WalkSession.user_id == user.id,
+                WalkSession.end_time == None
+            ).limit(1)
+        ).scalar()
 
         response = {
             "inside_safe_location": inside_location is not None,
             "safe_location_name": inside_location.name if inside_location else None,
             "notification_sent": False,
+            "notification_queued": False,
             "action_taken": None
         }
 
         # Handle entering safe location
         if inside_location:
             # Check if should send "arrived" notification
-            event_type = f"entered_{inside_location.id}"
-            if self._should_send_notification(user.id, event_type):
+            if settled and self._should_send_geofence_notification(
+                user.id, inside_location.id, "entered"
+            ):
                 message = self._build_entered_message(user, inside_location)
-                notification_result = self._send_whatsapp_to_contacts(user, message, db)
-                response["notification_sent"] = notification_result.get("success", False)
-                response["notification_result"] = notification_result
+                response["notification_queued"] = self._queue_whatsapp_to_contacts(user, message)
 
             # Auto-stop walk if enabled
-            if inside_location.auto_stop_walk and active_session:
+            if inside_location.auto_stop_walk and active_session_id:
                 response["action_taken"] = "auto_stop_walk"
                 response["message"] = f"Inside {inside_location.name} - walk will auto-stop soon"
 
         # Handle leaving safe location (outside all safe locations)
         else:
             # Check if should send "left" notification
-            event_type = "left_safe_location"
-            if self._should_send_notification(user.id, event_type):
+            if settled and self._should_send_geofence_notification(
+                user.id, state.last_location_id, "left"
+            ):
                 message = self._build_left_message(user)
-                notification_result = self._send_whatsapp_to_contacts(user, message, db)
-                response["notification_sent"] = notification_result.get("success", False)
-                response["notification_result"] = notification_result
+                response["notification_queued"] = self._queue_whatsapp_to_contacts(user, message)
 
             # Auto-start walk if enabled and not already walking
-            has_auto_start_location = any(loc.auto_start_walk for loc in safe_locations)
-            if has_auto_start_location and not active_session:
+            if safe_locations.has_auto_start and not active_session_id:
                 response["action_taken"] = "should_auto_start_walk"
                 response["message"] = "Left safe location - walk mode should start"
 
         return response
 
-    def notify_walk_started(
+    async def notify_walk_started(
         self,
         user: User,
         walk_session: WalkSession,
         auto_started: bool,
-        db: Session
+        db: Optional[Session] = None
     ) -> Dict[str, any]:
         """
         Notify contacts when walk mode is started.
@@ -216,14 +800,14 @@ class GeofencingService:
             return {"success": False, "message": "Notification on cooldown"}
 
         message = self._build_walk_started_message(user, walk_session, auto_started)
-        return self._send_whatsapp_to_contacts(user, message, db)
+        return await self._send_whatsapp_to_contacts(user, message, db)
 
-    def notify_walk_stopped(
+    async def notify_walk_stopped(
         self,
         user: User,
         walk_session: WalkSession,
         auto_stopped: bool,
-        db: Session
+        db: Optional[Session] = None
     ) -> Dict[str, any]:
         """
         Notify contacts when walk mode is stopped.
@@ -243,27 +827,60 @@ class GeofencingService:
             return {"success": False, "message": "Notification on cooldown"}
 
         message = self._build_walk_stopped_message(user, walk_session, auto_stopped)
-        return self._send_whatsapp_to_contacts(user, message, db)
+        return await self._send_whatsapp_to_contacts(user, message, db)
+
+    def queue_walk_started(
+        self,
+        user: User,
+        walk_session: WalkSession,
+        auto_started: bool
+    ) -> None:
+        """
+        Queue a debounced walk-started notification (see NotificationDebouncer).
+        The cooldown is applied to the flushed batch, not to each event.
+
+        Args:
+            user: User object
+            walk_session: Walk session that was started
+            auto_started: Whether walk was auto-started by geofencing
+        """
+        event_type = "walk_started_auto" if auto_started else "walk_started_manual"
+        message = self._build_walk_started_message(user, walk_session, auto_started)
+        mode_text = "Automatically started" if auto_started else "Started"
+        summary = f"{mode_text} walk mode at {walk_session.start_time.strftime('%I:%M %p')}"
+        notification_debouncer.enqueue(user.id, user.name, message, summary, event_type)
+
+    def queue_walk_stopped(
+        self,
+        user: User,
+        walk_session: WalkSession,
+        auto_stopped: bool
+    ) -> None:
+        """
+        Queue a debounced walk-stopped notification (see NotificationDebouncer).
+        The cooldown is applied to the flushed batch, not to each event.
+
+        Args:
+            user: User object
+            walk_session: Walk session that was stopped
+            auto_stopped: Whether walk was auto-stopped by geofencing
+        """
+        event_type = "walk_stopped_auto" if auto_stopped else "walk_stopped_manual"
+        message = self._build_walk_stopped_message(user, walk_session, auto_stopped)
+        mode_text = "Automatically stopped" if auto_stopped else "Stopped"
+        summary = f"{mode_text} walk mode at {walk_session.end_time.strftime('%I:%M %p')}"
+        notification_debouncer.enqueue(user.id, user.name, message, summary, event_type)
 
-    def _build_entered_message(self, user: User, location: SafeLocation) -> str:
+    def _build_entered_message(self, user: User, location: SafeLocationEntry) -> str:
         """Build WhatsApp message for entering safe location."""
-        return (
-            f"🏠 *Protego Safety Update*\n\n"
-            f"{user.name} has arrived at *{location.name}*\n\n"
-            f"📍 Location: https://maps.google.com/?q={location.latitude},{location.longitude}\n"
-            f"🕐 Time: {datetime.utcnow().strftime('%I:%M %p')}\n\n"
-            f"They are now in a safe location."
+        return _entered_message(
+            user.name, location.name, location.maps_url,
+            datetime.utcnow().strftime('%I:%M %p')
         )
 
     def _build_left_message(self, user: User) -> str:
         """Build WhatsApp message for leaving safe location."""
-        return (
-            f"🚶 *Protego Safety Update*\n\n"
-            f"{user.name} has left their safe location\n\n"
-            f"🕐 Time: {datetime.utcnow().strftime('%I:%M %p')}\n"
-            f"⚠️ Walk mode will start automatically to ensure their safety.\n\n"
-            f"You will receive updates during their journey."
-        )
+        return _left_message(user.name, datetime.utcnow().strftime('%I:%M %p'))
 
     def _build_walk_started_message(
         self,
@@ -277,15 +894,15 @@ class GeofencingService:
 
         location_str = ""
         if walk_session.location_lat and walk_session.location_lng:
-            location_str = f"\n📍 Starting Location: https://maps.google.com/?q={walk_session.location_lat},{walk_session.location_lng}"
-
-        return (
-            f"🛡️ *Protego Walk Mode Active*\n\n"
-            f"{user.name} has {mode_text} walk mode{trigger_text}\n\n"
-            f"🕐 Started: {walk_session.start_time.strftime('%I:%M %p')}"
-            f"{location_str}\n\n"
-            f"They will be monitored for safety. You'll receive alerts if anything seems wrong."
-        )
+            location_str = f"\n📍 Starting Location: {_map_url(walk_session.location_lat, walk_session.location_lng)}"
+
+        return WALK_STARTED_TEMPLATE.format_map({
+            "user_name": user.name,
+            "mode_text": mode_text,
+            "trigger_text": trigger_text,
+            "time": walk_session.start_time.strftime('%I:%M %p'),
+            "location_line": location_str
+        })
 
     def _build_walk_stopped_message(
         self,
@@ -311,16 +928,16 @@ class GeofencingService:
 
         location_str = ""
         if walk_session.end_latitude and walk_session.end_longitude:
-            location_str = f"\n📍 Final Location: https://maps.google.com/?q={walk_session.end_latitude},{walk_session.end_longitude}"
-
-        return (
-            f"✅ *Protego Walk Mode Ended*\n\n"
-            f"{user.name} has {mode_text} walk mode{trigger_text}\n\n"
-            f"🕐 Ended: {walk_session.end_time.strftime('%I:%M %p')}\n"
-            f"⏱️ Duration: {duration}"
-            f"{location_str}\n\n"
-            f"They have arrived safely."
-        )
+            location_str = f"\n📍 Final Location: {_map_url(walk_session.end_latitude, walk_session.end_longitude)}"
+
+        return WALK_STOPPED_TEMPLATE.format_map({
+            "user_name": user.name,
+            "mode_text": mode_text,
+            "trigger_text": trigger_text,
+            "time": walk_session.end_time.strftime('%I:%M %p'),
+            "duration": duration,
+            "location_line": location_str
+        })
 
 
 # Global geofencing service instance
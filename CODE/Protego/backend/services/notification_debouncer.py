@@ -0,0 +1,140 @@
+"""
+Notification debouncer for walk lifecycle updates.
+Coalesces bursts of per-user WhatsApp notifications (e.g. rapid walk
+start/stop toggling) into a single message sent after a short idle window.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+import logging
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PendingNotifications:
+    """Notifications queued for one user within the current window."""
+    user_name: str
+    messages: List[str] = field(default_factory=list)
+    summaries: List[str] = field(default_factory=list)
+    event_types: List[str] = field(default_factory=list)
+
+
+class NotificationDebouncer:
+    """
+    Delays walk notifications per user and flushes them as one message.
+
+    Each new event re-arms the user's timer; once no event has arrived for
+    `window_seconds`, everything pending is sent together off the request path.
+    Duress alerts never go through here.
+    """
+
+    def __init__(self, window_seconds: float):
+        """Initialize with empty pending/timer registries."""
+        self.window_seconds = window_seconds
+        self._pending: Dict[int, PendingNotifications] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    def enqueue(
+        self,
+        user_id: int,
+        user_name: str,
+        message: str,
+        summary: str,
+        event_type: str
+    ) -> None:
+        """
+        Queue a notification for a user (must be called from the event loop).
+
+        Args:
+            user_id: User whose trusted contacts are notified
+            user_name: User's display name (for the combined message)
+            message: Full message to send if this event is alone in its window
+            summary: One-line description used when events are combined
+            event_type: Event kind (e.g. 'walk_started_manual'), for the cooldown
+        """
+        pending = self._pending.setdefault(user_id, PendingNotifications(user_name=user_name))
+        pending.messages.append(message)
+        pending.summaries.append(summary)
+        pending.event_types.append(event_type)
+
+        timer = self._timers.pop(user_id, None)
+        if timer:
+            timer.cancel()
+
+        loop = asyncio.get_running_loop()
+        self._timers[user_id] = loop.call_later(self.window_seconds, self._start_flush, user_id)
+
+    def _start_flush(self, user_id: int) -> None:
+        """Timer callback: hand the user's pending events to a flush task."""
+        self._timers.pop(user_id, None)
+        pending = self._pending.pop(user_id, None)
+        if not pending:
+            return
+
+        task = asyncio.create_task(self._flush(user_id, pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, user_id: int, pending: PendingNotifications) -> None:
+        """Send the pending events for a user as a single WhatsApp message."""
+        from services.geofencing_service import geofencing_service
+
+        # Cooldown applies to the batch, keyed on its final state: it is only
+        # dropped when every event in it repeats what contacts were last told
+        final_state_new = geofencing_service._should_send_walk_notification(
+            user_id, pending.event_types[-1]
+        )
+        if not final_state_new and len(set(pending.event_types)) == 1:
+            logger.info(f"Walk notification for user {user_id} on cooldown - not sent")
+            return
+
+        if len(pending.messages) == 1:
+            message = pending.messages[0]
+        else:
+            message = self._build_combined_message(pending)
+
+        try:
+            # ORM session is blocking - load the user off the loop
+            user = await asyncio.to_thread(self._load_user, user_id)
+            if user:
+                await geofencing_service._send_whatsapp_to_contacts(user, message)
+        except Exception as e:
+            logger.error(f"Failed to send walk notification for user {user_id}: {e}")
+
+    def _load_user(self, user_id: int):
+        """Load the user and their trusted contacts in a fresh session."""
+        from sqlalchemy.orm import joinedload
+        from database import SessionLocal
+        from models import User
+
+        db = SessionLocal()
+        try:
+            # Contacts are read right away - fetch them in the same round-trip
+            user = db.query(User).options(
+                joinedload(User.active_trusted_contacts)
+            ).filter(User.id == user_id).first()
+            if not user:
+                logger.warning(f"User {user_id} not found for walk notification")
+            return user
+        finally:
+            db.close()
+
+    def _build_combined_message(self, pending: PendingNotifications) -> str:
+        """Build one WhatsApp message summarising several walk events."""
+        lines = "\n".join(f"• {summary}" for summary in pending.summaries)
+        return (
+            f"🛡️ *Protego Walk Update*\n\n"
+            f"{pending.user_name} updated walk mode:\n\n"
+            f"{lines}"
+        )
+
+
+# Global notification debouncer instance
+notification_debouncer = NotificationDebouncer(
+    window_seconds=settings.walk_notification_debounce_seconds
+)
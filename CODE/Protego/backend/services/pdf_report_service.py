@@ -6,14 +6,16 @@ Generates professional PDF reports with AI-powered insights and analytics.
 
 import io
 import re
+import json
+import math
+import time
+import asyncio
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Optional, Any
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
-from matplotlib.patches import Wedge
-import pandas as pd
+from typing import Dict, List, Optional, Any, Tuple, Union
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -22,11 +24,114 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.platypus.flowables import HRFlowable
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
+from reportlab.graphics.shapes import Drawing, String
+from reportlab.graphics.charts.piecharts import Pie
+from reportlab.graphics.charts.barcharts import VerticalBarChart
+from reportlab.graphics.charts.textlabels import Label
 import httpx
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# AI insights for identical stats (e.g. an admin re-downloading a report) are
+# reused instead of waiting on the LLM again. Only real AI responses are
+# cached; fallback insights are cheap to rebuild.
+_INSIGHTS_CACHE_TTL_SECONDS = 3600
+_INSIGHTS_CACHE_MAXSIZE = 128
+_insights_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+# In-flight LLM requests by stats hash; concurrent identical reports share one
+_insights_requests: Dict[str, "asyncio.Task[Optional[str]]"] = {}
+
+# Charts are embedded at ~5-7 inches wide; 100 dpi is plenty at that size.
+# Margins come from tight_layout() (one layout pass) rather than
+# savefig(bbox_inches='tight'), which renders each chart twice.
+CHART_DPI = 100
+
+# Charts with at most this many categories are drawn as reportlab vector
+# graphics; matplotlib is only used for the larger ones and the timeline
+VECTOR_CHART_MAX_CATEGORIES = 5
+
+# Pie slice colors, assigned to categories in order
+PIE_COLORS = [
+    '#ef4444', '#eab308', '#3b82f6', '#8b5cf6', '#10b981',
+    '#f97316', '#ec4899', '#06b6d4', '#84cc16'
+]
+
+
+def _new_chart_figure(figsize: Tuple[float, float]):
+    """Create a standalone (non-pyplot) figure with a single axes."""
+    # matplotlib is heavy to import - load it with the first chart, not at startup
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    fig.subplots()
+    return fig
+
+
+def _clear_chart_figure(fig):
+    """Reset a reused chart figure to its freshly created layout and return its axes."""
+    from matplotlib.figure import SubplotParams
+
+    # tight_layout() adjusts the subplot params in place; starting from the
+    # previous chart's values would let one render's layout leak into the next
+    defaults = SubplotParams()
+    fig.subplots_adjust(
+        left=defaults.left, bottom=defaults.bottom, right=defaults.right,
+        top=defaults.top, wspace=defaults.wspace, hspace=defaults.hspace
+    )
+    ax = fig.axes[0]
+    ax.clear()
+    return ax
+
+# Markdown -> ReportLab markup patterns, compiled once at import
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+_MD_HEADING = re.compile(r'^(#{1,3}) (.+)$', re.MULTILINE)
+_MD_HEADING_SIZES = {3: '12', 2: '14', 1: '16'}
+_MD_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+_MD_ITALIC_STAR = re.compile(r'\*([^*]+)\*')
+_MD_ITALIC_UNDERSCORE = re.compile(r'_([^_]+)_')
+_MD_UNDERLINE = re.compile(r'__([^_]+)__')
+_MD_BULLET = re.compile(r'^[-*] ', re.MULTILINE)
+
+
+def _heading_markup(match: re.Match) -> str:
+    """ReportLab markup for a #, ## or ### heading."""
+    size = _MD_HEADING_SIZES[len(match.group(1))]
+    return f'<font size="{size}"><b>{match.group(2)}</b></font>'
+
+
+def _stats_cache_key(stats_data: Dict) -> str:
+    """Stable hash of a stats payload."""
+    payload = json.dumps(stats_data, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def _get_cached_insights(key: str) -> Optional[str]:
+    """Return unexpired cached insights for a stats hash."""
+    cached = _insights_cache.get(key)
+    if cached is None:
+        return None
+    expires_at, insights = cached
+    if time.monotonic() >= expires_at:
+        del _insights_cache[key]
+        return None
+    _insights_cache.move_to_end(key)
+    return insights
+
+
+def _finish_insights_request(key: str, task: "asyncio.Task[Optional[str]]") -> None:
+    """Drop a finished LLM request from the in-flight map and cache its insights."""
+    _insights_requests.pop(key, None)
+    if task.cancelled() or task.exception() is not None:
+        return
+    insights = task.result()
+    if insights is None:
+        return
+    _insights_cache[key] = (time.monotonic() + _INSIGHTS_CACHE_TTL_SECONDS, insights)
+    _insights_cache.move_to_end(key)
+    if len(_insights_cache) > _INSIGHTS_CACHE_MAXSIZE:
+        _insights_cache.popitem(last=False)
+
 
 class PDFReportService:
     """Service for generating AI-enhanced PDF reports."""
@@ -34,6 +139,22 @@ class PDFReportService:
     def __init__(self):
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
+        # One reusable figure per chart type (created on first use), cleared
+        # between renders instead of building and tearing down a new figure for
+        # every chart. They are not registered with pyplot, so different chart
+        # types can render in parallel threads; each figure's lock serialises
+        # renders that share it.
+        self._pie_fig = None
+        self._bar_fig = None
+        self._timeline_fig = None
+        self._pie_lock = threading.Lock()
+        self._bar_lock = threading.Lock()
+        self._timeline_lock = threading.Lock()
+        # Shared HTTP client for the LLM API (keeps the TLS connection alive between reports)
+        self.http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20)
+        )
 
     def _setup_custom_styles(self):
         """Setup custom paragraph styles."""
@@ -84,7 +205,28 @@ class PDFReportService:
         ))
 
     async def _generate_ai_insights(self, stats_data: Dict) -> str:
-        """Generate AI insights from statistics data."""
+        """Generate AI insights from statistics data (cached per identical stats)."""
+        key = _stats_cache_key(stats_data)
+        insights = _get_cached_insights(key)
+        if insights is not None:
+            return insights
+
+        # One LLM call per stats payload - concurrent identical requests share
+        # its result, including a failure, instead of retrying one by one
+        task = _insights_requests.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request_ai_insights(stats_data))
+            _insights_requests[key] = task
+            task.add_done_callback(lambda done: _finish_insights_request(key, done))
+
+        # Shielded so a cancelled report does not cancel the request others await
+        insights = await asyncio.shield(task)
+        if insights is None:
+            return self._generate_fallback_insights(stats_data)
+        return insights
+
+    async def _request_ai_insights(self, stats_data: Dict) -> Optional[str]:
+        """Ask the LLM for insights; returns None if the request fails."""
         try:
             # Prepare prompt for AI analysis
             prompt = f"""Analyze the following safety monitoring statistics and provide 3-5 key insights in a professional tone:
@@ -120,36 +262,34 @@ Format your response as clear, structured text with proper formatting:
 - Keep it professional and actionable"""
 
             # Call MegaLLM API
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    settings.megallm_endpoint,
-                    headers={
-                        "Authorization": f"Bearer {settings.megallm_api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": settings.megallm_model,
-                        "messages": [
-                            {"role": "system", "content": "You are a safety analytics expert providing insights on emergency response data."},
-                            {"role": "user", "content": prompt}
-                        ],
-                        "max_tokens": 500,
-                        "temperature": 0.7
-                    },
-                    timeout=30.0
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    insights = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-                    return insights
-                else:
-                    logger.warning(f"AI insights generation failed: {response.status_code}")
-                    return self._generate_fallback_insights(stats_data)
+            response = await self.http_client.post(
+                settings.megallm_endpoint,
+                headers={
+                    "Authorization": f"Bearer {settings.megallm_api_key}",
+                    "Content-Type": "application/json"
+                },
+                json={
+                    "model": settings.megallm_model,
+                    "messages": [
+                        {"role": "system", "content": "You are a safety analytics expert providing insights on emergency response data."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    "max_tokens": 500,
+                    "temperature": 0.7
+                }
+            )
+
+            if response.status_code == 200:
+                result = response.json()
+                insights = result.get('choices', [{}])[0].get('message', {}).get('content', '')
+                return insights
+            else:
+                logger.warning(f"AI insights generation failed: {response.status_code}")
+                return None
 
         except Exception as e:
             logger.error(f"Error generating AI insights: {e}")
-            return self._generate_fallback_insights(stats_data)
+            return None
 
     def _generate_fallback_insights(self, stats_data: Dict) -> str:
         """Generate basic insights without AI."""
@@ -172,150 +312,250 @@ Format your response as clear, structured text with proper formatting:
 
     def _format_markdown_to_pdf(self, text: str) -> str:
         """Convert markdown formatting to ReportLab HTML-like tags."""
-        # Escape existing HTML entities
-        text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+        # Escape existing HTML entities (one pass for all three)
+        text = text.translate(_HTML_ESCAPE)
 
         # Convert markdown headings to bold and larger size
-        text = re.sub(r'^### (.+)$', r'<font size="12"><b>\1</b></font>', text, flags=re.MULTILINE)
-        text = re.sub(r'^## (.+)$', r'<font size="14"><b>\1</b></font>', text, flags=re.MULTILINE)
-        text = re.sub(r'^# (.+)$', r'<font size="16"><b>\1</b></font>', text, flags=re.MULTILINE)
+        text = _MD_HEADING.sub(_heading_markup, text)
 
         # Convert **bold** to <b>bold</b>
-        text = re.sub(r'\*\*([^*]+)\*\*', r'<b>\1</b>', text)
+        text = _MD_BOLD.sub(r'<b>\1</b>', text)
 
         # Convert *italic* or _italic_ to <i>italic</i>
-        text = re.sub(r'\*([^*]+)\*', r'<i>\1</i>', text)
-        text = re.sub(r'_([^_]+)_', r'<i>\1</i>', text)
+        text = _MD_ITALIC_STAR.sub(r'<i>\1</i>', text)
+        text = _MD_ITALIC_UNDERSCORE.sub(r'<i>\1</i>', text)
 
         # Convert __underline__ to <u>underline</u>
-        text = re.sub(r'__([^_]+)__', r'<u>\1</u>', text)
+        text = _MD_UNDERLINE.sub(r'<u>\1</u>', text)
 
         # Convert bullet points
-        text = re.sub(r'^- ', '• ', text, flags=re.MULTILINE)
-        text = re.sub(r'^\* ', '• ', text, flags=re.MULTILINE)
+        text = _MD_BULLET.sub('• ', text)
 
         # Convert newlines to <br/>
         text = text.replace('\n', '<br/>')
 
         return text
 
-    def _create_pie_chart(self, data: Dict[str, int], title: str) -> io.BytesIO:
-        """Create a pie chart and return the buffer."""
-        fig, ax = plt.subplots(figsize=(6, 4))
-
-        labels = list(data.keys())
-        values = list(data.values())
-        # Expanded color palette for more categories
-        colors_list = [
-            '#ef4444', '#eab308', '#3b82f6', '#8b5cf6', '#10b981',
-            '#f97316', '#ec4899', '#06b6d4', '#84cc16'
-        ]
-
-        # Only plot if there's data
-        total = sum(values)
-        if total > 0:
-            # Filter out zero values
-            non_zero_data = [(label, value, color) for label, value, color in zip(labels, values, colors_list) if value > 0]
-
-            if non_zero_data:
-                filtered_labels = [item[0] for item in non_zero_data]
-                filtered_values = [item[1] for item in non_zero_data]
-                filtered_colors = [item[2] for item in non_zero_data]
-
-                wedges, texts, autotexts = ax.pie(
-                    filtered_values,
-                    labels=filtered_labels,
-                    autopct='%1.1f%%',
-                    colors=filtered_colors,
-                    startangle=90,
-                    textprops={'fontsize': 10, 'weight': 'bold'}
-                )
-
-                for autotext in autotexts:
-                    autotext.set_color('white')
-                    autotext.set_fontsize(10)
-                    autotext.set_weight('bold')
-        else:
-            # If no data, show empty message
-            ax.text(0.5, 0.5, 'No Data Available',
-                   ha='center', va='center', fontsize=14, color='gray')
-            ax.set_xlim(-1, 1)
-            ax.set_ylim(-1, 1)
-
-        ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
-
-        # Save to bytes
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close()
-        img_buffer.seek(0)
+    def _create_pie_chart(self, data: Dict[str, int], title: str) -> Union[Drawing, io.BytesIO]:
+        """Create a pie chart (a vector Drawing for few categories, else a PNG buffer)."""
+        if len(data) <= VECTOR_CHART_MAX_CATEGORIES:
+            return self._create_vector_pie_chart(data, title)
+
+        with self._pie_lock:
+            if self._pie_fig is None:
+                self._pie_fig = _new_chart_figure((6, 4))
+            fig = self._pie_fig
+            ax = _clear_chart_figure(fig)
+            # clear() keeps the aspect and hidden frame a previous pie() set
+            ax.set_aspect('auto')
+            ax.set_frame_on(True)
+
+            labels = list(data.keys())
+            values = list(data.values())
+
+            # Only plot if there's data
+            total = sum(values)
+            if total > 0:
+                # Filter out zero values
+                non_zero_data = [(label, value, color) for label, value, color in zip(labels, values, PIE_COLORS) if value > 0]
+
+                if non_zero_data:
+                    filtered_labels = [item[0] for item in non_zero_data]
+                    filtered_values = [item[1] for item in non_zero_data]
+                    filtered_colors = [item[2] for item in non_zero_data]
+
+                    wedges, texts, autotexts = ax.pie(
+                        filtered_values,
+                        labels=filtered_labels,
+                        autopct='%1.1f%%',
+                        colors=filtered_colors,
+                        startangle=90,
+                        textprops={'fontsize': 10, 'weight': 'bold'}
+                    )
+
+                    for autotext in autotexts:
+                        autotext.set_color('white')
+                        autotext.set_fontsize(10)
+                        autotext.set_weight('bold')
+            else:
+                # If no data, show empty message
+                ax.text(0.5, 0.5, 'No Data Available',
+                       ha='center', va='center', fontsize=14, color='gray')
+                ax.set_xlim(-1, 1)
+                ax.set_ylim(-1, 1)
+
+            ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
+
+            # Save to bytes
+            img_buffer = io.BytesIO()
+            fig.tight_layout()
+            fig.savefig(img_buffer, format='png', dpi=CHART_DPI, facecolor='white')
+            img_buffer.seek(0)
 
         return img_buffer
 
-    def _create_bar_chart(self, data: Dict[str, int], title: str, color_map: Dict[str, str]) -> io.BytesIO:
-        """Create a bar chart and return the buffer."""
-        fig, ax = plt.subplots(figsize=(7, 4))
-
-        labels = list(data.keys())
-        values = list(data.values())
-        colors_list = [color_map.get(label, '#3b82f6') for label in labels]
-
-        bars = ax.bar(labels, values, color=colors_list, alpha=0.8, edgecolor='black', linewidth=1.2)
+    def _create_bar_chart(
+        self,
+        data: Dict[str, int],
+        title: str,
+        color_map: Dict[str, str]
+    ) -> Union[Drawing, io.BytesIO]:
+        """Create a bar chart (a vector Drawing for few categories, else a PNG buffer)."""
+        if len(data) <= VECTOR_CHART_MAX_CATEGORIES:
+            return self._create_vector_bar_chart(data, title, color_map)
+
+        with self._bar_lock:
+            if self._bar_fig is None:
+                self._bar_fig = _new_chart_figure((7, 4))
+            fig = self._bar_fig
+            ax = _clear_chart_figure(fig)
+
+            labels = list(data.keys())
+            values = list(data.values())
+            colors_list = [color_map.get(label, '#3b82f6') for label in labels]
+
+            bars = ax.bar(labels, values, color=colors_list, alpha=0.8, edgecolor='black', linewidth=1.2)
+
+            # Add value labels on bars
+            for bar in bars:
+                height = bar.get_height()
+                ax.text(bar.get_x() + bar.get_width()/2., height,
+                       f'{int(height)}',
+                       ha='center', va='bottom', fontweight='bold', fontsize=10)
+
+            ax.set_ylabel('Count', fontsize=11, fontweight='bold')
+            ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
+            ax.grid(axis='y', alpha=0.3, linestyle='--')
+            ax.set_axisbelow(True)
+
+            # Save to bytes
+            img_buffer = io.BytesIO()
+            fig.tight_layout()
+            fig.savefig(img_buffer, format='png', dpi=CHART_DPI)
+            img_buffer.seek(0)
 
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height,
-                   f'{int(height)}',
-                   ha='center', va='bottom', fontweight='bold', fontsize=10)
+        return img_buffer
 
-        ax.set_ylabel('Count', fontsize=11, fontweight='bold')
-        ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
-        ax.grid(axis='y', alpha=0.3, linestyle='--')
-        ax.set_axisbelow(True)
+    def _create_vector_pie_chart(self, data: Dict[str, int], title: str) -> Drawing:
+        """Draw a pie chart with reportlab graphics (sized for a 5x3.3 inch slot)."""
+        drawing = Drawing(360, 238)
+        drawing.add(String(180, 222, title, fontName='Helvetica-Bold', fontSize=12, textAnchor='middle'))
 
-        # Save to bytes
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
-        img_buffer.seek(0)
+        # Filter out zero values, keeping each category's palette color
+        slices = [
+            (label, value, color)
+            for (label, value), color in zip(data.items(), PIE_COLORS) if value > 0
+        ]
+        if not slices:
+            drawing.add(String(180, 105, 'No Data Available', fontName='Helvetica',
+                               fontSize=14, fillColor=colors.gray, textAnchor='middle'))
+            return drawing
+
+        total = sum(value for _, value, _ in slices)
+        pie = Pie()
+        pie.x, pie.y = 120, 35
+        pie.width = pie.height = 120
+        pie.data = [value for _, value, _ in slices]
+        pie.labels = [f"{label} ({value / total * 100:.1f}%)" for label, value, _ in slices]
+        pie.startAngle = 90
+        pie.direction = 'anticlockwise'
+        pie.checkLabelOverlap = 1
+        pie.slices.strokeColor = colors.white
+        pie.slices.strokeWidth = 1
+        pie.slices.fontName = 'Helvetica-Bold'
+        pie.slices.fontSize = 10
+        for i, (_, _, color) in enumerate(slices):
+            pie.slices[i].fillColor = colors.HexColor(color)
+        drawing.add(pie)
+        return drawing
+
+    def _create_vector_bar_chart(
+        self,
+        data: Dict[str, int],
+        title: str,
+        color_map: Dict[str, str]
+    ) -> Drawing:
+        """Draw a bar chart with reportlab graphics (sized for a 6x3.5 inch slot)."""
+        drawing = Drawing(432, 252)
+        drawing.add(String(216, 236, title, fontName='Helvetica-Bold', fontSize=12, textAnchor='middle'))
 
-        return img_buffer
+        values = list(data.values())
+        # Whole-number ticks, with headroom above the tallest bar for its label
+        step = max(1, math.ceil(max(values, default=0) / 5))
+
+        chart = VerticalBarChart()
+        chart.x, chart.y = 55, 30
+        chart.width, chart.height = 360, 185
+        chart.data = [values]
+        chart.categoryAxis.categoryNames = list(data.keys())
+        chart.categoryAxis.labels.fontSize = 9
+        chart.valueAxis.valueMin = 0
+        chart.valueAxis.valueStep = step
+        chart.valueAxis.valueMax = step * (max(values, default=0) // step + 1)
+        chart.valueAxis.labels.fontSize = 9
+        chart.valueAxis.visibleGrid = True
+        chart.valueAxis.gridStrokeColor = colors.HexColor('#d1d5db')
+        chart.valueAxis.gridStrokeDashArray = (2, 2)
+        chart.bars.strokeColor = colors.black
+        chart.bars.strokeWidth = 1
+        for i, label in enumerate(data):
+            chart.bars[(0, i)].fillColor = colors.HexColor(color_map.get(label, '#3b82f6'))
+
+        # Value labels on bars
+        chart.barLabelFormat = '%d'
+        chart.barLabels.fontName = 'Helvetica-Bold'
+        chart.barLabels.fontSize = 10
+        chart.barLabels.nudge = 7
+        drawing.add(chart)
+
+        y_label = Label()
+        y_label.setOrigin(18, chart.y + chart.height / 2)
+        y_label.angle = 90
+        y_label.fontName = 'Helvetica-Bold'
+        y_label.fontSize = 11
+        y_label.setText('Count')
+        drawing.add(y_label)
+        return drawing
 
     def _create_timeline_chart(self, daily_data: Dict[str, Dict], title: str) -> io.BytesIO:
         """Create a timeline chart for daily alerts."""
         if not daily_data:
             return None
 
-        fig, ax = plt.subplots(figsize=(10, 4))
-
-        dates = sorted(daily_data.keys())
-        totals = [daily_data[date]['total'] for date in dates]
-
-        ax.plot(dates, totals, marker='o', linewidth=2, markersize=6, color='#3b82f6')
-        ax.fill_between(range(len(dates)), totals, alpha=0.3, color='#3b82f6')
-
-        ax.set_xlabel('Date', fontsize=11, fontweight='bold')
-        ax.set_ylabel('Alerts', fontsize=11, fontweight='bold')
-        ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.set_axisbelow(True)
-
-        # Rotate x-axis labels
-        plt.xticks(rotation=45, ha='right')
-
-        # Limit x-axis labels to avoid crowding
-        if len(dates) > 10:
-            step = len(dates) // 10
-            ax.set_xticks(range(0, len(dates), step))
-            ax.set_xticklabels([dates[i].split('T')[0][-5:] for i in range(0, len(dates), step)])
-        else:
-            ax.set_xticklabels([d.split('T')[0][-5:] for d in dates])
-
-        img_buffer = io.BytesIO()
-        plt.savefig(img_buffer, format='png', dpi=150, bbox_inches='tight')
-        plt.close()
-        img_buffer.seek(0)
+        with self._timeline_lock:
+            if self._timeline_fig is None:
+                self._timeline_fig = _new_chart_figure((10, 4))
+            fig = self._timeline_fig
+            ax = _clear_chart_figure(fig)
+
+            dates = sorted(daily_data.keys())
+            totals = [daily_data[date]['total'] for date in dates]
+
+            ax.plot(dates, totals, marker='o', linewidth=2, markersize=6, color='#3b82f6')
+            ax.fill_between(range(len(dates)), totals, alpha=0.3, color='#3b82f6')
+
+            ax.set_xlabel('Date', fontsize=11, fontweight='bold')
+            ax.set_ylabel('Alerts', fontsize=11, fontweight='bold')
+            ax.set_title(title, fontsize=12, fontweight='bold', pad=15)
+            ax.grid(True, alpha=0.3, linestyle='--')
+            ax.set_axisbelow(True)
+
+            # Rotate x-axis labels
+            for label in ax.get_xticklabels():
+                label.set(rotation=45, ha='right')
+
+            # Limit x-axis labels to avoid crowding
+            if len(dates) > 10:
+                step = len(dates) // 10
+                ax.set_xticks(range(0, len(dates), step))
+                ax.set_xticklabels([dates[i].split('T')[0][-5:] for i in range(0, len(dates), step)])
+            else:
+                ax.set_xticklabels([d.split('T')[0][-5:] for d in dates])
+
+            img_buffer = io.BytesIO()
+            fig.tight_layout()
+            fig.savefig(img_buffer, format='png', dpi=CHART_DPI)
+            img_buffer.seek(0)
 
         return img_buffer
 
@@ -372,7 +612,53 @@ Format your response as clear, structured text with proper formatting:
             'resolved_incidents': incidents_data['resolved']
         }
 
-        insights_text = await self._generate_ai_insights(stats_for_ai)
+        pie_data = {
+            'SOS': alerts_data['by_type']['sos'],
+            'Voice': alerts_data['by_type']['voice_trigger'],
+            'AI Analysis': alerts_data['by_type']['ai_analysis']
+        }
+        incident_chart_data = {
+            'Submitted': incidents_data['submitted'],
+            'Under Review': incidents_data['reviewing'],
+            'Resolved': incidents_data['resolved']
+        }
+        color_map = {
+            'Submitted': '#f97316',
+            'Under Review': '#eab308',
+            'Resolved': '#22c55e'
+        }
+
+        # Render charts in worker threads while the AI insights request is in flight
+        chart_jobs = {
+            'alert_types': asyncio.to_thread(self._create_pie_chart, pie_data, 'Alerts by Type'),
+            'incident_status': asyncio.to_thread(
+                self._create_bar_chart, incident_chart_data, 'Incident Status', color_map
+            )
+        }
+        if 'by_type' in incidents_data and incidents_data['by_type']:
+            incident_types_data = {
+                'Theft': incidents_data['by_type'].get('theft', 0),
+                'Assault': incidents_data['by_type'].get('assault', 0),
+                'Harassment': incidents_data['by_type'].get('harassment', 0),
+                'Accident': incidents_data['by_type'].get('accident', 0),
+                'Suspicious': incidents_data['by_type'].get('suspicious_activity', 0),
+                'Vandalism': incidents_data['by_type'].get('vandalism', 0),
+                'Medical': incidents_data['by_type'].get('medical_emergency', 0),
+                'Fire': incidents_data['by_type'].get('fire', 0),
+                'Other': incidents_data['by_type'].get('other', 0)
+            }
+            chart_jobs['incident_types'] = asyncio.to_thread(
+                self._create_pie_chart, incident_types_data, 'Incidents by Type'
+            )
+        if daily_data:
+            chart_jobs['timeline'] = asyncio.to_thread(
+                self._create_timeline_chart, daily_data, 'Daily Alerts Trend'
+            )
+
+        insights_text, *chart_buffers = await asyncio.gather(
+            self._generate_ai_insights(stats_for_ai), *chart_jobs.values()
+        )
+        charts = dict(zip(chart_jobs, chart_buffers))
         formatted_insights = self._format_markdown_to_pdf(insights_text)
         insights_para = Paragraph(formatted_insights, self.styles['Normal'])
         story.append(insights_para)
@@ -413,13 +699,7 @@ Format your response as clear, structured text with proper formatting:
         story.append(Paragraph("Alert Distribution by Type", self.styles['SectionHeader']))
         story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#3b82f6'), spaceAfter=10))
 
-        pie_data = {
-            'SOS': alerts_data['by_type']['sos'],
-            'Voice': alerts_data['by_type']['voice_trigger'],
-            'AI Analysis': alerts_data['by_type']['ai_analysis']
-        }
-        pie_chart = self._create_pie_chart(pie_data, 'Alerts by Type')
-        img = Image(pie_chart, width=5*inch, height=3.3*inch)
+        img = Image(charts['alert_types'], width=5*inch, height=3.3*inch)
         story.append(img)
         story.append(Spacer(1, 0.3*inch))
 
@@ -430,23 +710,11 @@ Format your response as clear, structured text with proper formatting:
         story.append(Paragraph("Incident Status Overview", self.styles['SectionHeader']))
         story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#3b82f6'), spaceAfter=10))
 
-        incident_chart_data = {
-            'Submitted': incidents_data['submitted'],
-            'Under Review': incidents_data['reviewing'],
-            'Resolved': incidents_data['resolved']
-        }
-        color_map = {
-            'Submitted': '#f97316',
-            'Under Review': '#eab308',
-            'Resolved': '#22c55e'
-        }
-        bar_chart = self._create_bar_chart(incident_chart_data, 'Incident Status', color_map)
-        img = Image(bar_chart, width=6*inch, height=3.5*inch)
+        img = Image(charts['incident_status'], width=6*inch, height=3.5*inch)
         story.append(img)
         story.append(Spacer(1, 0.3*inch))
 
         # Incident Types Distribution (if data available)
-        from loguru import logger
         logger.info(f"PDF Service - incidents_data keys: {incidents_data.keys()}")
         logger.info(f"PDF Service - 'by_type' in incidents_data: {'by_type' in incidents_data}")
         if 'by_type' in incidents_data:
@@ -459,20 +727,8 @@ Format your response as clear, structured text with proper formatting:
             story.append(Paragraph("Incident Types Distribution", self.styles['SectionHeader']))
             story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#3b82f6'), spaceAfter=10))
 
-            incident_types_data = {
-                'Theft': incidents_data['by_type'].get('theft', 0),
-                'Assault': incidents_data['by_type'].get('assault', 0),
-                'Harassment': incidents_data['by_type'].get('harassment', 0),
-                'Accident': incidents_data['by_type'].get('accident', 0),
-                'Suspicious': incidents_data['by_type'].get('suspicious_activity', 0),
-                'Vandalism': incidents_data['by_type'].get('vandalism', 0),
-                'Medical': incidents_data['by_type'].get('medical_emergency', 0),
-                'Fire': incidents_data['by_type'].get('fire', 0),
-                'Other': incidents_data['by_type'].get('other', 0)
-            }
             logger.info(f"PDF Service - incident_types_data: {incident_types_data}")
-            incident_types_chart = self._create_pie_chart(incident_types_data, 'Incidents by Type')
-            img = Image(incident_types_chart, width=5*inch, height=3.3*inch)
+            img = Image(charts['incident_types'], width=5*inch, height=3.3*inch)
             story.append(img)
             story.append(Spacer(1, 0.3*inch))
         else:
@@ -486,9 +742,9 @@ Format your response as clear, structured text with proper formatting:
             story.append(Paragraph("Daily Alert Timeline", self.styles['SectionHeader']))
             story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#3b82f6'), spaceAfter=10))
 
-            timeline_chart = self._create_timeline_chart(daily_data, 'Daily Alerts Trend')
+            timeline_chart = charts['timeline']
             if timeline_chart:
-                img = Image(timeline_chart, width=7*inch, height=3.5*inch)
+                img = Image(timeline_chart, width=7*inch, height=2.8*inch)
                 story.append(img)
 
         # Footer
@@ -551,7 +807,36 @@ Format your response as clear, structured text with proper formatting:
             'resolved_incidents': summary_data['resolved_incidents']
         }
 
-        insights_text = await self._generate_ai_insights(stats_for_ai)
+        pie_data = {
+            'SOS': summary_data['by_type']['sos'],
+            'Voice': summary_data['by_type']['voice_trigger'],
+            'AI': summary_data['by_type']['ai_analysis']
+        }
+
+        # Render charts in worker threads while the AI insights request is in flight
+        chart_jobs = {
+            'alert_types': asyncio.to_thread(self._create_pie_chart, pie_data, 'System-Wide Alert Types')
+        }
+        if 'incidents_by_type' in summary_data and summary_data['incidents_by_type']:
+            incident_types_data = {
+                'Theft': summary_data['incidents_by_type'].get('theft', 0),
+                'Assault': summary_data['incidents_by_type'].get('assault', 0),
+                'Harassment': summary_data['incidents_by_type'].get('harassment', 0),
+                'Accident': summary_data['incidents_by_type'].get('accident', 0),
+                'Suspicious': summary_data['incidents_by_type'].get('suspicious_activity', 0),
+                'Vandalism': summary_data['incidents_by_type'].get('vandalism', 0),
+                'Medical': summary_data['incidents_by_type'].get('medical_emergency', 0),
+                'Fire': summary_data['incidents_by_type'].get('fire', 0),
+                'Other': summary_data['incidents_by_type'].get('other', 0)
+            }
+            chart_jobs['incident_types'] = asyncio.to_thread(
+                self._create_pie_chart, incident_types_data, 'System-Wide Incidents by Type'
+            )
+
+        insights_text, *chart_buffers = await asyncio.gather(
+            self._generate_ai_insights(stats_for_ai), *chart_jobs.values()
+        )
+        charts = dict(zip(chart_jobs, chart_buffers))
         formatted_insights = self._format_markdown_to_pdf(insights_text)
         insights_para = Paragraph(formatted_insights, self.styles['Normal'])
         story.append(insights_para)
@@ -595,13 +880,7 @@ Format your response as clear, structured text with proper formatting:
         story.append(Paragraph("Alert Types Distribution", self.styles['SectionHeader']))
         story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#9333ea'), spaceAfter=10))
 
-        pie_data = {
-            'SOS': summary_data['by_type']['sos'],
-            'Voice': summary_data['by_type']['voice_trigger'],
-            'AI': summary_data['by_type']['ai_analysis']
-        }
-        pie_chart = self._create_pie_chart(pie_data, 'System-Wide Alert Types')
-        img = Image(pie_chart, width=5*inch, height=3.3*inch)
+        img = Image(charts['alert_types'], width=5*inch, height=3.3*inch)
         story.append(img)
         story.append(Spacer(1, 0.3*inch))
 
@@ -618,20 +897,8 @@ Format your response as clear, structured text with proper formatting:
             story.append(Paragraph("Incident Types Distribution", self.styles['SectionHeader']))
             story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor('#9333ea'), spaceAfter=10))
 
-            incident_types_data = {
-                'Theft': summary_data['incidents_by_type'].get('theft', 0),
-                'Assault': summary_data['incidents_by_type'].get('assault', 0),
-                'Harassment': summary_data['incidents_by_type'].get('harassment', 0),
-                'Accident': summary_data['incidents_by_type'].get('accident', 0),
-                'Suspicious': summary_data['incidents_by_type'].get('suspicious_activity', 0),
-                'Vandalism': summary_data['incidents_by_type'].get('vandalism', 0),
-                'Medical': summary_data['incidents_by_type'].get('medical_emergency', 0),
-                'Fire': summary_data['incidents_by_type'].get('fire', 0),
-                'Other': summary_data['incidents_by_type'].get('other', 0)
-            }
             logger.info(f"PDF Service ADMIN - incident_types_data: {incident_types_data}")
-            incident_types_chart = self._create_pie_chart(incident_types_data, 'System-Wide Incidents by Type')
-            img = Image(incident_types_chart, width=5*inch, height=3.3*inch)
+            img = Image(charts['incident_types'], width=5*inch, height=3.3*inch)
             story.append(img)
             story.append(Spacer(1, 0.3*inch))
         else:
@@ -686,6 +953,10 @@ Format your response as clear, structured text with proper formatting:
         buffer.seek(0)
         return buffer
 
+    async def cleanup(self):
+        """Cleanup service resources."""
+        await self.http_client.aclose()
+
 
 # Global service instance
 pdf_report_service = PDFReportService()
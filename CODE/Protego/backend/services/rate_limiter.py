@@ -0,0 +1,42 @@
+"""
+Token-bucket rate limiter for outbound messaging APIs.
+Smooths bursts of Twilio sends so a spike of geofence events stays under
+the provider's messages-per-second limits.
+"""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. A caller
+    that finds the bucket empty still takes its token (the balance goes
+    negative) and sleeps until it has been refilled, so waiters are released
+    in arrival order without a background refill task. Limits are per process.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        """Initialize a full bucket."""
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """
+        Wait until `tokens` are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume
+        """
+        # No await before the balance is updated, so this is atomic on the loop
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+        self._tokens -= tokens
+
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
@@ -13,8 +13,8 @@ from .conversation import ConversationPromptBuilder, ConversationContext
 from services.ai import (
     ProviderFactory,
     AIProviderType,
-    AudioConfig,
-    ConversationConfig
+    DEFAULT_AUDIO_CONFIG,
+    DEFAULT_CONVERSATION_CONFIG
 )
 from config import settings
 
@@ -72,18 +72,15 @@ class SafetyCallManager:
 
         system_instructions = ConversationPromptBuilder.build_safety_call_prompt(context)
 
-        provider = ProviderFactory.create_from_settings()
-
-        audio_config = AudioConfig()
-        conversation_config = ConversationConfig()
-
-        await provider.initialize(
-            system_instructions=system_instructions,
-            audio_config=audio_config,
-            conversation_config=conversation_config
-        )
+        # Provider is only needed to build connection details - release it right after
+        async with ProviderFactory.create_from_settings() as provider:
+            await provider.initialize(
+                system_instructions=system_instructions,
+                audio_config=DEFAULT_AUDIO_CONFIG,
+                conversation_config=DEFAULT_CONVERSATION_CONFIG
+            )
 
-        connection_details = await provider.get_connection_details()
+            connection_details = provider.get_connection_details()
 
         logger.info(f"Created safety call session {session_id} for user {user_id}")
 
@@ -0,0 +1,54 @@
+"""
+Pre-generated pool of URL-safe random tokens.
+Used for live tracking tokens on the duress path, where one os.urandom
+read is amortized over a whole batch instead of one syscall per alert.
+"""
+
+import base64
+import os
+import threading
+from collections import deque
+
+
+class TokenPool:
+    """
+    Hands out cryptographically random URL-safe tokens from a local batch.
+
+    Tokens have the same length and entropy as `secrets.token_urlsafe(nbytes)`.
+    The pool is tied to the process that filled it, so forked workers never
+    hand out the same tokens.
+    """
+
+    def __init__(self, size: int = 1024, nbytes: int = 32):
+        """Initialize an empty pool; it is filled on first use."""
+        self.size = size
+        self.nbytes = nbytes
+        self._tokens: deque = deque()
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Top up the pool from a single os.urandom read."""
+        if self._pid != os.getpid():
+            self._tokens.clear()
+            self._pid = os.getpid()
+
+        missing = self.size - len(self._tokens)
+        if missing <= 0:
+            return
+
+        block = os.urandom(self.nbytes * missing)
+        for offset in range(0, len(block), self.nbytes):
+            chunk = block[offset:offset + self.nbytes]
+            self._tokens.append(base64.urlsafe_b64encode(chunk).rstrip(b"=").decode("ascii"))
+
+    def get(self) -> str:
+        """Return a fresh token, refilling the pool when it runs low."""
+        with self._lock:
+            if self._pid != os.getpid() or len(self._tokens) < self.size // 2:
+                self._refill()
+            return self._tokens.popleft()
+
+
+# Global token pool instance
+token_pool = TokenPool()
@@ -7,6 +7,7 @@ from twilio.rest import Client
 from twilio.base.exceptions import TwilioRestException
 from typing import List, Dict, Optional
 import logging
+import httpx
 
 from config import settings
 
@@ -36,6 +37,13 @@ class TwilioService:
             self.client = None
             logger.info("Twilio service running in TEST MODE")
 
+        # Async HTTP client for the Twilio REST API (one keep-alive pool for all async sends)
+        self.http_client = httpx.AsyncClient(
+            base_url=f"https://api.twilio.com/2010-04-01/Accounts/{settings.twilio_account_sid}",
+            auth=(settings.twilio_account_sid, settings.twilio_auth_token),
+            timeout=15.0
+        )
+
     def send_sms(
         self,
         to: str,
@@ -132,6 +140,89 @@ class TwilioService:
             logger.error(f"Unexpected error sending WhatsApp to {to}: {e}")
             return {"success": False, "error": str(e)}
 
+    async def _post_message(
+        self,
+        to: str,
+        from_: str,
+        message: str,
+        channel: str,
+        recipient: str
+    ) -> Dict[str, any]:
+        """
+        Create a message through the Twilio REST API without blocking the event loop.
+
+        Args:
+            to: Twilio "To" address (phone number, optionally with whatsapp: prefix)
+            from_: Twilio "From" address
+            message: Message body
+            channel: Channel name used in logs ("SMS" or "WhatsApp")
+            recipient: Recipient phone number used in logs
+
+        Returns:
+            Dictionary with status and message_sid or error
+        """
+        try:
+            response = await self.http_client.post(
+                "/Messages.json",
+                data={"To": to, "From": from_, "Body": message}
+            )
+            payload = response.json()
+        except Exception as e:
+            logger.error(f"Unexpected error sending {channel} to {recipient}: {e}")
+            return {"success": False, "error": str(e)}
+
+        if response.is_error:
+            error = payload.get("message", response.text)
+            logger.error(f"Twilio error sending {channel} to {recipient}: {error}")
+            return {"success": False, "error": error}
+
+        logger.info(f"{channel} sent successfully to {recipient}. SID: {payload['sid']}")
+        return {
+            "success": True,
+            "message_sid": payload["sid"],
+            "test_mode": False
+        }
+
+    async def send_sms_async(
+        self,
+        to: str,
+        message: str
+    ) -> Dict[str, any]:
+        """
+        Async variant of `send_sms` for use on the event loop.
+
+        Args:
+            to: Recipient phone number (E.164 format, e.g., +1234567890)
+            message: Message body
+
+        Returns:
+            Dictionary with status and message_sid or error
+        """
+        if self.test_mode:
+            return self.send_sms(to, message)
+        return await self._post_message(to, settings.twilio_from, message, "SMS", to)
+
+    async def send_whatsapp_async(
+        self,
+        to: str,
+        message: str
+    ) -> Dict[str, any]:
+        """
+        Async variant of `send_whatsapp` for use on the event loop.
+
+        Args:
+            to: Recipient phone number (E.164 format, e.g., +1234567890)
+            message: Message body
+
+        Returns:
+            Dictionary with status and message_sid or error
+        """
+        if self.test_mode:
+            return self.send_whatsapp(to, message)
+        return await self._post_message(
+            f"whatsapp:{to}", f"whatsapp:{settings.twilio_from}", message, "WhatsApp", to
+        )
+
     def send_voice_call(
         self,
         to: str,
@@ -268,6 +359,10 @@ class TwilioService:
 
         return results
 
+    async def cleanup(self):
+        """Cleanup service resources."""
+        await self.http_client.aclose()
+
 
 # Global Twilio service instance
 twilio_service = TwilioService()
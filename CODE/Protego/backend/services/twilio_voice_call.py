@@ -27,12 +27,15 @@ from twilio.twiml.voice_response import VoiceResponse, Connect, Stream
 from twilio.base.exceptions import TwilioRestException
 
 from config import settings
-from services.ai import ProviderFactory, AudioConfig, ConversationConfig
+from services.ai import ProviderFactory, AudioConfig, DEFAULT_CONVERSATION_CONFIG
 from services.safety_call.conversation import ConversationPromptBuilder, ConversationContext
 from services.audio_codec import audio_codec
 
 logger = logging.getLogger(__name__)
 
+# Twilio Media Streams audio: 8kHz mono μ-law
+TWILIO_AUDIO_CONFIG = AudioConfig(sample_rate=8000, channels=1, format="mulaw")
+
 
 class TwilioVoiceCallSession:
     """
@@ -250,17 +253,10 @@ class TwilioVoiceCallService:
             provider = ProviderFactory.create_from_settings()
 
             # Initialize provider
-            audio_config = AudioConfig(
-                sample_rate=8000,  # Twilio uses 8kHz μ-law
-                channels=1,
-                format="mulaw"
-            )
-            conversation_config = ConversationConfig()
-
             await provider.initialize(
                 system_instructions=system_instructions,
-                audio_config=audio_config,
-                conversation_config=conversation_config
+                audio_config=TWILIO_AUDIO_CONFIG,
+                conversation_config=DEFAULT_CONVERSATION_CONFIG
             )
 
             # Register callbacks
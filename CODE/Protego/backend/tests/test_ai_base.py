@@ -0,0 +1,28 @@
+"""
+Tests for shared AI provider helpers.
+"""
+
+from services.ai.base import TranscriptDeduplicator
+
+
+def test_transcript_dedup_skips_immediate_repeat():
+    """Test that an identical transcript inside the window is a repeat."""
+    dedup = TranscriptDeduplicator(window_seconds=60)
+    assert not dedup.is_repeat("help me")
+    assert dedup.is_repeat("help me")
+    assert not dedup.is_repeat("help me please")
+
+
+def test_transcript_dedup_allows_repeat_after_window():
+    """Test that a transcript repeated after the window is processed again."""
+    dedup = TranscriptDeduplicator(window_seconds=0)
+    assert not dedup.is_repeat("help")
+    assert not dedup.is_repeat("help")
+
+
+def test_transcript_dedup_is_bounded():
+    """Test that old entries are evicted beyond max_entries."""
+    dedup = TranscriptDeduplicator(window_seconds=60, max_entries=2)
+    for text in ("a", "b", "c"):
+        dedup.is_repeat(text)
+    assert not dedup.is_repeat("a")
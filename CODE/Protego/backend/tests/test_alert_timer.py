@@ -0,0 +1,74 @@
+"""
+Tests for the shared alert countdown timer.
+"""
+
+import asyncio
+
+import pytest
+
+from services.alert_manager import AlertManager
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    """Alert manager whose expired countdowns are recorded instead of triggered."""
+    manager = AlertManager()
+    manager.fired = []
+
+    async def record(alert_id):
+        manager.fired.append(alert_id)
+
+    monkeypatch.setattr(manager, "_countdown_expired", record)
+    return manager
+
+
+def test_scheduled_alert_fires(manager):
+    """Test that an alert fires once its countdown runs out."""
+    async def scenario(manager):
+        manager._schedule_countdown(1, 0.05)
+        await asyncio.sleep(0.01)
+        assert manager.fired == []
+        await asyncio.sleep(0.1)
+        assert manager.fired == [1]
+        assert manager.pending_alerts == {}
+
+    asyncio.run(scenario(manager))
+
+
+def test_cancelled_alert_is_skipped(manager):
+    """Test that a heap entry whose alert was cancelled does not fire."""
+    async def scenario(manager):
+        manager._schedule_countdown(1, 0.05)
+        manager._schedule_countdown(2, 0.05)
+        manager.pending_alerts.pop(1)
+        await asyncio.sleep(0.1)
+        assert manager.fired == [2]
+        assert manager._heap == []
+
+    asyncio.run(scenario(manager))
+
+
+def test_earlier_deadline_wakes_timer(manager):
+    """Test that a later-scheduled, earlier deadline fires without waiting for the first."""
+    async def scenario(manager):
+        manager._schedule_countdown(1, 10)
+        await asyncio.sleep(0.01)
+        manager._schedule_countdown(2, 0.05)
+        await asyncio.sleep(0.1)
+        assert manager.fired == [2]
+        assert list(manager.pending_alerts) == [1]
+
+    asyncio.run(scenario(manager))
+
+
+@pytest.mark.parametrize("delay", [0, -30])
+def test_expired_recovery_delay_fires_next_pass(manager, delay):
+    """Test that recovered alerts already past their deadline fire right away."""
+    async def scenario(manager):
+        manager._schedule_countdown(1, 10)
+        await asyncio.sleep(0.01)
+        manager._schedule_countdown(2, delay)
+        await asyncio.sleep(0.01)
+        assert manager.fired == [2]
+
+    asyncio.run(scenario(manager))
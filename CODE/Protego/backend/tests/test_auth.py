@@ -0,0 +1,57 @@
+"""
+Tests for password verification helpers.
+"""
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import auth
+from auth import get_password_hash, verify_password_cached, invalidate_password_cache
+
+
+def test_verify_password_cached_reuses_success(monkeypatch):
+    """Test that a successful check is served from cache on retry."""
+    hashed = get_password_hash("secret")
+    assert verify_password_cached(1, "secret", hashed)
+
+    def fail_if_called(*args):
+        raise AssertionError("bcrypt should not run for a cached success")
+
+    monkeypatch.setattr(auth, "verify_password", fail_if_called)
+    assert verify_password_cached(1, "secret", hashed)
+
+
+def test_verify_password_cached_does_not_cache_failures(monkeypatch):
+    """Test that failed attempts always run bcrypt."""
+    hashed = get_password_hash("secret")
+    calls = []
+    real_verify = auth.verify_password
+
+    def counting_verify(plain, stored):
+        calls.append(plain)
+        return real_verify(plain, stored)
+
+    monkeypatch.setattr(auth, "verify_password", counting_verify)
+    assert not verify_password_cached(2, "wrong", hashed)
+    assert not verify_password_cached(2, "wrong", hashed)
+    assert len(calls) == 2
+
+
+def test_invalidate_password_cache():
+    """Test that invalidation forces the next check to hit bcrypt."""
+    hashed = get_password_hash("secret")
+    assert verify_password_cached(3, "secret", hashed)
+    invalidate_password_cache(3)
+    assert not any(key[0] == 3 for key in auth._verify_cache)
+
+
+def test_expired_entries_evicted_on_insert(monkeypatch):
+    """Test that a new success drops expired entries instead of keeping them around."""
+    hashed = get_password_hash("secret")
+    now = [1000.0]
+    monkeypatch.setattr(auth, "_verify_cache", OrderedDict())
+    monkeypatch.setattr(auth, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    assert verify_password_cached(4, "secret", hashed)
+    now[0] += auth._VERIFY_CACHE_TTL_SECONDS
+    assert verify_password_cached(5, "secret", hashed)
+    assert [key[0] for key in auth._verify_cache] == [5]
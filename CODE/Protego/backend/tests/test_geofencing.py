@@ -0,0 +1,211 @@
+"""
+Tests for geofence and walk notification deduplication.
+"""
+
+import asyncio
+import sys
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from services.cache import cache
+from services.geofencing_service import GeofencingService, SafeLocationEntry, UserSafeLocations
+from services.notification_debouncer import PendingNotifications, notification_debouncer
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic and wall clock for the geofencing module."""
+    now = [1000.0]
+    module = sys.modules["services.geofencing_service"]
+    monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=lambda: now[0], time=lambda: now[0]))
+    monkeypatch.setattr(cache, "enabled", False)
+    return now
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis client calls the geofencing service makes."""
+
+    def __init__(self, clock=None):
+        self.clock = clock or [0.0]
+        self.data = {}
+
+    def get(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and self.clock[0] >= expires_at:
+            del self.data[key]
+            return None
+        return value
+
+    def ttl(self, key):
+        if self.get(key) is None:
+            return -2
+        return round(self.data[key][1] - self.clock[0])
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and self.get(key) is not None:
+            return None
+        self.data[key] = (value, self.clock[0] + ex if ex else None)
+        return True
+
+    def eval(self, script, numkeys, key, direction, cooldown, flap_window):
+        """Same steps as LAST_EVENT_SCRIPT, the only script the service runs."""
+        last = self.get(key)
+        if last is not None and (last == direction or cooldown - self.ttl(key) < flap_window):
+            return 0
+        self.set(key, direction, ex=cooldown)
+        return 1
+
+
+def _home_locations() -> UserSafeLocations:
+    """A single 100m safe location."""
+    home = SafeLocationEntry(7, "Home", 12.97, 77.59, 100, True, True, "")
+    lat_rad = np.radians([home.latitude])
+    return UserSafeLocations(
+        entries=[home],
+        lat_rad=lat_rad,
+        lon_rad=np.radians([home.longitude]),
+        cos_lat=np.cos(lat_rad),
+        radius_m=np.array([100.0]),
+        has_auto_start=True
+    )
+
+
+def _north_of_home(meters: float) -> float:
+    """Latitude `meters` north of the test safe location."""
+    return 12.97 + meters / 111195
+
+
+def test_coarse_fix_does_not_enter_safe_location():
+    """Test that a fix whose accuracy circle spills outside never counts as inside."""
+    service = GeofencingService()
+    locations = _home_locations()
+    assert service._find_containing_location(locations, _north_of_home(30), 77.59, 3000) is None
+    assert service._find_containing_location(locations, _north_of_home(30), 77.59, 10).id == 7
+
+
+def test_uncertain_fix_keeps_current_location():
+    """Test that leaving requires the fix to be certainly outside."""
+    service = GeofencingService()
+    locations = _home_locations()
+    find = service._find_containing_location
+    assert find(locations, _north_of_home(30), 77.59, 3000, current_location_id=7).id == 7
+    assert find(locations, _north_of_home(120), 77.59, 50, current_location_id=7).id == 7
+    assert find(locations, _north_of_home(120), 77.59, 50) is None
+    assert find(locations, _north_of_home(500), 77.59, 50, current_location_id=7) is None
+
+
+def test_first_observation_must_dwell(clock):
+    """Test that a user's first observation is not settled until it has held."""
+    service = GeofencingService()
+    locations = _home_locations()
+    home = locations.entries[0]
+
+    state, reported, settled = service._debounce_location(None, home, locations)
+    assert reported == home and not settled
+    clock[0] += service._dwell_seconds
+    state, reported, settled = service._debounce_location(state, home, locations)
+    assert reported == home and settled
+    assert state.last_location_id == 7
+
+
+def test_geofence_state_shared_between_workers(clock, monkeypatch):
+    """Test that a worker which never saw the user still applies the dwell."""
+    monkeypatch.setattr(cache, "enabled", True)
+    monkeypatch.setattr(cache, "redis_client", FakeRedis())
+    locations = _home_locations()
+    home = locations.entries[0]
+    first, second = GeofencingService(), GeofencingService()
+
+    state, _, _ = first._debounce_location(None, home, locations)
+    clock[0] += first._dwell_seconds
+    state, _, settled = first._debounce_location(state, home, locations)
+    first._save_geofence_state(1, state)
+    assert settled
+
+    # A jittery "outside" ping routed to the other worker must dwell too
+    state, reported, settled = second._debounce_location(
+        second._load_geofence_state(1), None, locations
+    )
+    assert reported == home and not settled
+    assert not second._geofence_states
+
+
+def test_enter_exit_flap_notifies_once(clock):
+    """Test that an inside/outside/inside sequence within 60s sends one notification."""
+    service = GeofencingService()
+    sent = []
+    for offset, direction in ((0, "entered"), (20, "left"), (40, "entered")):
+        clock[0] = 1000.0 + offset
+        sent.append(service._should_send_geofence_notification(1, 7, direction))
+    assert sent == [True, False, False]
+
+
+def test_opposite_direction_allowed_after_flap_window(clock):
+    """Test that leaving is notified once the flap window has passed."""
+    service = GeofencingService()
+    assert service._should_send_geofence_notification(1, 7, "entered")
+    clock[0] += service._flap_window
+    assert service._should_send_geofence_notification(1, 7, "left")
+    assert not service._should_send_geofence_notification(1, 7, "left")
+    assert service._should_send_geofence_notification(1, 8, "entered")
+
+
+def test_flap_dedup_shared_through_redis(clock, monkeypatch):
+    """Test that the Redis branch suppresses a flap seen by two workers."""
+    monkeypatch.setattr(cache, "enabled", True)
+    monkeypatch.setattr(cache, "redis_client", FakeRedis(clock))
+    first, second = GeofencingService(), GeofencingService()
+
+    assert first._should_send_geofence_notification(1, 7, "entered")
+    clock[0] += 20
+    assert not second._should_send_geofence_notification(1, 7, "left")
+    assert not second._should_send_geofence_notification(1, 7, "entered")
+    clock[0] += first._flap_window
+    assert second._should_send_geofence_notification(1, 7, "left")
+    assert not first._should_send_geofence_notification(1, 7, "left")
+    assert not first._geofence_events and not second._geofence_events
+
+
+def test_walk_cooldown_only_holds_back_repeated_state(clock):
+    """Test that a walk toggle always reaches contacts with its final state."""
+    service = GeofencingService()
+    assert service._should_send_walk_notification(1, "walk_started_manual")
+    clock[0] += 60
+    assert service._should_send_walk_notification(1, "walk_stopped_manual")
+    clock[0] += 60
+    assert service._should_send_walk_notification(1, "walk_started_manual")
+    assert not service._should_send_walk_notification(1, "walk_started_manual")
+
+
+def test_debounced_toggle_sends_final_state(clock, monkeypatch):
+    """Test that a start/stop/start burst is sent, ending on 'started', even right after a start."""
+    service = sys.modules["services.geofencing_service"].geofencing_service
+    monkeypatch.setattr(service, "_geofence_events", OrderedDict())
+    assert service._should_send_walk_notification(1, "walk_started_manual")
+
+    sent = []
+
+    async def fake_send(self, user, message):
+        sent.append(message)
+
+    monkeypatch.setattr(notification_debouncer, "_load_user", lambda user_id: object())
+    monkeypatch.setattr(GeofencingService, "_send_whatsapp_to_contacts", fake_send)
+    pending = PendingNotifications(
+        user_name="A",
+        messages=["started", "stopped", "started"],
+        summaries=["Started", "Stopped", "Started"],
+        event_types=["walk_started_manual", "walk_stopped_manual", "walk_started_manual"]
+    )
+    asyncio.run(notification_debouncer._flush(1, pending))
+    assert len(sent) == 1 and sent[0].endswith("• Started")
+
+    # A lone repeat of the state contacts were just told is held back
+    repeat = PendingNotifications(
+        user_name="A", messages=["started"], summaries=["Started"],
+        event_types=["walk_started_manual"]
+    )
+    asyncio.run(notification_debouncer._flush(1, repeat))
+    assert len(sent) == 1